@@ -1,35 +1,102 @@
 import os
 import re
-import fitz  # PyMuPDF
-from typing import Dict, List, Any, Optional
+import hashlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, List, Any, Optional, Set, Tuple
+from utils.archive_reader import MEMBER_SEPARATOR, is_archive, open_archive, split_member
+from utils.keyword_scanner import get_tech_scanner
+from utils.parser import SectionSegmenter
+from utils.pdf_reader import PDFTextExtractor
+
+NAME_PATTERN = re.compile(r'^([A-Z][a-z]+(?: [A-Z][a-z]+)+)')
+EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_PATTERN = re.compile(r'(?:\+\d{1,3}[-.\s]?)?(?:\d{3}[-.\s]?)?\d{3}[-.\s]?\d{4}')
+
+# Bump when parse_resume's output changes so cached parses are not reused
+PARSER_VERSION = 1
 
 class CVExtractorAgent:
     """Agent to extract structured data from PDF resumes"""
     
-    def __init__(self, resumes_dir: str = "resumes"):
+    def __init__(self, resumes_dir: str = "resumes", max_workers: int = 1, chunksize: int = 4,
+                 max_pages: Optional[int] = 20, max_bytes: Optional[int] = 20 * 1024 * 1024,
+                 extraction_timeout: Optional[float] = 30.0, use_mmap: bool = False, parse_cache=None):
         """Initialize CV Extractor Agent
         
         Args:
-            resumes_dir: Directory containing resume PDFs
+            resumes_dir: Directory containing resume PDFs and/or zip/tar
+                archives of them, or a single archive
+            max_workers: Number of worker processes for process_all_resumes
+                (1 processes resumes sequentially, None uses every CPU)
+            chunksize: Number of resumes handed to a worker at a time
+            max_pages: Pages read per resume before the text is truncated
+            max_bytes: Largest PDF file size that is opened at all
+            extraction_timeout: Seconds of text extraction per resume
+            use_mmap: Read PDFs through a memory map instead of loading them
+            parse_cache: Optional MemoryDB whose parsed-CV cache is consulted,
+                by PDF content hash, before a resume is extracted and parsed
         """
         self.resumes_dir = resumes_dir
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self.segmenter = SectionSegmenter()
+        self.pdf_extractor = PDFTextExtractor(max_pages=max_pages, max_bytes=max_bytes,
+                                              timeout=extraction_timeout, use_mmap=use_mmap)
+        self.parse_cache = parse_cache
+    
+    @property
+    def source_dir(self) -> str:
+        """Directory resume identifiers are relative to"""
+        if is_archive(self.resumes_dir) and os.path.isfile(self.resumes_dir):
+            return os.path.dirname(self.resumes_dir)
+        return self.resumes_dir
     
     def get_resume_files(self) -> List[str]:
         """Get list of PDF files in the resumes directory
         
+        PDFs inside zip/tar archives are listed as "archive::member", read
+        straight from the archive without unpacking it.
+        
         Returns:
             List of PDF filenames
         """
         resume_files = []
-        try:
-            for file in os.listdir(self.resumes_dir):
-                if file.lower().endswith('.pdf'):
-                    resume_files.append(file)
-        except Exception as e:
-            print(f"Error listing resume files: {str(e)}")
+        archives = []
+        if self.source_dir != self.resumes_dir:
+            archives.append(os.path.basename(self.resumes_dir))
+        else:
+            try:
+                for file in os.listdir(self.resumes_dir):
+                    if file.lower().endswith('.pdf'):
+                        resume_files.append(file)
+                    elif is_archive(file):
+                        archives.append(file)
+            except Exception as e:
+                print(f"Error listing resume files: {str(e)}")
+        
+        for archive in archives:
+            resume_files.extend(self.get_archive_members(archive))
         
         return resume_files
     
+    def get_archive_members(self, archive_name: str) -> List[str]:
+        """List the PDFs inside an archive as resume identifiers
+        
+        Args:
+            archive_name: Archive path relative to source_dir
+            
+        Returns:
+            List of "archive::member" identifiers
+        """
+        try:
+            members = open_archive(os.path.join(self.source_dir, archive_name)).pdf_members()
+        except Exception as e:
+            print(f"Error reading resume archive {archive_name}: {str(e)}")
+            return []
+        return [f"{archive_name}{MEMBER_SEPARATOR}{member}" for member in members]
+    
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text content from PDF
         
@@ -39,62 +106,125 @@ class CVExtractorAgent:
         Returns:
             Extracted text from the PDF
         """
-        text = ""
+        return self.extract_pdf(pdf_path)['text']
+    
+    def extract_pdf(self, pdf_path: str, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """Extract text content from PDF within the page, size and time budgets
+        
+        Args:
+            pdf_path: Path to the PDF file
+            max_pages: Page budget for this call (defaults to the agent's)
+            
+        Returns:
+            Dictionary with 'text', 'pages_read', 'page_count', 'truncated'
+            and 'truncation_reason'
+        """
         try:
-            doc = fitz.open(pdf_path)
-            for page in doc:
-                text += page.get_text()
-            doc.close()
+            extraction = self.pdf_extractor.extract(pdf_path, max_pages)
         except Exception as e:
             print(f"Error extracting text from PDF {pdf_path}: {str(e)}")
+            return PDFTextExtractor.empty_result()
         
-        return text
+        # A first-page fast pass truncates by design, so only report full reads
+        if extraction['truncated'] and max_pages is None and extraction['truncation_reason'] != 'max_bytes':
+            print(f"Truncated PDF {pdf_path} ({extraction['truncation_reason']}): "
+                  f"read {extraction['pages_read']} of {extraction['page_count']} pages")
+        return extraction
     
-    def parse_resume(self, resume_text: str) -> Dict[str, Any]:
-        """Parse resume text into structured data
+    def extract_resume(self, filename: str, data: Optional[bytes] = None, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """Extract text from a resume file or archive member
         
         Args:
-            resume_text: Text content of the resume
+            filename: Resume identifier from get_resume_files
+            data: PDF bytes if already read
+            max_pages: Page budget for this call (defaults to the agent's)
             
         Returns:
-            Dictionary with structured data extracted from resume
+            Dictionary with 'text', 'pages_read', 'page_count', 'truncated'
+            and 'truncation_reason'
+        """
+        if data is None and split_member(filename)[0] is None:
+            return self.extract_pdf(os.path.join(self.source_dir, filename), max_pages)
+        
+        try:
+            if data is None:
+                data = self.read_resume(filename)
+                if data is None:
+                    print(f"Skipping resume {filename}: larger than the {self.pdf_extractor.max_bytes} byte limit")
+                    return PDFTextExtractor.empty_result(truncated=True, reason='max_bytes')
+            return self.pdf_extractor.extract_stream(data, max_pages)
+        except Exception as e:
+            print(f"Error extracting text from resume {filename}: {str(e)}")
+            return PDFTextExtractor.empty_result()
+    
+    def read_resume(self, filename: str) -> Optional[bytes]:
+        """Read a resume file or archive member into memory
+        
+        Args:
+            filename: Resume identifier from get_resume_files
+            
+        Returns:
+            PDF bytes, or None if the PDF is larger than max_bytes
+        """
+        max_bytes = self.pdf_extractor.max_bytes
+        archive_name, member = split_member(filename)
+        
+        if archive_name is None:
+            path = os.path.join(self.source_dir, filename)
+            if max_bytes is not None and os.path.getsize(path) > max_bytes:
+                return None
+            with open(path, 'rb') as file:
+                return file.read()
+        
+        archive = open_archive(os.path.join(self.source_dir, archive_name))
+        if max_bytes is not None and archive.member_info(member)['size'] > max_bytes:
+            return None
+        return archive.read(member)
+    
+    def extract_contact_info(self, resume_text: str) -> Dict[str, str]:
+        """Extract name, email and phone number from resume text
+        
+        Args:
+            resume_text: Text content of the resume (the first page is enough)
+            
+        Returns:
+            Dictionary with 'name', 'email' and 'phone'
         """
         # Extract name (usually at the beginning of the resume)
-        name_match = re.search(r'^([A-Z][a-z]+(?: [A-Z][a-z]+)+)', resume_text)
+        name_match = NAME_PATTERN.search(resume_text)
         name = name_match.group(1) if name_match else "Unknown"
         
         # Extract email
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', resume_text)
+        email_match = EMAIL_PATTERN.search(resume_text)
         email = email_match.group(0) if email_match else ""
         
         # Extract phone number
-        phone_pattern = r'(?:\+\d{1,3}[-.\s]?)?(?:\d{3}[-.\s]?)?\d{3}[-.\s]?\d{4}'
-        phone_match = re.search(phone_pattern, resume_text)
+        phone_match = PHONE_PATTERN.search(resume_text)
         phone = phone_match.group(0) if phone_match else ""
         
-        # Extract education
-        education_section = self._extract_section(resume_text, 
-            ['education', 'academic background', 'academic qualification'], 
-            ['experience', 'skills', 'projects'])
+        return {'name': name, 'email': email, 'phone': phone}
+    
+    def parse_resume(self, resume_text: str) -> Dict[str, Any]:
+        """Parse resume text into structured data
         
-        # Extract work experience
-        experience_section = self._extract_section(resume_text, 
-            ['experience', 'work history', 'professional experience', 'employment'], 
-            ['education', 'skills', 'projects', 'certification'])
+        Args:
+            resume_text: Text content of the resume
+            
+        Returns:
+            Dictionary with structured data extracted from resume
+        """
+        contact = self.extract_contact_info(resume_text)
         
-        # Extract skills
-        skills_section = self._extract_section(resume_text, 
-            ['skills', 'technical skills', 'core competencies'], 
-            ['experience', 'education', 'projects', 'certification'])
+        # Split into sections in a single pass over the lines
+        sections = self.segmenter.extract(resume_text)
+        education_section = sections.get('education', '')
+        experience_section = sections.get('experience', '')
+        skills_section = sections.get('skills', '')
+        cert_section = sections.get('certifications', '')
         
         # Parse individual skills
         skills = self._extract_skills(skills_section)
         
-        # Extract certifications
-        cert_section = self._extract_section(resume_text, 
-            ['certifications', 'certificates', 'professional certifications'], 
-            ['experience', 'education', 'skills', 'projects'])
-        
         # Parse individual certifications
         certifications = self._extract_certifications(cert_section)
         
@@ -102,9 +232,9 @@ class CVExtractorAgent:
         tech_stack = self._extract_tech_stack(resume_text)
         
         return {
-            'name': name,
-            'email': email,
-            'phone': phone,
+            'name': contact['name'],
+            'email': contact['email'],
+            'phone': contact['phone'],
             'education': education_section,
             'work_experience': experience_section,
             'skills': ", ".join(skills) if skills else "",
@@ -113,32 +243,6 @@ class CVExtractorAgent:
             'raw_text': resume_text
         }
     
-    def _extract_section(self, text: str, section_headers: List[str], next_section_headers: List[str]) -> str:
-        """Extract text for a specific section from resume
-        
-        Args:
-            text: Full resume text
-            section_headers: Possible headers for the target section
-            next_section_headers: Possible headers for the next sections
-            
-        Returns:
-            Extracted section text
-        """
-        # Create regex patterns
-        section_pattern = '|'.join([rf'(?:{header})' for header in section_headers])
-        next_section_pattern = '|'.join([rf'(?:{header})' for header in next_section_headers])
-        
-        # Try to find section with various formatting
-        for pattern in [
-            rf'(?i)({section_pattern})[:\s]*\n+(.*?)(?:\n+(?:{next_section_pattern})[:\s]*|$)',
-            rf'(?i)({section_pattern})[:\s]*(.*?)(?:(?:{next_section_pattern})[:\s]*|$)'
-        ]:
-            match = re.search(pattern, text, re.DOTALL)
-            if match:
-                return match.group(2).strip()
-        
-        return ""
-    
     def _extract_skills(self, skills_section: str) -> List[str]:
         """Extract individual skills from skills section
         
@@ -213,83 +317,442 @@ class CVExtractorAgent:
         Returns:
             List of technologies
         """
-        # Common programming languages and technologies
-        tech_keywords = [
-            # Programming languages
-            'Python', 'Java', 'JavaScript', 'C\\+\\+', 'C#', 'Ruby', 'PHP', 'Go', 'Swift', 'Kotlin',
-            'TypeScript', 'Scala', 'Rust', 'Perl', 'R', 'MATLAB',
+        # Single pass over the text with the shared precompiled scanner
+        return get_tech_scanner().find_all(text)
+    
+    def process_resume(self, filename: str, data: Optional[bytes] = None) -> Dict[str, Any]:
+        """Process a single resume file
+        
+        With a parse_cache, the PDF's content hash is looked up first and a
+        hit returns the stored cv_data record (with its 'id') without
+        running PyMuPDF or the parser.
+        
+        Args:
+            filename: Name of the resume PDF file, or "archive::member"
+            data: PDF bytes if already read from an archive; their hash is
+                recorded as 'content_hash'
             
-            # Web technologies
-            'HTML', 'CSS', 'React', 'Angular', 'Vue', 'Node\\.js', 'Express', 'Django', 'Flask',
-            'Spring', 'Laravel', 'Ruby on Rails', 'jQuery', 'Bootstrap', 'Tailwind',
+        Returns:
+            Dictionary with structured data extracted from the resume
+        """
+        try:
+            if data is None and self.parse_cache is not None:
+                data = self.read_resume(filename)
             
-            # Databases
-            'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Oracle', 'SQLite', 'Redis', 'Cassandra',
-            'DynamoDB', 'Elasticsearch', 'Firebase',
+            content_hash = hashlib.sha256(data).hexdigest() if data is not None else None
+            if content_hash and self.parse_cache is not None:
+                cached = self.parse_cache.get_cached_cv(content_hash, PARSER_VERSION)
+                if cached:
+                    print(f"Reusing parsed resume: {filename} (same content as {cached['filename']})")
+                    cached['filename'] = filename
+                    cached['truncated'] = bool(cached.get('truncated'))
+                    cached['content_hash'] = content_hash
+                    return cached
             
-            # Cloud platforms
-            'AWS', 'Azure', 'GCP', 'Google Cloud', 'Heroku', 'Netlify', 'Vercel',
+            print(f"Processing resume: {filename}")
+            extraction = self.extract_resume(filename, data)
+            parsed_data = self.parse_resume(extraction['text'])
+            parsed_data['filename'] = filename
+            parsed_data['truncated'] = extraction['truncated']
+            if content_hash:
+                parsed_data['content_hash'] = content_hash
+            return parsed_data
+        except Exception as e:
+            print(f"Error processing resume {filename}: {str(e)}")
+            return self._error_record(filename)
+    
+    def _error_record(self, filename: str) -> Dict[str, Any]:
+        """Placeholder record for a resume that could not be processed"""
+        return {
+            'filename': filename,
+            'name': 'Error',
+            'email': '',
+            'phone': '',
+            'education': '',
+            'work_experience': '',
+            'skills': '',
+            'certifications': '',
+            'tech_stack': '',
+            'raw_text': '',
+            'truncated': False
+        }
+    
+    def process_resume_contacts(self, filename: str, data: Optional[bytes] = None) -> Dict[str, Any]:
+        """Fast pass over a resume: contact details from the first page only
+        
+        Args:
+            filename: Name of the resume PDF file, or "archive::member"
+            data: PDF bytes if already read from an archive
             
-            # DevOps
-            'Docker', 'Kubernetes', 'Jenkins', 'Git', 'GitHub', 'GitLab', 'Terraform', 'Ansible',
-            'CI/CD', 'Continuous Integration', 'Continuous Deployment',
+        Returns:
+            Dictionary shaped like process_resume's, with name, email and
+            phone filled in, every other field empty and 'partial' set
+        """
+        record = self._error_record(filename)
+        record['partial'] = True
+        
+        try:
+            extraction = self.extract_resume(filename, data, max_pages=1)
+            record.update(self.extract_contact_info(extraction['text']))
+        except Exception as e:
+            print(f"Error reading contact details from resume {filename}: {str(e)}")
+        
+        return record
+    
+    def process_resumes_two_tier(self, resume_files: List[str],
+                                 on_complete: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+                                 ) -> Tuple[List[Dict[str, Any]], Future]:
+        """Contact details now, full parsing in the background
+        
+        The fast pass reads only the first page of every resume, which is
+        enough for the candidate list and for deduplicating by email or
+        phone. Full section and skill parsing runs on a background thread
+        (itself using max_workers processes) and replaces the partial
+        records when it finishes. Archive members are read in this process
+        and handed to the workers as bytes, as in process_resumes.
+
+        Args:
+            resume_files: Resume filenames
+            on_complete: Optional callback receiving the fully parsed
+                records, called from the background thread
             
-            # AI/ML
-            'TensorFlow', 'PyTorch', 'Keras', 'scikit-learn', 'Pandas', 'NumPy', 'SciPy',
-            'Machine Learning', 'Deep Learning', 'NLP', 'Computer Vision'
-        ]
+        Returns:
+            Tuple of (partial records in input order, future resolving to
+            the fully parsed records in input order)
+        """
+        contacts = self.process_resumes(resume_files, self.process_resume_contacts)
         
-        tech_pattern = '|'.join([rf'\b{tech}\b' for tech in tech_keywords])
-        tech_matches = re.findall(tech_pattern, text, re.IGNORECASE)
+        def full_pass() -> List[Dict[str, Any]]:
+            parsed_resumes = self.process_resumes(resume_files)
+            if on_complete is not None:
+                on_complete(parsed_resumes)
+            return parsed_resumes
         
-        # Deduplicate and normalize
-        tech_stack = list(set([match.strip() for match in tech_matches]))
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='resume-full-pass')
+        future = executor.submit(full_pass)
+        # Let the worker thread exit once the full pass is done
+        executor.shutdown(wait=False)
         
-        return tech_stack
+        return contacts, future
     
-    def process_resume(self, filename: str) -> Dict[str, Any]:
-        """Process a single resume file
+    def process_all_resumes(self) -> List[Dict[str, Any]]:
+        """Process all resume files in the directory
+        
+        Resumes are processed in filename order, in parallel across
+        max_workers processes when it is greater than 1.
+        
+        Returns:
+            List of dictionaries with parsed resume data
+        """
+        return self.process_resumes(sorted(self.get_resume_files()))
+    
+    def process_resumes(self, resume_files: List[str], worker: Optional[Callable[..., Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Process the given resume files, in parallel if max_workers > 1
+        
+        Archive members are streamed from each archive in a single pass and
+        handed to the workers as bytes.
         
         Args:
-            filename: Name of the resume PDF file
+            resume_files: Resume filenames
+            worker: Per-resume method taking (filename, data=None) (defaults
+                to process_resume)
             
         Returns:
-            Dictionary with structured data extracted from the resume
+            List of dictionaries with parsed resume data, in input order
         """
-        pdf_path = os.path.join(self.resumes_dir, filename)
+        plain_files = []
+        archive_members = {}
+        for filename in resume_files:
+            archive_name, member = split_member(filename)
+            if archive_name is None:
+                plain_files.append(filename)
+            else:
+                archive_members.setdefault(archive_name, []).append(member)
+        
+        if not archive_members:
+            return self._process_files(resume_files, worker)
+        
+        records = dict(zip(plain_files, self._process_files(plain_files, worker)))
+        for archive_name, members in archive_members.items():
+            for parsed_resume in self._process_archive(archive_name, members, worker):
+                records[parsed_resume['filename']] = parsed_resume
         
+        return [records[filename] for filename in resume_files]
+    
+    def _process_files(self, resume_files: List[str], worker: Optional[Callable[..., Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Process resume files on disk, preserving input order"""
+        worker = worker or self.process_resume
+        if self.max_workers == 1 or len(resume_files) <= 1:
+            return [worker(filename) for filename in resume_files]
+        
+        return self._process_parallel(resume_files, worker)
+    
+    def _process_archive(self, archive_name: str, members: List[str], worker: Optional[Callable[..., Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Process PDF members of one archive in a single streaming pass
+        
+        Args:
+            archive_name: Archive path relative to source_dir
+            members: Member names to process
+            worker: Per-resume method (defaults to process_resume)
+            
+        Returns:
+            List of dictionaries with parsed resume data, in archive order
+        """
         try:
-            print(f"Processing resume: {filename}")
-            text = self.extract_text_from_pdf(pdf_path)
-            parsed_data = self.parse_resume(text)
-            parsed_data['filename'] = filename
-            return parsed_data
+            archive = open_archive(os.path.join(self.source_dir, archive_name))
+            stream = ((f"{archive_name}{MEMBER_SEPARATOR}{member}", data)
+                      for member, data in archive.iter_pdfs(members, self.pdf_extractor.max_bytes))
+            
+            worker = worker or self.process_resume
+            if self.max_workers == 1 or len(members) <= 1:
+                return [worker(filename, data) for filename, data in stream]
+            return self._process_stream(stream, worker)
         except Exception as e:
-            print(f"Error processing resume {filename}: {str(e)}")
-            return {
-                'filename': filename,
-                'name': 'Error',
-                'email': '',
-                'phone': '',
-                'education': '',
-                'work_experience': '',
-                'skills': '',
-                'certifications': '',
-                'tech_stack': '',
-                'raw_text': ''
-            }
+            # Unreadable archive; record every requested member as an error
+            print(f"Error reading resume archive {archive_name}: {str(e)}")
+            return [self._error_record(f"{archive_name}{MEMBER_SEPARATOR}{member}") for member in members]
     
-    def process_all_resumes(self) -> List[Dict[str, Any]]:
-        """Process all resume files in the directory
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """SHA-256 of a file's contents
+        
+        Args:
+            path: File path
+            
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def hash_resume(self, filename: str) -> str:
+        """SHA-256 of a resume file or archive member
+        
+        Args:
+            filename: Resume identifier from get_resume_files
+            
+        Returns:
+            Hex digest
+        """
+        archive_name, member = split_member(filename)
+        if archive_name is None:
+            return self.hash_file(os.path.join(self.source_dir, filename))
+        archive = open_archive(os.path.join(self.source_dir, archive_name))
+        return hashlib.sha256(archive.read(member)).hexdigest()
+    
+    def _resume_state(self, filename: str) -> Tuple[str, int, float]:
+        """Manifest path, size and mtime of a resume file or archive member"""
+        archive_name, member = split_member(filename)
+        if archive_name is None:
+            path = os.path.abspath(os.path.join(self.source_dir, filename))
+            stat = os.stat(path)
+            return path, stat.st_size, stat.st_mtime
+        
+        archive_path = os.path.abspath(os.path.join(self.source_dir, archive_name))
+        info = open_archive(archive_path).member_info(member)
+        return f"{archive_path}{MEMBER_SEPARATOR}{member}", info['size'], info['mtime']
+    
+    def _in_scope(self, manifest_path: str) -> bool:
+        """Whether a manifest path belongs to this agent's resumes_dir"""
+        archive_path, _ = split_member(manifest_path)
+        if self.source_dir != self.resumes_dir:
+            return archive_path == os.path.abspath(self.resumes_dir)
+        return os.path.dirname(archive_path or manifest_path) == os.path.abspath(self.resumes_dir)
+    
+    def ingest_resumes(self, db, force: bool = False,
+                       on_contacts: Optional[Callable[[List[Dict[str, Any]]], None]] = None) -> List[Dict[str, Any]]:
+        """Incrementally ingest the resumes directory into the database
+        
+        Uses the resume manifest in MemoryDB: a PDF is parsed and inserted
+        into cv_data only if it is new or its content changed. Unchanged PDFs
+        (same size and mtime, or same content hash) reuse their stored
+        record, and PDFs no longer on disk are marked as removed. Members of
+        zip/tar archives are tracked the same way, one manifest entry each.
+        
+        Args:
+            db: MemoryDB instance
+            force: Re-extract every PDF regardless of the manifest
+            on_contacts: If given, new or changed PDFs go through
+                process_resumes_two_tier and this is called with their
+                first-page contact records before full parsing finishes
+            
+        Returns:
+            List of parsed resume data for every PDF on disk, in filename
+            order, each with its cv_data 'id'
+        """
+        manifest = db.get_resume_manifest()
+        resume_files = sorted(self.get_resume_files())
+        records, _, current_paths = self._ingest(db, manifest, resume_files, force, on_contacts)
+        
+        # Anything in the manifest for this directory that is no longer on disk
+        removed = [path for path, entry in manifest.items()
+                   if entry['status'] == 'active' and self._in_scope(path) and path not in current_paths]
+        if removed:
+            db.mark_manifest_removed(removed)
+            print(f"Resume ingestion: {len(removed)} removed")
+        
+        return [records[filename] for filename in resume_files]
+    
+    def ingest_files(self, db, resume_files: List[str], force: bool = False,
+                     on_contacts: Optional[Callable[[List[Dict[str, Any]]], None]] = None) -> List[Dict[str, Any]]:
+        """Incrementally ingest specific resumes, e.g. ones that just arrived
+        
+        Args:
+            db: MemoryDB instance
+            resume_files: Resume identifiers from get_resume_files
+            force: Re-extract the PDFs regardless of the manifest
+            on_contacts: Called with first-page contact records of the new
+                or changed PDFs before full parsing finishes
+            
+        Returns:
+            Parsed resume data, each with its cv_data 'id', for the resumes
+            that were new or changed; unchanged ones are left out
+        """
+        records, processed, _ = self._ingest(db, db.get_resume_manifest(), resume_files, force, on_contacts)
+        return [records[filename] for filename in processed]
+    
+    def _ingest(self, db, manifest: Dict[str, Dict], resume_files: List[str], force: bool,
+                on_contacts: Optional[Callable[[List[Dict[str, Any]]], None]] = None) -> Tuple[Dict[str, Dict[str, Any]], List[str], Set[str]]:
+        """Parse and store new or changed resumes, reusing stored records for the rest
         
+        Returns:
+            Tuple of (records keyed by filename, filenames that were
+            processed, manifest paths of every given resume)
+        """
+        records = {}
+        to_process = []
+        file_states = {}
+        current_paths = set()
+        
+        for filename in resume_files:
+            path, size, mtime = self._resume_state(filename)
+            current_paths.add(path)
+            entry = manifest.get(path)
+            
+            content_hash = None
+            if entry and not force:
+                unchanged = entry['size'] == size and entry['mtime'] == mtime
+                if not unchanged:
+                    # Touched but possibly identical (e.g. re-copied), so compare contents
+                    content_hash = self.hash_resume(filename)
+                    unchanged = content_hash == entry['content_hash']
+                
+                stored = db.get_cv_data(entry['cv_id']) if unchanged else None
+                if stored:
+                    # The row may be shared with copies of this PDF under other names
+                    stored = dict(stored, filename=filename, content_hash=entry['content_hash'])
+                    records[filename] = stored
+                    if content_hash is not None or entry['status'] != 'active':
+                        db.upsert_manifest_entry(path, size, mtime, entry['content_hash'], entry['cv_id'])
+                    continue
+            
+            file_states[filename] = (path, size, mtime, content_hash)
+            to_process.append(filename)
+        
+        print(f"Resume ingestion: {len(to_process)} new or changed, {len(records)} unchanged")
+        
+        parse_cache = self.parse_cache
+        if force:
+            # Re-extract for real rather than from cached parses
+            self.parse_cache = None
+        try:
+            if on_contacts is not None and to_process:
+                contacts, full_pass = self.process_resumes_two_tier(to_process)
+                on_contacts(contacts)
+                parsed_resumes = full_pass.result()
+            else:
+                parsed_resumes = self.process_resumes(to_process)
+        finally:
+            self.parse_cache = parse_cache
+        
+        cv_ids = {}
+        for parsed_resume in parsed_resumes:
+            filename = parsed_resume['filename']
+            path, size, mtime, content_hash = file_states[filename]
+            # Resumes read into memory were hashed while processing
+            content_hash = content_hash or parsed_resume.get('content_hash') or self.hash_resume(filename)
+            
+            # Identical PDFs share one cv_data row, whatever their filename
+            cv_id = parsed_resume.get('id') or cv_ids.get(content_hash)
+            if cv_id is None and not force:
+                cv_id = db.get_cached_cv_id(content_hash, PARSER_VERSION)
+            if cv_id is None:
+                cv_id = db.insert_cv_data(filename, parsed_resume)
+                db.cache_parsed_cv(content_hash, PARSER_VERSION, cv_id)
+            cv_ids[content_hash] = cv_id
+            db.upsert_manifest_entry(path, size, mtime, content_hash, cv_id)
+            parsed_resume['id'] = cv_id
+            records[filename] = parsed_resume
+        
+        return records, to_process, current_paths
+    
+    def _process_stream(self, items: Iterable[Tuple[str, bytes]], worker: Optional[Callable[..., Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Process (filename, bytes) pairs in a process pool, preserving order
+        
+        Only a bounded window of resumes is in flight at once, so memory
+        stays flat however many members an archive has.
+        
+        Args:
+            items: (resume identifier, PDF bytes) pairs
+            worker: Per-resume method (defaults to process_resume)
+            
         Returns:
             List of dictionaries with parsed resume data
         """
-        resume_files = self.get_resume_files()
+        worker = worker or self.process_resume
+        items = iter(items)
+        window = 2 * (self.max_workers or os.cpu_count() or 1)
+        pending = deque()
         parsed_resumes = []
         
-        for filename in resume_files:
-            parsed_resume = self.process_resume(filename)
-            parsed_resumes.append(parsed_resume)
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                for filename, data in items:
+                    entry = [filename, data]
+                    pending.append(entry)
+                    entry.append(executor.submit(worker, filename, data))
+                    while len(pending) >= window:
+                        parsed_resumes.append(pending[0][2].result())
+                        pending.popleft()
+                while pending:
+                    parsed_resumes.append(pending[0][2].result())
+                    pending.popleft()
+        except BrokenProcessPool as e:
+            # A worker died (e.g. a PDF crashed MuPDF); finish the rest in-process
+            print(f"Resume worker pool failed: {str(e)}, continuing sequentially")
+            for entry in pending:
+                parsed_resumes.append(worker(entry[0], entry[1]))
+            for filename, data in items:
+                parsed_resumes.append(worker(filename, data))
+        
+        return parsed_resumes
+    
+    def _process_parallel(self, resume_files: List[str], worker: Optional[Callable[..., Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Process resumes in a process pool, preserving input order
+        
+        Args:
+            resume_files: Resume filenames
+            worker: Per-file method to run (defaults to process_resume)
+            
+        Returns:
+            List of dictionaries with parsed resume data
+        """
+        worker = worker or self.process_resume
+        parsed_resumes = []
+        
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                # map() yields results in input order; the worker already
+                # isolates per-file errors
+                for parsed_resume in executor.map(worker, resume_files, chunksize=self.chunksize):
+                    parsed_resumes.append(parsed_resume)
+        except BrokenProcessPool as e:
+            # A worker died (e.g. a PDF crashed MuPDF); finish the rest in-process
+            print(f"Resume worker pool failed: {str(e)}, continuing sequentially")
+            for filename in resume_files[len(parsed_resumes):]:
+                parsed_resumes.append(worker(filename))
         
         return parsed_resumes 
\ No newline at end of file
@@ -1,21 +1,99 @@
+import asyncio
 import csv
+import hashlib
 import os
 import re
-from typing import Dict, List, Any
-import ollama
+from typing import Dict, List, Any, Optional, Tuple
 import json
+from utils.circuit_breaker import CircuitBreaker, ollama_breaker
+from utils.ollama_clients import OllamaClientManager, get_client_manager
+from utils.keyword_scanner import DEFAULT_TECH_KEYWORDS, get_tech_scanner
+
+# Bump whenever _build_prompt or _parse_response changes, so cached LLM
+# summaries produced by the old prompt are no longer used
+PROMPT_VERSION = 3
+
+# Summary fields and how the prompt describes them
+SUMMARY_FIELDS = {
+    'required_skills': 'Required Skills (as a list of strings)',
+    'years_of_experience': 'Years of Experience (extract numbers and text)',
+    'education': 'Education (degrees required)',
+    'certifications': 'Certifications (if any, as a list)',
+    'responsibilities': 'Responsibilities (as a list of strings)'
+}
+
+# JSON schema of each summary field, sent to Ollama as the output format
+FIELD_SCHEMAS = {
+    'required_skills': {'type': 'array', 'items': {'type': 'string'}},
+    'years_of_experience': {'type': 'string'},
+    'education': {'type': 'string'},
+    'certifications': {'type': 'array', 'items': {'type': 'string'}},
+    'responsibilities': {'type': 'array', 'items': {'type': 'string'}}
+}
+
+# Rule-based extraction patterns, compiled once; runs of capitalized words
+# are kept together as one name ("Power BI", "Robot Operating System")
+SKILLS_PATTERN = re.compile(r'(?:skills|proficiency in|experience with|knowledge of).*?(?:\.|\n)', re.IGNORECASE)
+TECH_SKILL_PATTERN = re.compile(r'([A-Z][a-zA-Z\+\#]+(?:\.[a-zA-Z\+\#]+)?(?: [A-Z][a-zA-Z\+\#]*)*|\b[Pp]ython\b|\b[Jj]ava\b|\b[Cc]\+\+\b|\bSQL\b|\bAWS\b|\bGCP\b|\bDocker\b|\bKubernetes\b|\bTensorFlow\b|\bPyTorch\b)')
+YEARS_PATTERN = re.compile(r'(\d+[\+]?(?:\s*-\s*\d+)?)\s*(?:years|yrs)(?:\s*of)?(?:\s*experience)?', re.IGNORECASE)
+EDUCATION_PATTERN = re.compile(r"(?:Bachelor'?s?|Master'?s?|PhD|Doctorate|degree)(?:[^.]*(?:in|of)[^.]*?)(?:\.|;|\n)", re.IGNORECASE)
+CERT_PATTERN = re.compile(r'(?:certifications?|certified)(?:[^.]*?)(?:\.|;|\n)', re.IGNORECASE)
+CERT_NAME_PATTERN = re.compile(r'([A-Z0-9\+\#]+(?:[^\s,.])*)')
+BULLET_PATTERN = re.compile(r'^\s*(?:•|\*|\d+\.|\-)\s*(.+)$', re.MULTILINE)
+# Capitalized cue words the skill pattern picks up that are not skills
+SKILL_STOPWORDS = {'experience', 'proficiency', 'knowledge', 'skills', 'strong', 'familiarity', 'understanding', 'ability', 'excellent'}
+SENTENCE_PATTERN = re.compile(r'([^.\n]+\.[^\n]*)')
+
+# Mentions of a field, used to tell "not required" from "not parsed"
+YEARS_CUE = re.compile(r'\b(?:years?|yrs)\b', re.IGNORECASE)
+EDUCATION_CUE = re.compile(r"\b(?:bachelor|master|phd|doctorate|degree|diploma)", re.IGNORECASE)
+CERT_CUE = re.compile(r'certif', re.IGNORECASE)
 
 class JDSummarizerAgent:
     """Agent to parse and summarize job descriptions into structured data"""
     
-    def __init__(self, csv_path: str = "job_description.csv"):
+    def __init__(self, csv_path: str = "job_description.csv", max_concurrency: int = 4, timeout: float = 120.0, breaker: CircuitBreaker = None, clients: OllamaClientManager = None, chat_model: str = None, cache=None, tiered: bool = True, confidence_threshold: float = 0.5):
         """Initialize JD Summarizer Agent
         
         Args:
             csv_path: Path to the CSV file containing job descriptions
+            max_concurrency: Maximum in-flight chat requests for the async methods
+            timeout: Seconds the async methods wait for each JD's whole LLM
+                exchange, repair request included
+            breaker: Circuit breaker guarding Ollama calls (defaults to the
+                one shared by all agents)
+            clients: Ollama client manager routing requests across hosts
+                (defaults to the one shared by all agents)
+            chat_model: Ollama model used for summarization (defaults to
+                the chat model routed by the client manager's model registry)
+            cache: Optional MemoryDB storing LLM summaries by JD content,
+                chat model and PROMPT_VERSION across runs
+            tiered: Run rule-based extraction first and only ask the LLM
+                for fields whose rule confidence is below
+                confidence_threshold (False asks the LLM for every field)
+            confidence_threshold: Rule confidence (0-1) below which a field
+                is sent to the LLM
         """
         self.csv_path = csv_path
+        self.breaker = breaker or ollama_breaker
+        self.clients = clients or get_client_manager()
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._chat_model = chat_model
+        self.cache = cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.tiered = tiered
+        self.confidence_threshold = confidence_threshold
+        self.rules_only = 0
+        self.llm_calls = 0
+        self.repairs = 0
         
+    @property
+    def chat_model(self) -> str:
+        """Model used for summarization, or None if no local model can chat"""
+        return self._chat_model or self.clients.models.chat_model
+    
     def load_jds(self) -> List[Dict[str, str]]:
         """Load job descriptions from CSV file
         
@@ -51,68 +129,389 @@ class JDSummarizerAgent:
         
         return job_descriptions
     
-    def summarize_jd(self, jd: Dict[str, str]) -> Dict[str, Any]:
-        """Parse and summarize a job description
+    def _build_prompt(self, jd: Dict[str, str], fields: Optional[List[str]] = None) -> str:
+        """Build the extraction prompt for a job description
         
         Args:
             jd: Dictionary containing job title and description
+            fields: Summary fields to ask for (defaults to all of them)
             
         Returns:
-            Dictionary with structured data extracted from the job description
+            Prompt text
         """
-        try:
-            # Using Ollama to extract structured information
-            prompt = f"""
+        fields = list(fields or SUMMARY_FIELDS)
+        items = '\n'.join(f"            {number}. {SUMMARY_FIELDS[field]}" for number, field in enumerate(fields, 1))
+        return f"""
             Extract the following information from this job description and format as JSON:
-            1. Required Skills (as a list of strings)
-            2. Years of Experience (extract numbers and text)
-            3. Education (degrees required)
-            4. Certifications (if any, as a list)
-            5. Responsibilities (as a list of strings)
+{items}
             
             Job Title: {jd['title']}
             Job Description: {jd['description']}
             
             Format your response as a valid JSON object with these keys:
-            required_skills, years_of_experience, education, certifications, responsibilities
+            {', '.join(fields)}
             """
+    
+    def _parse_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse the JSON summary out of a chat response
+        
+        Args:
+            response: Ollama chat response
+            
+        Returns:
+            Extracted data
+        """
+        response_text = response['message']['content']
+        
+        # Extract JSON from response
+        json_match = re.search(r'```json\n(.*?)\n```', response_text, re.DOTALL)
+        if json_match:
+            response_text = json_match.group(1)
+        
+        return json.loads(response_text)
+    
+    @staticmethod
+    def _response_schema(fields: List[str]) -> Dict[str, Any]:
+        """JSON schema constraining the model's reply to the given fields"""
+        return {
+            'type': 'object',
+            'properties': {field: FIELD_SCHEMAS[field] for field in fields},
+            'required': list(fields)
+        }
+    
+    def _validate(self, response: Dict[str, Any], fields: List[str]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Parse a chat response and check it against the fields' schema
+        
+        Numbers given for string fields are converted rather than rejected.
+        
+        Args:
+            response: Ollama chat response
+            fields: Summary fields that were requested
+            
+        Returns:
+            Tuple of (valid field values, problem description per invalid field)
+        """
+        try:
+            data = self._parse_response(response)
+        except (ValueError, KeyError, TypeError):
+            return {}, {field: "the reply was not valid JSON" for field in fields}
+        if not isinstance(data, dict):
+            return {}, {field: "the reply was not a JSON object" for field in fields}
+        
+        valid, invalid = {}, {}
+        for field in fields:
+            value = data.get(field)
+            if field not in data:
+                invalid[field] = f"{field} is missing"
+            elif FIELD_SCHEMAS[field]['type'] == 'array':
+                if isinstance(value, list) and all(isinstance(item, str) for item in value):
+                    valid[field] = value
+                else:
+                    invalid[field] = f"{field} must be a list of strings"
+            elif isinstance(value, str):
+                valid[field] = value
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                valid[field] = str(value)
+            else:
+                invalid[field] = f"{field} must be a string"
+        return valid, invalid
+    
+    def _repair_messages(self, messages: List[Dict[str, str]], response: Dict[str, Any], invalid: Dict[str, str]) -> List[Dict[str, str]]:
+        """Conversation asking the model to fix only the invalid fields"""
+        problems = '; '.join(dict.fromkeys(invalid.values()))
+        return messages + [
+            {"role": "assistant", "content": response['message']['content']},
+            {"role": "user", "content": f"Your reply did not match the required format: {problems}. "
+                                        f"Reply with only a JSON object with these keys: {', '.join(invalid)}"}
+        ]
+    
+    def _chat(self, messages: List[Dict[str, str]], fields: List[str]) -> Dict[str, Any]:
+        """Send one schema-constrained chat request through the breaker"""
+        self.llm_calls += 1
+        try:
+            response = self.clients.chat(model=self.chat_model, messages=messages, format=self._response_schema(fields))
+        except Exception as e:
+            self.breaker.record_exception(e)
+            raise
+        self.breaker.record_success()
+        return response
+    
+    async def _chat_async(self, messages: List[Dict[str, str]], fields: List[str]) -> Dict[str, Any]:
+        """Async variant of _chat; each Ollama host gets at most timeout seconds"""
+        self.llm_calls += 1
+        try:
+            response = await self.clients.chat_async(
+                model=self.chat_model, messages=messages, format=self._response_schema(fields), timeout=self.timeout
+            )
+        except Exception as e:
+            self.breaker.record_exception(e)
+            raise
+        self.breaker.record_success()
+        return response
+    
+    def _ask_llm(self, jd: Dict[str, str], fields: List[str]) -> Dict[str, Any]:
+        """Get validated values for fields from the chat model
+        
+        Invalid fields get a single repair request that asks for just those
+        fields; if they are still invalid the whole answer is rejected.
+        
+        Args:
+            jd: Dictionary containing job title and description
+            fields: Summary fields to ask for
+            
+        Returns:
+            Value per requested field
+        """
+        messages = [{"role": "user", "content": self._build_prompt(jd, fields)}]
+        response = self._chat(messages, fields)
+        data, invalid = self._validate(response, fields)
+        if invalid:
+            self.repairs += 1
+            response = self._chat(self._repair_messages(messages, response, invalid), list(invalid))
+            repaired, invalid = self._validate(response, list(invalid))
+            if invalid:
+                raise ValueError(f"Invalid JD summary after repair: {'; '.join(invalid.values())}")
+            data.update(repaired)
+        return data
+    
+    async def _ask_llm_async(self, jd: Dict[str, str], fields: List[str]) -> Dict[str, Any]:
+        """Async variant of _ask_llm"""
+        messages = [{"role": "user", "content": self._build_prompt(jd, fields)}]
+        response = await self._chat_async(messages, fields)
+        data, invalid = self._validate(response, fields)
+        if invalid:
+            self.repairs += 1
+            response = await self._chat_async(self._repair_messages(messages, response, invalid), list(invalid))
+            repaired, invalid = self._validate(response, list(invalid))
+            if invalid:
+                raise ValueError(f"Invalid JD summary after repair: {'; '.join(invalid.values())}")
+            data.update(repaired)
+        return data
+    
+    @staticmethod
+    def jd_hash(jd: Dict[str, str]) -> str:
+        """Content hash of a JD's title and description"""
+        content = f"{jd['title']}\n{jd['description']}"
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
+    def _cached_fields(self, jd: Dict[str, str], fields: List[str]) -> Optional[Dict[str, Any]]:
+        """Look up stored LLM values for a JD, counting hits and misses
+        
+        Args:
+            jd: Dictionary containing job title and description
+            fields: Summary fields that are needed
+            
+        Returns:
+            Cached values, or None on a miss or if any of the fields was
+            never asked for
+        """
+        if self.cache is None:
+            return None
+        
+        try:
+            cached = self.cache.get_cached_jd_summary(self.jd_hash(jd), self.chat_model, PROMPT_VERSION)
+        except Exception as e:
+            print(f"Error reading JD summary cache: {str(e)}")
+            cached = None
+        
+        if cached is None or any(field not in cached for field in fields):
+            self.cache_misses += 1
+            return None
+        
+        self.cache_hits += 1
+        return cached
+    
+    def _store_summary(self, jd: Dict[str, str], extracted_data: Dict[str, Any]) -> None:
+        """Cache parsed LLM values, adding to any fields already stored for
+        the JD (rule-based values are not cached)"""
+        if self.cache is None or not isinstance(extracted_data, dict):
+            return
+        
+        try:
+            jd_hash = self.jd_hash(jd)
+            cached = self.cache.get_cached_jd_summary(jd_hash, self.chat_model, PROMPT_VERSION) or {}
+            cached.update({field: extracted_data[field] for field in SUMMARY_FIELDS if field in extracted_data})
+            self.cache.cache_jd_summary(jd_hash, self.chat_model, PROMPT_VERSION, cached)
+        except Exception as e:
+            print(f"Error writing JD summary cache: {str(e)}")
+    
+    def _empty_summary(self, jd: Dict[str, str]) -> Dict[str, Any]:
+        """Summary returned when summarization fails entirely"""
+        return {
+            'required_skills': [],
+            'years_of_experience': 'N/A',
+            'education': 'N/A',
+            'certifications': [],
+            'responsibilities': [],
+            'raw_jd': jd['description']
+        }
+    
+    def _field_confidence(self, extracted_data: Dict[str, Any], description: str) -> Dict[str, float]:
+        """Score how far each rule-based field can be trusted (0-1)
+        
+        A field the rules filled scores high. An empty field scores high only
+        if the description never mentions it; a mention the patterns could
+        not parse (e.g. "five years", prose responsibilities) scores low.
+        
+        Args:
+            extracted_data: Result of _rule_based_extraction
+            description: Job description text
+            
+        Returns:
+            Confidence per summary field
+        """
+        # Unknown capitalized terms may be real tools or sentence fragments,
+        # so the more of the list they make up, the less it is trusted
+        required_skills = extracted_data['required_skills']
+        known_skills = sum(1 for skill in required_skills if skill in DEFAULT_TECH_KEYWORDS)
+        unknown_share = 1 - known_skills / len(required_skills) if required_skills else 1.0
+        if known_skills >= 3 and unknown_share <= 1 / 3:
+            skills = 1.0
+        elif known_skills and unknown_share <= 0.5:
+            skills = 0.6
+        else:
+            skills = 0.3 if required_skills else 0.0
+        
+        def found_or_absent(found: bool, cue: re.Pattern) -> float:
+            if found:
+                return 1.0
+            return 0.2 if cue.search(description) else 0.8
+        
+        responsibilities = len(extracted_data['responsibilities'])
+        
+        return {
+            'required_skills': skills,
+            'years_of_experience': found_or_absent(extracted_data['years_of_experience'] != 'N/A', YEARS_CUE),
+            'education': found_or_absent(extracted_data['education'] != 'N/A', EDUCATION_CUE),
+            'certifications': found_or_absent(bool(extracted_data['certifications']), CERT_CUE),
+            'responsibilities': 1.0 if responsibilities >= 3 else 0.7 if responsibilities == 2 else 0.3 if responsibilities else 0.1
+        }
+    
+    def _plan(self, jd: Dict[str, str]) -> Tuple[Dict[str, Any], List[str]]:
+        """Run the rule-based tier and choose the fields to ask the LLM for
+        
+        Args:
+            jd: Dictionary containing job title and description
+            
+        Returns:
+            Tuple of (rule-based data, fields for the LLM, possibly empty)
+        """
+        extracted_data = self._rule_based_extraction(jd)
+        
+        if self.chat_model is None:
+            # Without a chat-capable model there is nothing to ask
+            fields = []
+        elif not self.tiered:
+            fields = list(SUMMARY_FIELDS)
+        else:
+            confidence = self._field_confidence(extracted_data, jd['description'])
+            fields = [field for field in SUMMARY_FIELDS if confidence[field] < self.confidence_threshold]
+        
+        if not fields:
+            self.rules_only += 1
+        return extracted_data, fields
+    
+    def _merge(self, extracted_data: Dict[str, Any], llm_data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+        """Overlay LLM values on the rule-based data for the given fields
+        
+        Fields the LLM left empty keep their rule-based values.
+        """
+        if not isinstance(llm_data, dict):
+            return extracted_data
+        
+        merged = dict(extracted_data)
+        for field in fields:
+            value = llm_data.get(field)
+            if value not in (None, '', [], 'N/A'):
+                merged[field] = value
+        return merged
+    
+    def summarize_jd(self, jd: Dict[str, str]) -> Dict[str, Any]:
+        """Parse and summarize a job description
+        
+        Rules run first; the LLM is only asked for the fields they could not
+        extract confidently, with its output constrained to a JSON schema and
+        validated (see _ask_llm), and its answers are merged over the
+        rule-based values. Any LLM failure leaves the rule-based values in
+        place.
+        
+        Args:
+            jd: Dictionary containing job title and description
+            
+        Returns:
+            Dictionary with structured data extracted from the job description
+        """
+        try:
+            extracted_data, fields = self._plan(jd)
+            
+            llm_data = self._cached_fields(jd, fields) if fields else None
+            # Skip the LLM while Ollama is known to be down
+            if fields and llm_data is None and self.breaker.allow_request():
+                try:
+                    llm_data = self._ask_llm(jd, fields)
+                    self._store_summary(jd, llm_data)
+                except Exception as e:
+                    print(f"Error using Ollama for JD summarization: {str(e)}")
+            
+            if llm_data is not None:
+                extracted_data = self._merge(extracted_data, llm_data, fields)
             
-            try:
-                # First try with ollama
-                response = ollama.chat(model="nomic-embed-text", messages=[
-                    {"role": "user", "content": prompt}
-                ])
-                response_text = response['message']['content']
-                
-                # Extract JSON from response
-                json_match = re.search(r'```json\n(.*?)\n```', response_text, re.DOTALL)
-                if json_match:
-                    response_text = json_match.group(1)
-                
-                extracted_data = json.loads(response_text)
-                
-            except Exception as e:
-                print(f"Error using Ollama for JD summarization: {str(e)}")
-                # Fallback to rule-based extraction
-                extracted_data = self._rule_based_extraction(jd)
-                
             # Add the raw JD for reference
             extracted_data['raw_jd'] = jd['description']
             return extracted_data
             
         except Exception as e:
             print(f"Error summarizing job description: {str(e)}")
-            return {
-                'required_skills': [],
-                'years_of_experience': 'N/A',
-                'education': 'N/A',
-                'certifications': [],
-                'responsibilities': [],
-                'raw_jd': jd['description']
-            }
+            return self._empty_summary(jd)
+    
+    async def summarize_jd_async(self, jd: Dict[str, str], semaphore: asyncio.Semaphore = None) -> Dict[str, Any]:
+        """Async variant of summarize_jd with a per-JD timeout
+        
+        A JD holds its concurrency slot through any repair request, so a
+        repair never waits behind other JDs' first requests. The timeout
+        covers the first request and the repair together.
+        
+        Args:
+            jd: Dictionary containing job title and description
+            semaphore: Concurrency limit shared with other requests
+            
+        Returns:
+            Dictionary with structured data extracted from the job description
+        """
+        semaphore = semaphore or asyncio.Semaphore(self.max_concurrency)
+        
+        try:
+            extracted_data, fields = self._plan(jd)
+            
+            llm_data = self._cached_fields(jd, fields) if fields else None
+            if fields and llm_data is None:
+                try:
+                    async with semaphore:
+                        # Skip the LLM while Ollama is known to be down
+                        if self.breaker.allow_request():
+                            llm_data = await asyncio.wait_for(self._ask_llm_async(jd, fields), self.timeout)
+                    if llm_data is not None:
+                        self._store_summary(jd, llm_data)
+                except asyncio.TimeoutError as e:
+                    # The in-flight request was cancelled, which the breaker does not see
+                    self.breaker.record_exception(e)
+                    print(f"Ollama did not summarize JD {jd['title']} within {self.timeout}s")
+                except Exception as e:
+                    print(f"Error using Ollama for JD summarization: {str(e) or type(e).__name__}")
+            
+            if llm_data is not None:
+                extracted_data = self._merge(extracted_data, llm_data, fields)
+            
+            # Add the raw JD for reference
+            extracted_data['raw_jd'] = jd['description']
+            return extracted_data
+            
+        except Exception as e:
+            print(f"Error summarizing job description: {str(e)}")
+            return self._empty_summary(jd)
     
     def _rule_based_extraction(self, jd: Dict[str, str]) -> Dict[str, Any]:
-        """Rule-based extraction of JD data as fallback
+        """Rule-based extraction of JD data (first tier and fallback)
         
         Args:
             jd: Dictionary containing job title and description
@@ -122,33 +521,34 @@ class JDSummarizerAgent:
         """
         description = jd['description']
         
-        # Extract skills (look for technical terms and skill keywords)
-        skills_pattern = r'(?:skills|proficiency in|experience with|knowledge of).*?(?:\.|\n)'
-        skills_matches = re.findall(skills_pattern, description, re.IGNORECASE)
-        skills = []
-        for match in skills_matches:
-            # Extract individual skills
-            tech_skills = re.findall(r'([A-Z][a-zA-Z\+\#]+(?:\.[a-zA-Z\+\#]+)?|\b[Pp]ython\b|\b[Jj]ava\b|\b[Cc]\+\+\b|\bSQL\b|\bAWS\b|\bGCP\b|\bDocker\b|\bKubernetes\b|\bTensorFlow\b|\bPyTorch\b)', match)
-            skills.extend(tech_skills)
+        # Known technologies first, then capitalized terms from skill
+        # sentences that are not just part of a known one ("Google" and
+        # "Cloud" inside "Google Cloud")
+        known = get_tech_scanner().scan(description)
+        skills = list(dict.fromkeys(name for name, _, _ in known))
+        known_spans = [(start, end) for _, start, end in known]
+        for sentence in SKILLS_PATTERN.finditer(description):
+            for term in TECH_SKILL_PATTERN.finditer(description, sentence.start(), sentence.end()):
+                if term.group(1).lower() in SKILL_STOPWORDS:
+                    continue
+                if any(start < term.end() and term.start() < end for start, end in known_spans):
+                    continue
+                skills.append(term.group(1))
         
         # Extract years of experience
-        years_pattern = r'(\d+[\+]?(?:\s*-\s*\d+)?)\s*(?:years|yrs)(?:\s*of)?(?:\s*experience)?'
-        years_match = re.search(years_pattern, description, re.IGNORECASE)
+        years_match = YEARS_PATTERN.search(description)
         years_experience = years_match.group(0) if years_match else "N/A"
         
         # Extract education requirements
-        education_pattern = r"(?:Bachelor'?s?|Master'?s?|PhD|Doctorate|degree)(?:[^.]*(?:in|of)[^.]*?)(?:\.|;|\n)"
-        education_match = re.search(education_pattern, description, re.IGNORECASE)
+        education_match = EDUCATION_PATTERN.search(description)
         education = education_match.group(0).strip() if education_match else "N/A"
         
         # Extract certifications
-        cert_pattern = r'(?:certifications?|certified)(?:[^.]*?)(?:\.|;|\n)'
-        cert_match = re.search(cert_pattern, description, re.IGNORECASE)
+        cert_match = CERT_PATTERN.search(description)
         certifications = []
         if cert_match:
-            cert_text = cert_match.group(0)
-            specific_certs = re.findall(r'([A-Z0-9\+\#]+(?:[^\s,.])*)', cert_text)
-            certifications = [cert for cert in specific_certs if len(cert) > 2]
+            specific_certs = CERT_NAME_PATTERN.findall(cert_match.group(0))
+            certifications = [cert for cert in specific_certs if len(cert) > 2 and not cert.lower().startswith('certif')]
         
         # Extract responsibilities
         resp_section = None
@@ -160,28 +560,36 @@ class JDSummarizerAgent:
         responsibilities = []
         if resp_section:
             # Look for bullet points or numbered lists
-            resp_items = re.findall(r'(?:•|\*|\d+\.|\-)\s*(.*?)(?=(?:•|\*|\d+\.|\-|$))', resp_section)
+            resp_items = BULLET_PATTERN.findall(resp_section)
             if resp_items:
                 responsibilities = [item.strip() for item in resp_items if item.strip()]
             else:
                 # Split by sentences if no bullet points
-                resp_sentences = re.findall(r'([^.\n]+\.[^\n]*)', resp_section)
+                resp_sentences = SENTENCE_PATTERN.findall(resp_section)
                 responsibilities = [sent.strip() for sent in resp_sentences if sent.strip()]
         
         return {
-            'required_skills': list(set(skills)),
+            'required_skills': list(dict.fromkeys(skills)),
             'years_of_experience': years_experience,
             'education': education,
             'certifications': certifications,
             'responsibilities': responsibilities
         }
     
-    def process_all_jds(self) -> List[Dict[str, Any]]:
+    def process_all_jds(self, concurrent: bool = False) -> List[Dict[str, Any]]:
         """Process all job descriptions from the CSV file
         
+        Args:
+            concurrent: Summarize with up to max_concurrency chat requests in
+                flight (see process_all_jds_async) instead of one at a time.
+                Must not be called from a running event loop.
+        
         Returns:
-            List of dictionaries with summarized job data
+            List of dictionaries with summarized job data, in CSV order
         """
+        if concurrent:
+            return asyncio.run(self.process_all_jds_async())
+        
         jds = self.load_jds()
         summarized_jds = []
         
@@ -193,4 +601,21 @@ class JDSummarizerAgent:
                 'summary': summary
             })
         
-        return summarized_jds 
\ No newline at end of file
+        return summarized_jds
+    
+    async def process_all_jds_async(self) -> List[Dict[str, Any]]:
+        """Process all job descriptions with up to max_concurrency requests in flight
+        
+        Each JD gets its own timeout and falls back to rule-based extraction
+        on its own, so one slow or failed request never holds up the rest.
+        
+        Returns:
+            List of dictionaries with summarized job data, in CSV order
+        """
+        jds = self.load_jds()
+        print(f"Summarizing {len(jds)} JDs with up to {self.max_concurrency} concurrent requests")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        summaries = await asyncio.gather(*(self.summarize_jd_async(jd, semaphore) for jd in jds))
+        
+        return [{'title': jd['title'], 'summary': summary} for jd, summary in zip(jds, summaries)]
@@ -1,5 +1,11 @@
-from typing import Dict, List, Any, Tuple
+import re
+import numpy as np
+from typing import Dict, List, Any, Tuple, Optional
 from utils.embeddings import EmbeddingUtil
+from utils.scoring import ScoringEngine
+from utils.ann_index import IVFIndex
+from utils.quantization import QuantizedEmbeddings
+from utils.keyword_scanner import get_tech_scanner
 import sys
 import os
 
@@ -9,9 +15,37 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 class MatcherAgent:
     """Agent to match job descriptions with resumes using embeddings"""
     
-    def __init__(self):
-        """Initialize Matcher Agent"""
+    def __init__(self, index_path: Optional[str] = None, quantization: Optional[str] = None):
+        """Initialize Matcher Agent
+        
+        Args:
+            index_path: Where the CV nearest-neighbour index is persisted
+                (see MemoryDB.get_index_path); None keeps it in memory only
+            quantization: 'int8' or 'binary' to retrieve top-n candidates by
+                scanning quantized CV embeddings with exact re-ranking
+                instead of searching the nearest-neighbour index. With an
+                index_path, the codes and float32 originals are persisted
+                next to the index and the originals are memory-mapped
+        """
+        if quantization is not None and quantization not in QuantizedEmbeddings.METHODS:
+            raise ValueError(f"Unknown quantization method: {quantization}")
+        
         self.embedding_util = EmbeddingUtil()
+        self.scoring_engine = ScoringEngine()
+        self.quantization = quantization
+        self.index_path = index_path
+        self._cv_index: Optional[IVFIndex] = None
+        self.cv_pool: Optional[QuantizedEmbeddings] = None
+    
+    @property
+    def cv_index(self) -> IVFIndex:
+        """CV nearest-neighbour index, loaded from index_path on first use"""
+        if self._cv_index is None:
+            if self.index_path and os.path.exists(self.index_path):
+                self._cv_index = IVFIndex.load(self.index_path)
+            else:
+                self._cv_index = IVFIndex()
+        return self._cv_index
     
     def calculate_match_score(self, jd_data: Dict[str, Any], cv_data: Dict[str, Any]) -> float:
         """Calculate match score between job description and resume
@@ -27,11 +61,74 @@ class MatcherAgent:
         jd_embedding = self.embedding_util.get_jd_embedding(jd_data)
         cv_embedding = self.embedding_util.get_cv_embedding(cv_data)
         
+        if self._embeddings_unavailable([jd_embedding]):
+            return self.calculate_keyword_score(jd_data, cv_data)
+        
         # Calculate similarity
         score = self.embedding_util.calculate_similarity(jd_embedding, cv_embedding)
         
         return score
     
+    @staticmethod
+    def _skill_list(value: Any) -> List[str]:
+        """Skills stored as a list or a comma-separated string, as a list"""
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = value.split(',')
+        return [str(skill).strip() for skill in value if str(skill).strip()]
+    
+    def calculate_keyword_score(self, jd_data: Dict[str, Any], cv_data: Dict[str, Any]) -> float:
+        """Calculate a keyword-overlap match score without embeddings
+        
+        Used when Ollama is unavailable. A required skill counts when it
+        appears in the CV's skills or tech stack as a whole word or phrase
+        (so "java" does not match "javascript" and "R" does not match every
+        word containing an r), or when it names the same technology as one
+        the CV mentions (e.g. "Golang" and "Go").
+        
+        Args:
+            jd_data: Job description data
+            cv_data: Resume data
+            
+        Returns:
+            Match score (0-100)
+        """
+        jd_skills = self._skill_list(jd_data.get('summary', {}).get('required_skills', []))
+        if not jd_skills:
+            return 0.0
+        
+        cv_text = ', '.join(self._skill_list(cv_data.get('skills')) + self._skill_list(cv_data.get('tech_stack')))
+        cv_text = ' '.join(cv_text.split())
+        scanner = get_tech_scanner()
+        cv_technologies = set(scanner.find_all(cv_text))
+        
+        matching_skills = 0
+        for skill in jd_skills:
+            skill = ' '.join(skill.split())
+            technologies = scanner.find_all(skill)
+            if technologies and all(name in cv_technologies for name in technologies):
+                matching_skills += 1
+            elif re.search(rf'(?<!\w){re.escape(skill)}(?!\w)', cv_text, re.IGNORECASE):
+                matching_skills += 1
+        return matching_skills / len(jd_skills) * 100
+    
+    def _embeddings_unavailable(self, jd_embeddings: List[List[float]]) -> bool:
+        """Whether embedding scores would be meaningless for this run
+        
+        True when the shared Ollama circuit breaker is open, or when every JD
+        got the zero-vector fallback before the breaker tripped.
+        """
+        if self.embedding_util.is_degraded():
+            return True
+        return not any(any(embedding) for embedding in jd_embeddings)
+    
+    def _keyword_matches(self, jd_data: Dict[str, Any], cv_data_list: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], float]]:
+        """Rank resumes for a job description by keyword score"""
+        matches = [(cv_data, self.calculate_keyword_score(jd_data, cv_data)) for cv_data in cv_data_list]
+        matches.sort(key=lambda x: x[1], reverse=True)
+        return matches
+    
     def match_jd_with_all_cvs(self, jd_data: Dict[str, Any], cv_data_list: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], float]]:
         """Match a job description with all resumes
         
@@ -42,20 +139,24 @@ class MatcherAgent:
         Returns:
             List of tuples containing CV data and match score, sorted by score
         """
-        matches = []
-        
-        for cv_data in cv_data_list:
-            score = self.calculate_match_score(jd_data, cv_data)
-            matches.append((cv_data, score))
+        # Embed the JD once and every CV once, then score all pairs
+        jd_embedding = self.embedding_util.get_jd_embedding(jd_data)
+        cv_embeddings = self.embedding_util.get_cv_embeddings(cv_data_list)
         
-        # Sort by score in descending order
-        matches.sort(key=lambda x: x[1], reverse=True)
+        if self._embeddings_unavailable([jd_embedding]):
+            print("Ollama unavailable, falling back to keyword matching")
+            return self._keyword_matches(jd_data, cv_data_list)
         
-        return matches
+        scores = self.scoring_engine.score_matrix([jd_embedding], cv_embeddings)
+        return self.scoring_engine.ranked(scores[0], cv_data_list)
     
     def match_all_jds_with_all_cvs(self, jd_data_list: List[Dict[str, Any]], cv_data_list: List[Dict[str, Any]]) -> Dict[str, List[Tuple[Dict[str, Any], float]]]:
         """Match all job descriptions with all resumes
         
+        Every JD and every CV is embedded exactly once (J + C embedding calls
+        instead of 2 * J * C), then the full J x C score matrix is computed
+        with blocked matrix multiplications.
+        
         Args:
             jd_data_list: List of job description data
             cv_data_list: List of resume data
@@ -64,27 +165,101 @@ class MatcherAgent:
             Dictionary mapping job title to list of (CV, score) tuples
         """
         all_matches = {}
+        if not jd_data_list:
+            return all_matches
         
-        for jd_data in jd_data_list:
+        jd_embeddings = self.embedding_util.get_jd_embeddings(jd_data_list)
+        cv_embeddings = self.embedding_util.get_cv_embeddings(cv_data_list)
+        
+        # Switch strategy once for the whole run rather than per pair
+        if self._embeddings_unavailable(jd_embeddings):
+            print("Ollama unavailable, falling back to keyword matching")
+            for jd_data in jd_data_list:
+                all_matches[jd_data['title']] = self._keyword_matches(jd_data, cv_data_list)
+            return all_matches
+        
+        scores = self.scoring_engine.score_matrix(jd_embeddings, cv_embeddings)
+        
+        for jd_data, jd_scores in zip(jd_data_list, scores):
             job_title = jd_data['title']
             print(f"Matching: {job_title}")
             
-            matches = self.match_jd_with_all_cvs(jd_data, cv_data_list)
-            all_matches[job_title] = matches
+            all_matches[job_title] = self.scoring_engine.ranked(jd_scores, cv_data_list)
         
         return all_matches
     
-    def get_top_matches(self, all_matches: Dict[str, List[Tuple[Dict[str, Any], float]]], threshold: float = 0.0, top_n: int = None) -> Dict[str, List[Tuple[Dict[str, Any], float]]]:
+    def _is_indexed(self, cv_data: Dict[str, Any]) -> bool:
+        """Whether the index holds a vector for this exact version of a CV"""
+        filename = cv_data['filename']
+        return filename in self.cv_index and self.cv_index.hashes.get(filename) == cv_data.get('content_hash')
+    
+    def _rebuild_index(self, cv_data_list: List[Dict[str, Any]], dim: int) -> None:
+        """Re-index resumes from scratch after the embedding dimension changed"""
+        print(f"CV index holds {self.cv_index.dim}-dimensional vectors but embeddings now have {dim}, rebuilding it")
+        self.cv_index.clear()
+        self.index_cvs(cv_data_list)
+    
+    def index_cvs(self, cv_data_list: List[Dict[str, Any]], update_existing: bool = True) -> None:
+        """Add resumes to the CV nearest-neighbour index and persist it
+        
+        Args:
+            cv_data_list: List of resume data, keyed in the index by filename
+            update_existing: Re-embed CVs that are already indexed, so edited
+                resumes are picked up (embeddings come from the cache when the
+                text is unchanged); otherwise only CVs whose content_hash
+                changed are re-embedded
+        """
+        pending = cv_data_list if update_existing else [cv for cv in cv_data_list if not self._is_indexed(cv)]
+        if not pending:
+            return
+        
+        cv_embeddings = self.embedding_util.get_cv_embeddings(pending)
+        if self._embeddings_unavailable(cv_embeddings):
+            # Fallback vectors would be persisted as if they were real
+            print("Ollama unavailable, leaving the CV index unchanged")
+            return
+        
+        # CVs from failed batches got zero vectors; leave them out so the
+        # next call sees them as not indexed and retries them
+        embedded = [(cv, embedding) for cv, embedding in zip(pending, cv_embeddings) if any(embedding)]
+        if len(embedded) < len(pending):
+            print(f"Could not embed {len(pending) - len(embedded)} CVs, they will be indexed on the next run")
+        
+        dim = len(embedded[0][1])
+        if self.cv_index.dim not in (None, dim):
+            self._rebuild_index(cv_data_list, dim)
+            return
+        
+        self.cv_index.add(
+            [cv['filename'] for cv, _ in embedded],
+            [embedding for _, embedding in embedded],
+            [cv.get('content_hash') for cv, _ in embedded]
+        )
+        
+        if self.index_path:
+            self.cv_index.save(self.index_path)
+    
+    def get_top_matches(self, all_matches: Optional[Dict[str, List[Tuple[Dict[str, Any], float]]]] = None, threshold: float = 0.0, top_n: int = None, jd_data_list: Optional[List[Dict[str, Any]]] = None, cv_data_list: Optional[List[Dict[str, Any]]] = None) -> Dict[str, List[Tuple[Dict[str, Any], float]]]:
         """Get top matches for each job description
         
+        When all_matches is not given, candidates for each JD in jd_data_list
+        are retrieved from the CV nearest-neighbour index instead of scoring
+        every resume; top_n is then required.
+        
         Args:
             all_matches: Dictionary mapping job title to list of (CV, score) tuples
             threshold: Minimum score threshold
             top_n: Maximum number of top matches to return
+            jd_data_list: Job descriptions to retrieve candidates for
+            cv_data_list: Resume data; new or changed CVs are indexed first
+                and indexed CVs missing from it are removed
             
         Returns:
             Dictionary mapping job title to filtered list of (CV, score) tuples
         """
+        if all_matches is None:
+            all_matches = self._retrieve_top_matches(jd_data_list or [], cv_data_list or [], top_n)
+        
         filtered_matches = {}
         
         for job_title, matches in all_matches.items():
@@ -97,4 +272,146 @@ class MatcherAgent:
             
             filtered_matches[job_title] = threshold_matches
         
-        return filtered_matches 
\ No newline at end of file
+        return filtered_matches
+    
+    def _retrieve_top_matches(self, jd_data_list: List[Dict[str, Any]], cv_data_list: List[Dict[str, Any]], top_n: int) -> Dict[str, List[Tuple[Dict[str, Any], float]]]:
+        """Retrieve approximate top-n CVs for each JD from the index
+        
+        Args:
+            jd_data_list: List of job description data
+            cv_data_list: List of resume data
+            top_n: Number of candidates per JD
+            
+        Returns:
+            Dictionary mapping job title to list of (CV, score) tuples
+        """
+        if top_n is None:
+            raise ValueError("top_n is required for index-based retrieval")
+        
+        all_matches = {}
+        if not jd_data_list:
+            return all_matches
+        
+        jd_embeddings = self.embedding_util.get_jd_embeddings(jd_data_list)
+        if self._embeddings_unavailable(jd_embeddings):
+            print("Ollama unavailable, falling back to keyword matching")
+            for jd_data in jd_data_list:
+                all_matches[jd_data['title']] = self._keyword_matches(jd_data, cv_data_list)[:top_n]
+            return all_matches
+        
+        if self.quantization:
+            return self._scan_top_matches(jd_data_list, jd_embeddings, cv_data_list, top_n)
+        
+        self._sync_index(cv_data_list, len(jd_embeddings[0]))
+        cvs_by_filename = {cv['filename']: cv for cv in cv_data_list}
+        
+        for jd_data, jd_embedding in zip(jd_data_list, jd_embeddings):
+            hits = self.cv_index.search(jd_embedding, top_n)
+            all_matches[jd_data['title']] = [(cvs_by_filename[filename], score) for filename, score in hits]
+        
+        return all_matches
+    
+    def _sync_index(self, cv_data_list: List[Dict[str, Any]], dim: int) -> None:
+        """Make the index hold exactly cv_data_list, embedded at dimension dim
+        
+        Args:
+            cv_data_list: The full CV pool
+            dim: Dimension of the current embedding model
+        """
+        # Resumes that are gone from cv_data_list leave the index for good
+        filenames = {cv['filename'] for cv in cv_data_list}
+        removed = [filename for filename in self.cv_index.ids if filename not in filenames]
+        self.cv_index.remove(removed)
+        
+        if self.cv_index.dim not in (None, dim):
+            self._rebuild_index(cv_data_list, dim)
+        else:
+            self.index_cvs(cv_data_list, update_existing=False)
+            if removed and self.index_path:
+                self.cv_index.save(self.index_path)
+    
+    def _pool_paths(self) -> Tuple[Optional[str], Optional[str]]:
+        """Files holding the quantized codes and float32 originals, if persisted"""
+        if not self.index_path:
+            return None, None
+        base, _ = os.path.splitext(self.index_path)
+        return f"{base}_{self.quantization}.npz", f"{base}_{self.quantization}.npy"
+    
+    def _quantized_pool(self, cv_data_list: List[Dict[str, Any]], dim: int) -> Optional[QuantizedEmbeddings]:
+        """Quantized CV embeddings covering exactly cv_data_list
+        
+        The pool is reused, from memory or from disk, while every CV's
+        content_hash is unchanged. Otherwise the index is brought up to date
+        (embedding only new or changed CVs) and the pool is rebuilt from its
+        vectors. With an index_path, the index is then dropped from memory,
+        since the pool's originals are memory-mapped from disk.
+        
+        Args:
+            cv_data_list: The full CV pool
+            dim: Dimension of the current embedding model
+            
+        Returns:
+            Quantized embeddings whose 'ids' metadata are CV filenames, or
+            None if no CV could be embedded
+        """
+        codes_path, originals_path = self._pool_paths()
+        expected = {cv['filename']: cv.get('content_hash') or '' for cv in cv_data_list}
+        
+        def current(pool: Optional[QuantizedEmbeddings]) -> bool:
+            return (pool is not None and pool.dim == dim
+                    and dict(zip(pool.metadata['ids'].tolist(), pool.metadata['hashes'].tolist())) == expected)
+        
+        if current(self.cv_pool):
+            return self.cv_pool
+        if self.cv_pool is None and codes_path and os.path.exists(codes_path) and os.path.exists(originals_path):
+            try:
+                self.cv_pool = QuantizedEmbeddings.load(codes_path, originals_path)
+            except Exception as e:
+                print(f"Could not load quantized CV embeddings: {str(e)}")
+            if current(self.cv_pool):
+                return self.cv_pool
+        
+        self.cv_pool = None
+        self._sync_index(cv_data_list, dim)
+        if not len(self.cv_index):
+            return None
+        
+        pool = self.embedding_util.quantize(self.cv_index.vectors, method=self.quantization, originals_path=originals_path)
+        pool.metadata = {
+            'ids': np.array(self.cv_index.ids, dtype=str),
+            'hashes': np.array([self.cv_index.hashes.get(filename, '') for filename in self.cv_index.ids], dtype=str)
+        }
+        if codes_path:
+            pool.save(codes_path)
+            self._cv_index = None
+        self.cv_pool = pool
+        return pool
+    
+    def _scan_top_matches(self, jd_data_list: List[Dict[str, Any]], jd_embeddings: List[List[float]], cv_data_list: List[Dict[str, Any]], top_n: int) -> Dict[str, List[Tuple[Dict[str, Any], float]]]:
+        """Retrieve top-n CVs for each JD by scanning quantized CV embeddings
+        
+        Every CV is scored from its compressed code, and only the best
+        candidates' float32 originals are read for exact re-ranking.
+        
+        Args:
+            jd_data_list: List of job description data
+            jd_embeddings: Embeddings of jd_data_list
+            cv_data_list: List of resume data
+            top_n: Number of candidates per JD
+            
+        Returns:
+            Dictionary mapping job title to list of (CV, score) tuples
+        """
+        pool = self._quantized_pool(cv_data_list, len(jd_embeddings[0]))
+        if pool is None:
+            return {jd_data['title']: [] for jd_data in jd_data_list}
+        
+        cvs_by_filename = {cv['filename']: cv for cv in cv_data_list}
+        filenames = pool.metadata['ids'].tolist()
+        all_matches = {}
+        
+        for jd_data, jd_embedding in zip(jd_data_list, jd_embeddings):
+            hits = pool.search(jd_embedding, top_n)
+            all_matches[jd_data['title']] = [(cvs_by_filename[filenames[i]], score) for i, score in hits]
+        
+        return all_matches
@@ -459,7 +459,7 @@ def process_job_descriptions():
     """Process job descriptions"""
     with st.spinner("Processing job descriptions..."):
         try:
-            jd_agent = JDSummarizerAgent(jd_file)
+            jd_agent = JDSummarizerAgent(jd_file, cache=st.session_state.db)
             st.session_state.jd_summaries = jd_agent.process_all_jds()
             
             # If no JDs were found, create mock ones
@@ -560,8 +560,12 @@ def process_resumes():
     """Process resumes"""
     with st.spinner("Processing resumes..."):
         try:
-            cv_agent = CVExtractorAgent(resumes_dir)
-            st.session_state.cv_data_list = cv_agent.process_all_resumes()
+            cv_agent = CVExtractorAgent(resumes_dir, parse_cache=st.session_state.db)
+            if st.session_state.db:
+                # Only new or changed PDFs are extracted and stored
+                st.session_state.cv_data_list = cv_agent.ingest_resumes(st.session_state.db)
+            else:
+                st.session_state.cv_data_list = cv_agent.process_all_resumes()
             
             # Ensure we have resume data
             if not st.session_state.cv_data_list:
@@ -614,11 +618,13 @@ def process_resumes():
                 if 'filename' not in cv:
                     cv['filename'] = f"{cv['name'].lower().replace(' ', '_')}_resume.pdf"
             
-            # Store CV data in database if available
+            # Store CV data not yet in the database (ingested resumes already have an id)
             if st.session_state.db:
                 for cv_data in st.session_state.cv_data_list:
+                    if 'id' in cv_data:
+                        continue
                     filename = cv_data['filename']
-                    st.session_state.db.insert_cv_data(filename, cv_data)
+                    cv_data['id'] = st.session_state.db.insert_cv_data(filename, cv_data)
                     
             return True
                 
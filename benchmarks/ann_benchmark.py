@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+ANN Recall vs. Latency Benchmark
+================================
+
+Compares IVFIndex top-k retrieval against exact ScoringEngine search on
+embeddings of the bundled resumes, scaled up synthetically.
+
+Run with: python benchmarks/ann_benchmark.py --size 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import hashed_embedding, load_resume_texts, load_jds, scale_up
+from utils.ann_index import IVFIndex
+from utils.scoring import ScoringEngine
+
+def run_benchmark(args):
+    """Build the index and report recall@k and query latency per n_probe"""
+    print("Loading bundled resumes and job descriptions...")
+    resume_texts = load_resume_texts()
+    jds = load_jds()
+
+    if args.use_ollama:
+        from utils.embeddings import EmbeddingUtil
+        embedding_util = EmbeddingUtil()
+        base = np.asarray(embedding_util.get_embeddings(resume_texts), dtype=np.float32)
+        queries = np.asarray(embedding_util.get_embeddings([jd['description'] for jd in jds]), dtype=np.float32)
+    else:
+        base = np.vstack([hashed_embedding(text, args.dim) for text in resume_texts])
+        queries = np.vstack([hashed_embedding(jd['description'], args.dim) for jd in jds])
+
+    corpus = scale_up(base, args.size, seed=args.seed)
+    ids = [f"cv_{i}" for i in range(args.size)]
+    print(f"Corpus: {args.size} CVs x {corpus.shape[1]} dims, {len(queries)} JD queries")
+
+    start = time.perf_counter()
+    index = IVFIndex(n_lists=args.n_lists, seed=args.seed)
+    index.add(ids, corpus)
+    print(f"Index build: {time.perf_counter() - start:.2f}s ({len(index.centroids)} lists)")
+
+    # Exact ground truth
+    engine = ScoringEngine()
+    start = time.perf_counter()
+    exact_scores = engine.score_matrix(queries, corpus)
+    exact_top = [set(engine.sorted_indices(row, args.k).tolist()) for row in exact_scores]
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    print(f"\n{'n_probe':>8} {'recall@' + str(args.k):>10} {'ms/query':>10}")
+    print(f"{'exact':>8} {1.0:>10.3f} {exact_ms:>10.2f}")
+
+    for n_probe in args.n_probe:
+        recalls = []
+        start = time.perf_counter()
+        results = [index.search(query, args.k, n_probe=n_probe) for query in queries]
+        ann_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        for hits, truth in zip(results, exact_top):
+            found = {int(item_id[3:]) for item_id, _ in hits}
+            recalls.append(len(found & truth) / len(truth))
+        print(f"{n_probe:>8} {np.mean(recalls):>10.3f} {ann_ms:>10.2f}")
+
+def parse_arguments():
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='IVF index recall vs. latency benchmark')
+    parser.add_argument('--size', type=int, default=100000, help='Number of synthetic CVs')
+    parser.add_argument('--dim', type=int, default=768, help='Embedding dimension for hashed embeddings')
+    parser.add_argument('--k', type=int, default=200, help='Top-k retrieved per JD')
+    parser.add_argument('--n-lists', type=int, default=None, help='Number of IVF lists (default: sqrt(size))')
+    parser.add_argument('--n-probe', type=int, nargs='+', default=[1, 4, 8, 16, 32, 64], help='n_probe values to test')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--use-ollama', action='store_true', help='Embed base texts with Ollama instead of hashing')
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    run_benchmark(parse_arguments())
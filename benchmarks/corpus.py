@@ -0,0 +1,69 @@
+"""
+Shared helpers for the offline benchmarks: loads the bundled resumes and job
+descriptions and derives deterministic embeddings without a running Ollama.
+"""
+
+import hashlib
+import os
+import re
+import sys
+from typing import Dict, List, Any
+
+import numpy as np
+
+# Add parent directory to path to ensure imports work correctly
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.cv_extractor import CVExtractorAgent
+from agents.jd_summarizer import JDSummarizerAgent
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def hashed_embedding(text: str, dim: int = 768) -> np.ndarray:
+    """Deterministic bag-of-words embedding using the hashing trick
+
+    Texts that share vocabulary get similar vectors, which is enough to give
+    ANN and scoring benchmarks realistic neighbourhood structure offline.
+
+    Args:
+        text: Text to embed
+        dim: Embedding dimension
+
+    Returns:
+        Unnormalized float32 vector
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    for token in re.findall(r'[a-z0-9\+#]+', text.lower()):
+        digest = hashlib.md5(token.encode('utf-8')).digest()
+        bucket = int.from_bytes(digest[:4], 'little') % dim
+        vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+    return vector
+
+def load_resume_texts(resumes_dir: str = os.path.join(REPO_DIR, "resumes")) -> List[str]:
+    """Extract raw text of every bundled resume"""
+    agent = CVExtractorAgent(resumes_dir)
+    return [agent.extract_text_from_pdf(os.path.join(resumes_dir, f)) for f in sorted(agent.get_resume_files())]
+
+def load_jds(csv_path: str = os.path.join(REPO_DIR, "job_description.csv")) -> List[Dict[str, Any]]:
+    """Load the bundled job descriptions"""
+    return JDSummarizerAgent(csv_path).load_jds()
+
+def scale_up(base: np.ndarray, size: int, noise: float = 0.3, seed: int = 0) -> np.ndarray:
+    """Synthesize a larger corpus by perturbing and mixing base embeddings
+
+    Args:
+        base: Base embedding matrix
+        size: Number of synthetic embeddings
+        noise: Gaussian noise scale relative to each vector's norm
+        seed: Random seed
+
+    Returns:
+        Matrix of shape (size, dim)
+    """
+    rng = np.random.default_rng(seed)
+    base = base / np.maximum(np.linalg.norm(base, axis=1, keepdims=True), 1e-12)
+    first = base[rng.integers(len(base), size=size)]
+    second = base[rng.integers(len(base), size=size)]
+    mix = rng.uniform(0.0, 0.3, size=(size, 1)).astype(np.float32)
+    noise_vectors = rng.normal(scale=noise / np.sqrt(base.shape[1]), size=(size, base.shape[1]))
+    return ((1 - mix) * first + mix * second + noise_vectors).astype(np.float32)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Embedding Throughput Benchmark
+==============================
+
+Measures EmbeddingUtil throughput against local stub Ollama servers for the
+sequential, batched, async and multi-host request paths.
+
+Run with: python benchmarks/embedding_throughput.py --texts 2000 --hosts 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_ollama import start_stub_server
+from utils.circuit_breaker import CircuitBreaker
+from utils.embeddings import EmbeddingUtil
+from utils.ollama_clients import OllamaClientManager
+
+def make_util(hosts, args):
+    """EmbeddingUtil talking only to the given stub hosts, without caching"""
+    return EmbeddingUtil(
+        use_cache=False,
+        batch_size=args.batch_size,
+        max_concurrency=args.concurrency,
+        breaker=CircuitBreaker("Stub Ollama"),
+        clients=OllamaClientManager(hosts, keep_alive=None)
+    )
+
+def report(label, count, seconds):
+    print(f"{label:<28} {count / seconds:>10.1f} texts/s  ({seconds:.2f}s)")
+
+def run_benchmark(args):
+    """Start stub servers and time each embedding path"""
+    servers = [start_stub_server(latency=args.latency, jitter=args.jitter, dim=args.dim, seed=i) for i in range(args.hosts)]
+    hosts = [host for _, host in servers]
+    texts = [f"Candidate {i} with Python, SQL and {i % 17} years of experience" for i in range(args.texts)]
+    print(f"{args.texts} texts, {args.hosts} stub host(s), {args.latency * 1000:.0f}ms latency per request\n")
+
+    try:
+        sequential = texts[:args.sequential_texts]
+        util = make_util(hosts[:1], args)
+        start = time.perf_counter()
+        for text in sequential:
+            util.get_embedding(text)
+        report("sequential get_embedding", len(sequential), time.perf_counter() - start)
+
+        util = make_util(hosts[:1], args)
+        start = time.perf_counter()
+        util.get_embeddings(texts)
+        report("batched get_embeddings", len(texts), time.perf_counter() - start)
+
+        util = make_util(hosts[:1], args)
+        start = time.perf_counter()
+        asyncio.run(util.get_embeddings_async(texts))
+        report("async, 1 host", len(texts), time.perf_counter() - start)
+
+        if args.hosts > 1:
+            util = make_util(hosts, args)
+            util.max_concurrency = args.concurrency * args.hosts
+            start = time.perf_counter()
+            asyncio.run(util.get_embeddings_async(texts))
+            report(f"async, {args.hosts} hosts", len(texts), time.perf_counter() - start)
+    finally:
+        for server, _ in servers:
+            server.shutdown()
+
+def parse_arguments():
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Embedding throughput against stub Ollama servers')
+    parser.add_argument('--texts', type=int, default=2000, help='Number of texts to embed')
+    parser.add_argument('--sequential-texts', type=int, default=200, help='Texts used for the slow sequential path')
+    parser.add_argument('--hosts', type=int, default=4, help='Number of stub servers')
+    parser.add_argument('--latency', type=float, default=0.05, help='Stub latency per request in seconds')
+    parser.add_argument('--jitter', type=float, default=0.01, help='Stub latency jitter in seconds')
+    parser.add_argument('--batch-size', type=int, default=32, help='Texts per batch request')
+    parser.add_argument('--concurrency', type=int, default=4, help='In-flight requests per host')
+    parser.add_argument('--dim', type=int, default=768, help='Embedding dimension')
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    run_benchmark(parse_arguments())
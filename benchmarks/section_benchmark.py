@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Resume Section Segmentation Benchmark
+=====================================
+
+Compares the single-pass SectionSegmenter used by CVExtractorAgent with the
+previous per-section regex approach (two DOTALL regexes with lazy bodies per
+section, four sections per resume) on the bundled resumes and on long
+pathological inputs.
+
+Run with: python benchmarks/section_benchmark.py
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import load_resume_texts
+from utils.parser import SectionSegmenter
+
+# Header lists of the previous CVExtractorAgent.parse_resume
+LEGACY_SECTIONS = [
+    (['education', 'academic background', 'academic qualification'], ['experience', 'skills', 'projects']),
+    (['experience', 'work history', 'professional experience', 'employment'], ['education', 'skills', 'projects', 'certification']),
+    (['skills', 'technical skills', 'core competencies'], ['experience', 'education', 'projects', 'certification']),
+    (['certifications', 'certificates', 'professional certifications'], ['experience', 'education', 'skills', 'projects']),
+]
+
+def legacy_extract_section(text: str, section_headers: List[str], next_section_headers: List[str]) -> str:
+    """The previous CVExtractorAgent._extract_section implementation"""
+    section_pattern = '|'.join([rf'(?:{header})' for header in section_headers])
+    next_section_pattern = '|'.join([rf'(?:{header})' for header in next_section_headers])
+
+    for pattern in [
+        rf'(?i)({section_pattern})[:\s]*\n+(.*?)(?:\n+(?:{next_section_pattern})[:\s]*|$)',
+        rf'(?i)({section_pattern})[:\s]*(.*?)(?:(?:{next_section_pattern})[:\s]*|$)'
+    ]:
+        match = re.search(pattern, text, re.DOTALL)
+        if match:
+            return match.group(2).strip()
+
+    return ""
+
+def legacy_segment(text: str) -> None:
+    for headers, next_headers in LEGACY_SECTIONS:
+        legacy_extract_section(text, headers, next_headers)
+
+def pathological_inputs(size: int) -> List[str]:
+    """Long inputs that make the lazy regexes scan to the end repeatedly"""
+    filler = "Led cross-functional teams to deliver data platforms on time. "
+    return [
+        # A header with no following header: every lazy body runs to $
+        "Education\n" + filler * (size // len(filler)),
+        # Many header words mid-line but never on their own line
+        ("experience with skills in education projects " * (size // 48)),
+        # Thousands of short lines, mostly blank, with headers only at the top
+        "Skills\n" + "\n\n\n- item\n" * (size // 12),
+    ]
+
+def time_call(function, texts: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            function(text)
+    return (time.perf_counter() - start) / repeat
+
+def run_benchmark(args):
+    """Time both approaches on bundled and pathological inputs"""
+    segmenter = SectionSegmenter()
+    resumes = load_resume_texts()
+
+    print(f"{'input':<34} {'legacy regex':>14} {'segmenter':>12}")
+    legacy = time_call(legacy_segment, resumes, args.repeat)
+    single = time_call(segmenter.extract, resumes, args.repeat)
+    print(f"{f'{len(resumes)} bundled resumes':<34} {legacy * 1000:>12.2f}ms {single * 1000:>10.2f}ms")
+
+    for size in args.sizes:
+        for i, text in enumerate(pathological_inputs(size)):
+            legacy = time_call(legacy_segment, [text], 1)
+            single = time_call(segmenter.extract, [text], 1)
+            print(f"{f'pathological #{i + 1}, {len(text) // 1000}k chars':<34} {legacy * 1000:>12.2f}ms {single * 1000:>10.2f}ms")
+
+def parse_arguments():
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Section segmentation benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000], help='Pathological input sizes in characters')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions over the bundled resumes')
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    run_benchmark(parse_arguments())
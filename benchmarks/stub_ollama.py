@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Stub Ollama Server
+==================
+
+A stand-in for the Ollama HTTP API covering the endpoints this project uses
+(/api/embeddings, /api/embed, /api/chat, /api/tags, /api/show). Embeddings are
+deterministic hash-derived vectors and chat replies are canned JSON JD
+summaries, so benchmarks and scaling tests run offline and reproducibly.
+
+Run with: python benchmarks/stub_ollama.py --port 11434 --latency 0.05
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import hashed_embedding
+
+CANNED_SKILLS = ['Python', 'Java', 'C++', 'SQL', 'AWS', 'Azure', 'Docker', 'Kubernetes',
+                 'TensorFlow', 'PyTorch', 'JavaScript', 'React', 'Linux', 'Git']
+
+class StubConfig:
+    """Behaviour of a stub server"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, dim: int = 768, seed: int = 0, models: List[str] = None):
+        """Initialize stub configuration
+
+        Args:
+            latency: Base response delay in seconds
+            jitter: Extra uniformly distributed delay in seconds
+            error_rate: Probability of answering with HTTP 500
+            dim: Embedding dimension
+            seed: Seed for jitter and error injection
+            models: Model names reported by /api/tags
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.dim = dim
+        self.models = models or ['nomic-embed-text:latest', 'llama3:latest']
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def draw(self) -> Tuple[float, bool]:
+        """Draw this request's delay and whether it fails"""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            fail = self._random.random() < self.error_rate
+        return delay, fail
+
+def stub_embedding(text: str, dim: int) -> List[float]:
+    """Deterministic unit-length embedding for text"""
+    vector = hashed_embedding(text, dim)
+    norm = np.linalg.norm(vector)
+    return (vector / norm if norm else vector).tolist()
+
+def canned_summary(prompt: str) -> str:
+    """Deterministic JD summary for an extraction prompt"""
+    title_match = re.search(r'Job Title:\s*(.*)', prompt)
+    title = title_match.group(1).strip() if title_match else 'Unknown'
+    skills = [skill for skill in CANNED_SKILLS if re.search(rf'(?<!\w){re.escape(skill)}(?!\w)', prompt, re.IGNORECASE)]
+    years_match = re.search(r'(\d+\+?)\s*(?:years|yrs)', prompt, re.IGNORECASE)
+    summary = {
+        'required_skills': skills,
+        'years_of_experience': f"{years_match.group(1)} years" if years_match else 'N/A',
+        'education': "Bachelor's degree in Computer Science or a related field",
+        'certifications': [],
+        'responsibilities': [f"Perform the duties of a {title}"]
+    }
+    return f"```json\n{json.dumps(summary, indent=2)}\n```"
+
+class StubOllamaHandler(BaseHTTPRequestHandler):
+    """Request handler implementing the subset of the Ollama API we use"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def do_GET(self):
+        if self.path == '/api/tags':
+            models = [{'name': name, 'model': name} for name in self.server.config.models]
+            self._send_json(200, {'models': models})
+        elif self.path == '/api/version':
+            self._send_json(200, {'version': 'stub'})
+        else:
+            self._send_json(404, {'error': f"unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        config = self.server.config
+        request = self._read_json()
+        if self.path == '/api/show':
+            # Model metadata is answered immediately, like a real server
+            model = request.get('model') or request.get('name') or ''
+            capabilities = ['embedding'] if 'embed' in model else ['completion']
+            self._send_json(200, {'details': {'family': 'stub'}, 'model_info': {}, 'capabilities': capabilities})
+            return
+
+        delay, fail = config.draw()
+        time.sleep(delay)
+
+        if fail:
+            self._send_json(500, {'error': 'injected failure'})
+            return
+
+        model = request.get('model', '')
+        if self.path == '/api/embeddings':
+            self._send_json(200, {'embedding': stub_embedding(request.get('prompt', ''), config.dim)})
+        elif self.path == '/api/embed':
+            inputs = request.get('input', '')
+            if isinstance(inputs, str):
+                inputs = [inputs]
+            self._send_json(200, {'model': model, 'embeddings': [stub_embedding(text, config.dim) for text in inputs]})
+        elif self.path == '/api/chat':
+            prompt = '\n'.join(message.get('content', '') for message in request.get('messages', []))
+            self._send_json(200, {
+                'model': model,
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'message': {'role': 'assistant', 'content': canned_summary(prompt)},
+                'done': True
+            })
+        else:
+            self._send_json(404, {'error': f"unknown endpoint {self.path}"})
+
+def start_stub_server(port: int = 0, **config) -> Tuple[ThreadingHTTPServer, str]:
+    """Start a stub server on a background thread
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        **config: StubConfig options
+
+    Returns:
+        Tuple of (server, host URL); call server.shutdown() to stop it
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubOllamaHandler)
+    server.daemon_threads = True
+    server.config = StubConfig(**config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def parse_arguments():
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Stub Ollama server for offline benchmarks')
+    parser.add_argument('--port', type=int, default=11434, help='Port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0, help='Base response delay in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random delay in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probability of an HTTP 500 response')
+    parser.add_argument('--dim', type=int, default=768, help='Embedding dimension')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for jitter and errors')
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), StubOllamaHandler)
+    server.config = StubConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, dim=args.dim, seed=args.seed)
+    print(f"Stub Ollama listening on http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,3 @@
+# test_db.py and test_ollama.py are manual scripts that run on import (the
+# latter needs a live Ollama server); the pytest suite lives in tests/
+collect_ignore = ['test_db.py', 'test_ollama.py']
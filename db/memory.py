@@ -2,7 +2,8 @@ import sqlite3
 import os
 import json
 import threading
-from typing import Dict, List, Any, Tuple
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
 
 class MemoryDB:
     def __init__(self, db_path="memory.db"):
@@ -11,6 +12,14 @@ class MemoryDB:
         self._local = threading.local()
         self.setup_tables()
     
+    def __getstate__(self):
+        # Connections can't be pickled; worker processes open their own
+        return {'db_path': self.db_path}
+    
+    def __setstate__(self, state):
+        self.db_path = state['db_path']
+        self._local = threading.local()
+    
     def get_connection(self):
         """Get thread-local connection"""
         if not hasattr(self._local, 'conn') or self._local.conn is None:
@@ -24,6 +33,11 @@ class MemoryDB:
             self._local.cursor = self.get_connection().cursor()
         return self._local.cursor
     
+    def get_index_path(self, name: str) -> str:
+        """Get path for an index file persisted alongside the database"""
+        base, _ = os.path.splitext(self.db_path)
+        return f"{base}_{name}.npz"
+    
     def connect(self):
         """Establish connection to SQLite database (for backwards compatibility)"""
         return self.get_connection(), self.get_cursor()
@@ -60,7 +74,47 @@ class MemoryDB:
             skills TEXT,
             certifications TEXT,
             tech_stack TEXT,
-            raw_text TEXT
+            raw_text TEXT,
+            truncated INTEGER DEFAULT 0
+        )
+        ''')
+        self._add_missing_column(cursor, 'cv_data', 'truncated', 'INTEGER DEFAULT 0')
+        
+        # Resume ingestion manifest (one row per PDF path)
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_manifest (
+            path TEXT PRIMARY KEY,
+            size INTEGER,
+            mtime REAL,
+            content_hash TEXT,
+            cv_id INTEGER,
+            status TEXT DEFAULT 'active',
+            updated_at TEXT,
+            FOREIGN KEY (cv_id) REFERENCES cv_data (id)
+        )
+        ''')
+        
+        # Parsed-CV cache: PDF content hash -> shared cv_data row
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cv_parse_cache (
+            content_hash TEXT,
+            parser_version INTEGER,
+            cv_id INTEGER,
+            created_at TEXT,
+            PRIMARY KEY (content_hash, parser_version),
+            FOREIGN KEY (cv_id) REFERENCES cv_data (id)
+        )
+        ''')
+        
+        # LLM JD summaries keyed by JD content, chat model and prompt version
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS jd_summary_cache (
+            jd_hash TEXT,
+            model TEXT,
+            prompt_version INTEGER,
+            summary TEXT,
+            created_at TEXT,
+            PRIMARY KEY (jd_hash, model, prompt_version)
         )
         ''')
         
@@ -71,10 +125,13 @@ class MemoryDB:
             jd_id INTEGER,
             cv_id INTEGER,
             score REAL,
+            filename TEXT,
             FOREIGN KEY (jd_id) REFERENCES jd_summaries (id),
             FOREIGN KEY (cv_id) REFERENCES cv_data (id)
         )
         ''')
+        # Identical PDFs share a cv_data row, so rows name the resume file
+        self._add_missing_column(cursor, 'match_scores', 'filename', 'TEXT')
         
         # Shortlisted Candidates table
         cursor.execute('''
@@ -86,14 +143,22 @@ class MemoryDB:
             score REAL,
             email_sent INTEGER DEFAULT 0,
             email_sent_date TEXT,
+            filename TEXT,
             FOREIGN KEY (match_id) REFERENCES match_scores (id),
             FOREIGN KEY (jd_id) REFERENCES jd_summaries (id),
             FOREIGN KEY (cv_id) REFERENCES cv_data (id)
         )
         ''')
+        self._add_missing_column(cursor, 'shortlist', 'filename', 'TEXT')
         
         conn.commit()
     
+    def _add_missing_column(self, cursor, table: str, column: str, definition: str) -> None:
+        """Add a column to a table created by an older version of the schema"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in {row['name'] for row in cursor.fetchall()}:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    
     def insert_jd_summary(self, job_title: str, data: Dict[str, Any]) -> int:
         """Insert JD summary into database"""
         conn = self.get_connection()
@@ -129,8 +194,8 @@ class MemoryDB:
         
         query = '''
         INSERT INTO cv_data
-        (filename, name, email, phone, education, work_experience, skills, certifications, tech_stack, raw_text)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        (filename, name, email, phone, education, work_experience, skills, certifications, tech_stack, raw_text, truncated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
         
         # Convert lists to JSON strings, leave other types as-is
@@ -148,36 +213,37 @@ class MemoryDB:
             skills,
             certifications,
             tech_stack,
-            data.get('raw_text', '')
+            data.get('raw_text', ''),
+            int(bool(data.get('truncated')))
         ))
         conn.commit()
         return cursor.lastrowid
     
-    def insert_match_score(self, jd_id: int, cv_id: int, score: float) -> int:
-        """Insert match score between JD and CV"""
+    def insert_match_score(self, jd_id: int, cv_id: int, score: float, filename: Optional[str] = None) -> int:
+        """Insert match score between JD and CV (filename: the resume file scored)"""
         conn = self.get_connection()
         cursor = self.get_cursor()
         
         query = '''
         INSERT INTO match_scores
-        (jd_id, cv_id, score)
-        VALUES (?, ?, ?)
+        (jd_id, cv_id, score, filename)
+        VALUES (?, ?, ?, ?)
         '''
-        cursor.execute(query, (jd_id, cv_id, score))
+        cursor.execute(query, (jd_id, cv_id, score, filename))
         conn.commit()
         return cursor.lastrowid
     
-    def insert_shortlisted(self, match_id: int, jd_id: int, cv_id: int, score: float) -> int:
-        """Insert shortlisted candidate"""
+    def insert_shortlisted(self, match_id: int, jd_id: int, cv_id: int, score: float, filename: Optional[str] = None) -> int:
+        """Insert shortlisted candidate (filename: the resume file shortlisted)"""
         conn = self.get_connection()
         cursor = self.get_cursor()
         
         query = '''
         INSERT INTO shortlist
-        (match_id, jd_id, cv_id, score)
-        VALUES (?, ?, ?, ?)
+        (match_id, jd_id, cv_id, score, filename)
+        VALUES (?, ?, ?, ?, ?)
         '''
-        cursor.execute(query, (match_id, jd_id, cv_id, score))
+        cursor.execute(query, (match_id, jd_id, cv_id, score, filename))
         conn.commit()
         return cursor.lastrowid
     
@@ -194,6 +260,90 @@ class MemoryDB:
         cursor.execute(query, (sent_date, shortlist_id))
         conn.commit()
     
+    def get_resume_manifest(self) -> Dict[str, Dict]:
+        """Get ingestion manifest entries keyed by PDF path"""
+        cursor = self.get_cursor()
+        
+        cursor.execute("SELECT * FROM resume_manifest")
+        return {row['path']: dict(row) for row in cursor.fetchall()}
+    
+    def upsert_manifest_entry(self, path: str, size: int, mtime: float, content_hash: str, cv_id: int) -> None:
+        """Record the current state of an ingested PDF"""
+        conn = self.get_connection()
+        cursor = self.get_cursor()
+        
+        query = '''
+        INSERT OR REPLACE INTO resume_manifest
+        (path, size, mtime, content_hash, cv_id, status, updated_at)
+        VALUES (?, ?, ?, ?, ?, 'active', ?)
+        '''
+        cursor.execute(query, (path, size, mtime, content_hash, cv_id, datetime.now().isoformat()))
+        conn.commit()
+    
+    def mark_manifest_removed(self, paths: List[str]) -> None:
+        """Mark PDFs that disappeared from disk as removed"""
+        conn = self.get_connection()
+        cursor = self.get_cursor()
+        
+        query = '''
+        UPDATE resume_manifest
+        SET status = 'removed', updated_at = ?
+        WHERE path = ?
+        '''
+        now = datetime.now().isoformat()
+        cursor.executemany(query, [(now, path) for path in paths])
+        conn.commit()
+    
+    def get_cached_cv_id(self, content_hash: str, parser_version: int) -> Optional[int]:
+        """Get the cv_data id parsed from a PDF with this content hash"""
+        cursor = self.get_cursor()
+        
+        query = "SELECT cv_id FROM cv_parse_cache WHERE content_hash = ? AND parser_version = ?"
+        cursor.execute(query, (content_hash, parser_version))
+        result = cursor.fetchone()
+        return result['cv_id'] if result else None
+    
+    def get_cached_cv(self, content_hash: str, parser_version: int) -> Optional[Dict]:
+        """Get the CV data parsed from a PDF with this content hash"""
+        cv_id = self.get_cached_cv_id(content_hash, parser_version)
+        return self.get_cv_data(cv_id) if cv_id is not None else None
+    
+    def cache_parsed_cv(self, content_hash: str, parser_version: int, cv_id: int) -> None:
+        """Record which cv_data row was parsed from a PDF's content"""
+        conn = self.get_connection()
+        cursor = self.get_cursor()
+        
+        query = '''
+        INSERT OR REPLACE INTO cv_parse_cache
+        (content_hash, parser_version, cv_id, created_at)
+        VALUES (?, ?, ?, ?)
+        '''
+        cursor.execute(query, (content_hash, parser_version, cv_id, datetime.now().isoformat()))
+        conn.commit()
+    
+    def get_cached_jd_summary(self, jd_hash: str, model: str, prompt_version: int) -> Optional[Dict]:
+        """Get a stored LLM summary for a JD, or None if it was never summarized
+        with this model and prompt version"""
+        cursor = self.get_cursor()
+        
+        query = "SELECT summary FROM jd_summary_cache WHERE jd_hash = ? AND model = ? AND prompt_version = ?"
+        cursor.execute(query, (jd_hash, model, prompt_version))
+        result = cursor.fetchone()
+        return json.loads(result['summary']) if result else None
+    
+    def cache_jd_summary(self, jd_hash: str, model: str, prompt_version: int, summary: Dict[str, Any]) -> None:
+        """Store an LLM summary for a JD"""
+        conn = self.get_connection()
+        cursor = self.get_cursor()
+        
+        query = '''
+        INSERT OR REPLACE INTO jd_summary_cache
+        (jd_hash, model, prompt_version, summary, created_at)
+        VALUES (?, ?, ?, ?, ?)
+        '''
+        cursor.execute(query, (jd_hash, model, prompt_version, json.dumps(summary), datetime.now().isoformat()))
+        conn.commit()
+    
     def get_jd_summary(self, jd_id: int) -> Dict:
         """Get JD summary by ID"""
         cursor = self.get_cursor()
@@ -335,7 +485,7 @@ class MemoryDB:
         cursor = self.get_cursor()
         
         query = '''
-        SELECT s.id as shortlist_id, s.score, j.job_title, j.required_skills,
+        SELECT s.id as shortlist_id, s.score, s.filename, j.job_title, j.required_skills,
                c.name, c.email, c.skills
         FROM shortlist s
         JOIN jd_summaries j ON s.jd_id = j.id
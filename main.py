@@ -11,12 +11,13 @@ This system enhances job screening by:
 5. Generating personalized interview emails
 
 Run with: python main.py
+Watch for new resumes with: python main.py --watch
 """
 
 import os
 import sys
 import time
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import argparse
 from datetime import datetime
 
@@ -29,8 +30,189 @@ from agents.emailer import EmailerAgent
 
 # Import utilities
 from utils.diagram import DiagramGenerator
+from utils.folder_watcher import FolderWatcher
+from utils.dedup import NearDuplicateDetector
+from utils.archive_reader import ARCHIVE_EXTENSIONS, is_archive
+from utils.ollama_clients import get_client_manager
 from db.memory import MemoryDB
 
+def match_and_shortlist(db: MemoryDB, matcher: MatcherAgent, shortlister: ShortlisterAgent,
+                        jd_summaries: List[Dict[str, Any]], jd_ids: Dict[str, int],
+                        cv_data_list: List[Dict[str, Any]], top_n: Optional[int] = None) -> Tuple[Dict, Dict]:
+    """Score CVs against every JD, shortlist, and store both in the database
+    
+    Args:
+        db: Database
+        matcher: Matcher agent
+        shortlister: Shortlister agent
+        jd_summaries: Summarized JDs ({'title', 'summary'})
+        jd_ids: jd_summaries row id by job title
+        cv_data_list: Ingested CVs, each with its cv_data 'id'
+        top_n: Retrieve only this many candidates per JD from the CV
+            nearest-neighbour index instead of scoring every CV; cv_data_list
+            must then be the full CV pool, as CVs missing from it are dropped
+            from the index
+        
+    Returns:
+        Tuple of (all matches, shortlisted candidates), keyed by job title
+    """
+    print("\n🔍 Running Matcher Agent...")
+    if top_n:
+        all_matches = matcher.get_top_matches(top_n=top_n, jd_data_list=jd_summaries, cv_data_list=cv_data_list)
+    else:
+        all_matches = matcher.match_all_jds_with_all_cvs(jd_summaries, cv_data_list)
+        
+        # Keep the CV nearest-neighbour index up to date for top-n retrieval
+        matcher.index_cvs(cv_data_list)
+    
+    # Store match scores in database
+    match_ids = {}
+    for job_title, matches in all_matches.items():
+        jd_id = jd_ids[job_title]
+        print(f"  ✓ Generated {len(matches)} matches for: {job_title}")
+        
+        for cv_data, score in matches:
+            # Keyed by file: copies of one PDF share a cv_data id
+            match_key = (job_title, cv_data['filename'])
+            if match_key in match_ids:
+                continue
+            match_ids[match_key] = db.insert_match_score(jd_id, cv_data['id'], score, cv_data['filename'])
+    
+    print("\n👑 Running Shortlister Agent...")
+    shortlisted = shortlister.shortlist_candidates(all_matches)
+    shortlister.print_shortlist_summary(shortlisted)
+    
+    # Store shortlisted candidates in database
+    for job_title, candidates in shortlisted.items():
+        jd_id = jd_ids[job_title]
+        
+        for cv_data, score in candidates:
+            match_id = match_ids[(job_title, cv_data['filename'])]
+            
+            db.insert_shortlisted(match_id, jd_id, cv_data['id'], score, cv_data['filename'])
+            print(f"  ✓ Shortlisted: {cv_data['name']} for {job_title} (Score: {score:.2f}%)")
+    
+    return all_matches, shortlisted
+
+def load_stored_jds(db: MemoryDB) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Load the latest stored summary for each job title
+    
+    Args:
+        db: Database
+        
+    Returns:
+        Tuple of (summarized JDs, jd_summaries row id by job title)
+    """
+    latest = {}
+    for row in db.get_all_jds():
+        # Each pipeline run stores the catalogue again; keep the newest
+        if row['job_title'] not in latest or row['id'] > latest[row['job_title']]['id']:
+            latest[row['job_title']] = row
+    
+    jd_summaries = []
+    jd_ids = {}
+    for job_title, row in latest.items():
+        jd_summaries.append({
+            'title': job_title,
+            'summary': {field: row.get(field) or default for field, default in (
+                ('required_skills', []),
+                ('years_of_experience', 'N/A'),
+                ('education', 'N/A'),
+                ('certifications', []),
+                ('responsibilities', [])
+            )}
+        })
+        jd_ids[job_title] = row['id']
+    
+    return jd_summaries, jd_ids
+
+def report_contacts(contacts: List[Dict[str, Any]]) -> None:
+    """List new candidates from the first-page pass while full parsing runs"""
+    print(f"\n👤 {len(contacts)} new or changed resumes, contact details first:")
+    seen = {}
+    for contact in contacts:
+        email = (contact.get('email') or '').lower()
+        note = f" (same email as {seen[email]})" if email and email in seen else ''
+        seen.setdefault(email, contact['filename'])
+        print(f"  • {contact['name'] or 'Unknown'} <{contact['email'] or 'no email'}> {contact['phone']} - {contact['filename']}{note}")
+    print("  Parsing the full resumes...")
+
+def report_models() -> None:
+    """Discover local Ollama models once at startup and show the routing"""
+    print("\n🧠 Discovering Ollama models...")
+    models = get_client_manager().models
+    if models.discover() is None:
+        print("  Ollama unreachable, JDs will use rule-based extraction")
+        return
+    print(f"  Chat: {models.chat_model or 'none available, JDs will use rule-based extraction'}")
+    print(f"  Embeddings: {models.embedding_model}")
+
+def run_watch(args):
+    """Watch the resumes directory and screen each new resume as it arrives"""
+    print("🤖 Starting Job Screening Watch Mode 🤖")
+    print("=======================================")
+    
+    if not os.path.isdir(args.resumes_dir):
+        print(f"Watch mode needs a directory, got {args.resumes_dir}")
+        return
+    
+    db = MemoryDB(args.db_file)
+    report_models()
+    
+    # Score against the stored JD catalogue, summarizing it once if it is empty
+    jd_summaries, jd_ids = load_stored_jds(db)
+    if not jd_summaries:
+        print("\n📝 No stored JDs, running JD Summarizer Agent...")
+        jd_agent = JDSummarizerAgent(args.jd_file, max_concurrency=args.jd_concurrency, timeout=args.jd_timeout, cache=db)
+        for jd in jd_agent.process_all_jds(concurrent=args.jd_concurrency > 1):
+            db.insert_jd_summary(jd['title'], jd['summary'])
+        jd_summaries, jd_ids = load_stored_jds(db)
+    print(f"\n📝 Screening against {len(jd_summaries)} job descriptions")
+    
+    cv_agent = CVExtractorAgent(args.resumes_dir, max_workers=args.workers, parse_cache=db)
+    matcher = MatcherAgent(index_path=db.get_index_path('cv_index'))
+    shortlister = ShortlisterAgent(threshold=args.threshold)
+    
+    on_contacts = report_contacts if args.contacts_first else None
+    
+    def screen(resume_files: List[str]) -> None:
+        new_cvs = cv_agent.ingest_files(db, resume_files, force=args.reprocess_all, on_contacts=on_contacts)
+        for cv_data in new_cvs:
+            print(f"  ✓ Processed and stored: {cv_data['filename']} ({cv_data['name']})")
+        if new_cvs:
+            match_and_shortlist(db, matcher, shortlister, jd_summaries, jd_ids, new_cvs)
+    
+    # Start the watch before catching up so nothing arriving meanwhile is missed
+    watcher = FolderWatcher(args.resumes_dir, extensions=('.pdf',) + ARCHIVE_EXTENSIONS, debounce=args.debounce)
+    
+    print(f"\n📄 Catching up on {args.resumes_dir}...")
+    screen(sorted(cv_agent.get_resume_files()))
+    
+    print(f"\n👀 Watching {args.resumes_dir} ({watcher.mode}), press Ctrl+C to stop")
+    try:
+        for filenames in watcher.watch():
+            started = time.time()
+            resume_files = []
+            for filename in filenames:
+                if is_archive(filename):
+                    resume_files.extend(cv_agent.get_archive_members(filename))
+                else:
+                    resume_files.append(filename)
+            
+            print(f"\n📄 {len(filenames)} new or changed file(s): {', '.join(filenames)}")
+            try:
+                screen(resume_files)
+            except Exception as e:
+                # Keep the daemon alive; the files are retried when they next change
+                print(f"  ✗ Error screening {', '.join(filenames)}: {str(e)}")
+                continue
+            print(f"  ⏱ Screened in {time.time() - started:.1f}s")
+    except KeyboardInterrupt:
+        print("\n👋 Stopping watch mode")
+    finally:
+        watcher.close()
+        db.close()
+
 def run_pipeline(args):
     """Run the entire job screening pipeline"""
     print("🤖 Starting Multi-Agent Job Screening System 🤖")
@@ -39,11 +221,14 @@ def run_pipeline(args):
     # Initialize database
     print("\n📊 Initializing database...")
     db = MemoryDB(args.db_file)
+    report_models()
     
     # Step 1: Parse and summarize job descriptions
     print("\n📝 Running JD Summarizer Agent...")
-    jd_agent = JDSummarizerAgent(args.jd_file)
-    jd_summaries = jd_agent.process_all_jds()
+    jd_agent = JDSummarizerAgent(args.jd_file, max_concurrency=args.jd_concurrency, timeout=args.jd_timeout, cache=db)
+    jd_summaries = jd_agent.process_all_jds(concurrent=args.jd_concurrency > 1)
+    print(f"  {jd_agent.rules_only} of {len(jd_summaries)} JDs summarized by rules alone, {jd_agent.llm_calls} LLM calls ({jd_agent.repairs} repairs)")
+    print(f"  JD summary cache: {jd_agent.cache_hits} hits, {jd_agent.cache_misses} misses")
     
     # Store JD summaries in database
     jd_ids = {}
@@ -55,53 +240,30 @@ def run_pipeline(args):
     
     # Step 2: Extract data from resumes
     print("\n📄 Running CV Extractor Agent...")
-    cv_agent = CVExtractorAgent(args.resumes_dir)
-    cv_data_list = cv_agent.process_all_resumes()
+    cv_agent = CVExtractorAgent(args.resumes_dir, max_workers=args.workers, parse_cache=db)
     
-    # Store CV data in database
-    cv_ids = {}
-    for cv_data in cv_data_list:
-        filename = cv_data['filename']
-        cv_id = db.insert_cv_data(filename, cv_data)
-        cv_ids[filename] = cv_id
-        print(f"  ✓ Processed and stored: {filename} ({cv_data['name']})")
+    # Only new or changed PDFs are extracted and stored; the rest are reused
+    cv_data_list = cv_agent.ingest_resumes(db, force=args.reprocess_all,
+                                           on_contacts=report_contacts if args.contacts_first else None)
     
-    # Step 3: Match JDs with CVs
-    print("\n🔍 Running Matcher Agent...")
-    matcher = MatcherAgent()
-    all_matches = matcher.match_all_jds_with_all_cvs(jd_summaries, cv_data_list)
+    for cv_data in cv_data_list:
+        print(f"  ✓ Processed and stored: {cv_data['filename']} ({cv_data['name']})")
     
-    # Store match scores in database
-    match_ids = {}
-    for job_title, matches in all_matches.items():
-        jd_id = jd_ids[job_title]
-        print(f"  ✓ Generated {len(matches)} matches for: {job_title}")
-        
-        for cv_data, score in matches:
-            filename = cv_data['filename']
-            cv_id = cv_ids[filename]
-            match_id = db.insert_match_score(jd_id, cv_id, score)
-            match_key = f"{job_title}_{filename}"
-            match_ids[match_key] = match_id
+    # Collapse near-duplicate resumes so each candidate is embedded and scored once
+    if not args.no_dedup:
+        print("\n🧬 Detecting near-duplicate resumes...")
+        detector = NearDuplicateDetector(threshold=args.dedup_threshold)
+        representatives, duplicates = detector.deduplicate(cv_data_list)
+        for representative, indices in duplicates.items():
+            names = ', '.join(cv_data_list[i]['filename'] for i in indices)
+            print(f"  ✓ {cv_data_list[representative]['filename']} stands in for: {names}")
+        print(f"  ✓ Matching {len(representatives)} of {len(cv_data_list)} resumes")
+        cv_data_list = representatives
     
-    # Step 4: Shortlist candidates
-    print("\n👑 Running Shortlister Agent...")
+    # Steps 3 and 4: Match JDs with CVs and shortlist candidates
+    matcher = MatcherAgent(index_path=db.get_index_path('cv_index'), quantization=args.quantize)
     shortlister = ShortlisterAgent(threshold=args.threshold)
-    shortlisted = shortlister.shortlist_candidates(all_matches)
-    shortlister.print_shortlist_summary(shortlisted)
-    
-    # Store shortlisted candidates in database
-    for job_title, candidates in shortlisted.items():
-        jd_id = jd_ids[job_title]
-        
-        for cv_data, score in candidates:
-            filename = cv_data['filename']
-            cv_id = cv_ids[filename]
-            match_key = f"{job_title}_{filename}"
-            match_id = match_ids[match_key]
-            
-            db.insert_shortlisted(match_id, jd_id, cv_id, score)
-            print(f"  ✓ Shortlisted: {cv_data['name']} for {job_title} (Score: {score:.2f}%)")
+    all_matches, shortlisted = match_and_shortlist(db, matcher, shortlister, jd_summaries, jd_ids, cv_data_list, top_n=args.top_n)
     
     # Step 5: Send interview invitations
     if args.send_emails:
@@ -154,8 +316,35 @@ def parse_arguments():
     parser.add_argument('--jd-file', type=str, default='job_description.csv',
                         help='Path to job descriptions CSV file')
     
+    parser.add_argument('--jd-concurrency', type=int, default=4,
+                        help='Maximum JD summarization requests in flight (1 summarizes one at a time)')
+    
+    parser.add_argument('--jd-timeout', type=float, default=120.0,
+                        help='Seconds to wait for each JD summary before falling back to rule-based extraction')
+    
     parser.add_argument('--resumes-dir', type=str, default='resumes',
-                        help='Directory containing resume PDFs')
+                        help='Directory containing resume PDFs or zip/tar archives, or a single archive')
+    
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Number of processes used to extract resumes')
+    
+    parser.add_argument('--reprocess-all', action='store_true',
+                        help='Re-extract every resume even if unchanged since the last run')
+    
+    parser.add_argument('--contacts-first', action='store_true',
+                        help='List new candidates from the first page of each resume before the full parse finishes')
+    
+    parser.add_argument('--dedup-threshold', type=float, default=0.8,
+                        help='Estimated text similarity (0-1) above which resumes count as near-duplicates')
+    
+    parser.add_argument('--no-dedup', action='store_true',
+                        help='Match every resume, including near-duplicates')
+    
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and screen new resumes as they appear in --resumes-dir')
+    
+    parser.add_argument('--debounce', type=float, default=2.0,
+                        help='Seconds a new resume must stay unchanged before watch mode reads it')
     
     parser.add_argument('--db-file', type=str, default='memory.db',
                         help='SQLite database file path')
@@ -163,6 +352,12 @@ def parse_arguments():
     parser.add_argument('--threshold', type=float, default=80.0,
                         help='Minimum score threshold for shortlisting (0-100)')
     
+    parser.add_argument('--top-n', type=int, default=None,
+                        help='Retrieve only the N closest CVs per JD from the nearest-neighbour index instead of scoring every CV (ignored in watch mode)')
+    
+    parser.add_argument('--quantize', type=str, choices=['int8', 'binary'], default=None,
+                        help='With --top-n, scan quantized CV embeddings with exact re-ranking instead of using the nearest-neighbour index')
+    
     parser.add_argument('--send-emails', action='store_true',
                         help='Send interview invitation emails')
     
@@ -174,4 +369,7 @@ def parse_arguments():
 
 if __name__ == "__main__":
     args = parse_arguments()
-    run_pipeline(args) 
\ No newline at end of file
+    if args.watch:
+        run_watch(args)
+    else:
+        run_pipeline(args) 
\ No newline at end of file
@@ -0,0 +1,85 @@
+import zipfile
+import zlib
+from contextlib import contextmanager
+
+import fitz
+import numpy as np
+import pytest
+
+from agents.matcher import MatcherAgent
+from benchmarks.stub_ollama import start_stub_server
+from utils.quantization import QuantizedEmbeddings
+
+def make_pdf(text: str) -> bytes:
+    """Single-page PDF containing text"""
+    document = fitz.open()
+    page = document.new_page()
+    page.insert_text((72, 72), text)
+    data = document.tobytes()
+    document.close()
+    return data
+
+def resume_text(i: int) -> str:
+    """Resume text with a unique email and phone number"""
+    return f"Jane Doe\njane{i}@example.com\n555-123-{i:04d}\nSkills\nPython, SQL, Docker"
+
+@pytest.fixture
+def resume_zip(tmp_path):
+    """Directory holding drop.zip with 120 one-page resume PDFs"""
+    with zipfile.ZipFile(tmp_path / 'drop.zip', 'w', zipfile.ZIP_DEFLATED) as archive:
+        for i in range(120):
+            archive.writestr(f"candidates/c{i:03d}.pdf", make_pdf(resume_text(i)))
+    return tmp_path
+
+class FakeEmbeddingUtil:
+    """Deterministic stand-in for EmbeddingUtil, keyed by filename or title
+
+    Texts listed in failing get the zero-vector fallback, as if their batch
+    failed.
+    """
+
+    def __init__(self, dim: int = 16):
+        self.dim = dim
+        self.failing = set()
+        self.embedded = []
+
+    def vector(self, key: str):
+        return np.random.default_rng(zlib.crc32(key.encode())).normal(size=self.dim).tolist()
+
+    def get_cv_embeddings(self, cv_data_list):
+        self.embedded.extend(cv['filename'] for cv in cv_data_list)
+        return [[0.0] * self.dim if cv['filename'] in self.failing else self.vector(cv['filename']) for cv in cv_data_list]
+
+    def get_jd_embeddings(self, jd_data_list):
+        return [self.vector(jd['title']) for jd in jd_data_list]
+
+    def is_degraded(self):
+        return False
+
+    def quantize(self, embeddings, method='int8', originals_path=None):
+        return QuantizedEmbeddings(embeddings, method=method, originals_path=originals_path)
+
+@pytest.fixture
+def make_matcher(tmp_path, monkeypatch):
+    """Build MatcherAgents backed by FakeEmbeddingUtil, with files in tmp_path"""
+    monkeypatch.chdir(tmp_path)
+
+    def make(embedding_util=None, **kwargs):
+        matcher = MatcherAgent(**kwargs)
+        matcher.embedding_util = embedding_util or FakeEmbeddingUtil()
+        return matcher
+    return make
+
+def cv(i: int, content_hash: str = None):
+    """Minimal CV record"""
+    return {'filename': f"c{i:02d}.pdf", 'content_hash': content_hash or f"h{i}", 'name': f"Candidate {i}", 'skills': ''}
+
+@contextmanager
+def stub_server(**config):
+    """Run benchmarks/stub_ollama.py on a free port, yielding (server, host URL)"""
+    server, host = start_stub_server(**config)
+    try:
+        yield server, host
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from utils.ann_index import IVFIndex
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).normal(size=(400, 16)).astype(np.float32)
+
+def ids(n):
+    return [f"cv{i}" for i in range(n)]
+
+def exact_top(vectors, query, k):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [f"cv{i}" for i in np.argsort(-(normalized @ query))[:k]]
+
+def test_untrained_index_is_exact(vectors):
+    index = IVFIndex()
+    index.add(ids(len(vectors)), vectors)
+    assert not index.is_trained
+    query = vectors[7] / np.linalg.norm(vectors[7])
+    assert [item_id for item_id, _ in index.search(query, 5)] == exact_top(vectors, query, 5)
+    assert index.search(query, 1)[0][1] == pytest.approx(100.0, abs=1e-3)
+
+def test_trained_index_probing_every_list_is_exact(vectors):
+    index = IVFIndex(n_lists=8, min_train_size=100)
+    index.add(ids(len(vectors)), vectors)
+    assert index.is_trained and len(index.centroids) == 8
+    query = vectors[3] / np.linalg.norm(vectors[3])
+    assert [item_id for item_id, _ in index.search(query, 10, n_probe=8)] == exact_top(vectors, query, 10)
+    assert index.search(query, 1, n_probe=1)[0][0] == 'cv3'
+
+def test_replace_and_remove(vectors):
+    index = IVFIndex()
+    index.add(ids(3), vectors[:3], hashes=['a', 'b', 'c'])
+    index.add(['cv1'], vectors[3:4], hashes=['b2'])
+    assert index.ids == ['cv0', 'cv1', 'cv2'] and index.hashes['cv1'] == 'b2'
+    np.testing.assert_allclose(index.vectors[1], vectors[3] / np.linalg.norm(vectors[3]), rtol=1e-6)
+
+    index.remove(['cv0', 'unknown'])
+    assert index.ids == ['cv1', 'cv2'] and 'cv0' not in index.hashes
+    index.remove(['cv1', 'cv2'])
+    assert len(index) == 0 and index.dim is None and index.search(vectors[0], 3) == []
+
+def test_dimension_mismatch_is_rejected(vectors):
+    index = IVFIndex()
+    index.add(ids(2), vectors[:2])
+    with pytest.raises(ValueError):
+        index.add(['other'], [[1.0, 2.0]])
+
+def test_save_and_load_round_trip(vectors, tmp_path):
+    path = str(tmp_path / 'index.npz')
+    index = IVFIndex(n_lists=4, min_train_size=50)
+    index.add(ids(100), vectors[:100], hashes=[f"h{i}" for i in range(100)])
+    index.save(path)
+
+    loaded = IVFIndex.load(path)
+    assert loaded.ids == index.ids and loaded.hashes == index.hashes
+    assert loaded.trained_size == 100 and loaded.n_lists == 4
+    assert loaded.search(vectors[5], 3) == index.search(vectors[5], 3)
@@ -0,0 +1,29 @@
+import os
+
+from agents.cv_extractor import CVExtractorAgent
+from utils.archive_reader import MEMBER_SEPARATOR, open_archive, split_member
+
+def test_split_member():
+    assert split_member(f"drop.zip{MEMBER_SEPARATOR}a/b.pdf") == ('drop.zip', 'a/b.pdf')
+    assert split_member('plain.pdf') == (None, 'plain.pdf')
+
+def test_open_archive_is_cached(resume_zip):
+    path = os.path.join(resume_zip, 'drop.zip')
+    assert open_archive(path) is open_archive(path)
+    assert len(open_archive(path).pdf_members()) == 120
+
+def test_contact_pass_with_workers_reads_every_member(resume_zip):
+    agent = CVExtractorAgent(str(resume_zip), max_workers=4, chunksize=2)
+    # Listing opens the archive in the parent before the workers fork
+    resume_files = sorted(agent.get_resume_files())
+    assert len(resume_files) == 120
+
+    contacts, full_pass = agent.process_resumes_two_tier(resume_files)
+
+    assert [contact['email'] for contact in contacts] == [f"jane{i}@example.com" for i in range(120)]
+    assert all(record['email'] and record['skills'] for record in full_pass.result(timeout=120))
+
+def test_process_resumes_with_workers_streams_archive(resume_zip):
+    agent = CVExtractorAgent(str(resume_zip), max_workers=4)
+    parsed_resumes = agent.process_all_resumes()
+    assert [record['email'] for record in parsed_resumes] == [f"jane{i}@example.com" for i in range(120)]
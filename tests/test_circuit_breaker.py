@@ -0,0 +1,47 @@
+import ollama
+
+from utils.circuit_breaker import CircuitBreaker, is_ollama_outage
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker('test', failure_threshold=3, cooldown=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and breaker.degraded
+    assert not breaker.allow_request()
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker('test', failure_threshold=1, cooldown=0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and not breaker.degraded
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker('test', failure_threshold=1, cooldown=60)
+    breaker.record_failure()
+    breaker._opened_at -= 60
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow_request()
+
+def test_client_errors_are_not_outages():
+    assert not is_ollama_outage(ollama.ResponseError('model not found', 404))
+    assert is_ollama_outage(ollama.ResponseError('server error', 500))
+    assert is_ollama_outage(ConnectionError('refused'))
+
+    breaker = CircuitBreaker('test', failure_threshold=1, is_failure=is_ollama_outage)
+    breaker.record_exception(ollama.ResponseError('model not found', 404))
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_exception(ConnectionError('refused'))
+    assert breaker.state == CircuitBreaker.OPEN
+    breaker.reset()
+    assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,106 @@
+import os
+
+from agents.cv_extractor import CVExtractorAgent
+from conftest import make_pdf, resume_text
+from db.memory import MemoryDB
+
+def write_resumes(directory, count):
+    for i in range(count):
+        (directory / f"r{i}.pdf").write_bytes(make_pdf(resume_text(i)))
+
+def tracked(agent):
+    """Record the filenames each process_resumes call gets"""
+    calls = []
+    process_resumes = agent.process_resumes
+    agent.process_resumes = lambda files, worker=None: calls.append(sorted(files)) or process_resumes(files, worker)
+    return calls
+
+def test_ingest_contacts_first(resume_zip, tmp_path_factory):
+    (resume_zip / 'plain.pdf').write_bytes(make_pdf(resume_text(999)))
+    db = MemoryDB(str(tmp_path_factory.mktemp('db') / 'memory.db'))
+    agent = CVExtractorAgent(str(resume_zip), max_workers=2)
+    batches = []
+
+    cv_data_list = agent.ingest_resumes(db, on_contacts=batches.append)
+
+    assert len(batches) == 1 and len(batches[0]) == 121
+    assert all(contact['partial'] and contact['email'] for contact in batches[0])
+    assert all(cv_data['id'] and cv_data['skills'] for cv_data in cv_data_list)
+
+    # Unchanged resumes are reused, so there is nothing to list
+    batches.clear()
+    agent.ingest_resumes(db, on_contacts=batches.append)
+    assert batches == []
+    db.close()
+
+def test_contact_pass_reads_only_the_first_page(tmp_path):
+    (tmp_path / 'a.pdf').write_bytes(make_pdf(resume_text(1)))
+    contact = CVExtractorAgent(str(tmp_path)).process_resume_contacts('a.pdf')
+    assert contact['email'] == 'jane1@example.com'
+    assert contact['partial'] and contact['skills'] == ''
+
+def test_parallel_processing_matches_sequential(tmp_path):
+    write_resumes(tmp_path, 9)
+    (tmp_path / 'broken.pdf').write_bytes(b'not a pdf')
+    files = sorted(os.listdir(tmp_path))
+
+    sequential = CVExtractorAgent(str(tmp_path)).process_resumes(files)
+    parallel = CVExtractorAgent(str(tmp_path), max_workers=3, chunksize=2).process_resumes(files)
+
+    assert parallel == sequential
+    assert [cv_data['filename'] for cv_data in parallel] == files
+    assert [cv_data['email'] for cv_data in parallel[1:]] == [f"jane{i}@example.com" for i in range(9)]
+
+def test_ingestion_only_processes_new_or_changed_resumes(tmp_path):
+    resumes = tmp_path / 'resumes'
+    resumes.mkdir()
+    write_resumes(resumes, 4)
+    db = MemoryDB(str(tmp_path / 'memory.db'))
+    agent = CVExtractorAgent(str(resumes))
+    calls = tracked(agent)
+
+    first = agent.ingest_resumes(db)
+    assert calls == [['r0.pdf', 'r1.pdf', 'r2.pdf', 'r3.pdf']]
+
+    # Re-copied with the same content, edited, removed and added
+    os.utime(resumes / 'r0.pdf', (1, 1))
+    (resumes / 'r1.pdf').write_bytes(make_pdf(resume_text(11)))
+    os.remove(resumes / 'r2.pdf')
+    (resumes / 'r4.pdf').write_bytes(make_pdf(resume_text(4)))
+    calls.clear()
+    second = agent.ingest_resumes(db)
+
+    assert calls == [['r1.pdf', 'r4.pdf']]
+    assert [cv_data['filename'] for cv_data in second] == ['r0.pdf', 'r1.pdf', 'r3.pdf', 'r4.pdf']
+    assert second[0]['id'] == first[0]['id'] and second[1]['email'] == 'jane11@example.com'
+    statuses = {os.path.basename(path): entry['status'] for path, entry in db.get_resume_manifest().items()}
+    assert statuses == {'r0.pdf': 'active', 'r1.pdf': 'active', 'r2.pdf': 'removed', 'r3.pdf': 'active', 'r4.pdf': 'active'}
+
+    calls.clear()
+    agent.ingest_resumes(db)
+    assert calls == [[]]
+    agent.ingest_resumes(db, force=True)
+    assert calls[-1] == ['r0.pdf', 'r1.pdf', 'r3.pdf', 'r4.pdf']
+    db.close()
+
+def test_parse_cache_reuses_records_for_identical_content(tmp_path, monkeypatch):
+    resumes = tmp_path / 'resumes'
+    resumes.mkdir()
+    write_resumes(resumes, 2)
+    db = MemoryDB(str(tmp_path / 'memory.db'))
+    agent = CVExtractorAgent(str(resumes), parse_cache=db)
+    first = agent.ingest_resumes(db)
+
+    # A copy under another name is served from the cache, in worker processes too
+    (resumes / 'copy.pdf').write_bytes((resumes / 'r1.pdf').read_bytes())
+    monkeypatch.setattr(CVExtractorAgent, 'extract_resume', lambda *args: 1 / 0)
+    copy = agent.process_resume('copy.pdf')
+    assert copy['id'] == first[1]['id'] and copy['filename'] == 'copy.pdf'
+    parallel = CVExtractorAgent(str(resumes), max_workers=2, parse_cache=db).process_resumes(['copy.pdf', 'r0.pdf'])
+    assert [cv_data['id'] for cv_data in parallel] == [first[1]['id'], first[0]['id']]
+
+    monkeypatch.undo()
+    records = agent.ingest_resumes(db)
+    assert [cv_data['id'] for cv_data in records] == [first[1]['id'], first[0]['id'], first[1]['id']]
+    assert len(db.get_all_cvs()) == 2
+    db.close()
@@ -0,0 +1,32 @@
+import pytest
+
+from utils.dedup import NearDuplicateDetector
+
+BASE = ("Senior data engineer with eight years building streaming pipelines in Python, Spark and Kafka. "
+        "Led a team of five, migrated the warehouse to Snowflake and cut batch latency by half. "
+        "Bachelor of Science in Computer Science, AWS certified solutions architect.")
+OTHER = ("Frontend developer focused on accessible React interfaces and design systems. "
+         "Shipped a component library used by twelve product teams and mentored junior developers. "
+         "Studied graphic design before a coding bootcamp.")
+
+def test_signature_agreement_estimates_jaccard():
+    detector = NearDuplicateDetector()
+    signature = detector.signature(BASE)
+    assert detector.similarity(signature, detector.signature(BASE.upper())) == 1.0
+    assert detector.similarity(signature, detector.signature(BASE + " Fluent in German.")) > 0.8
+    assert detector.similarity(signature, detector.signature(OTHER)) < 0.1
+
+def test_clusters_near_duplicates_only():
+    texts = [BASE, OTHER, BASE + " References on request.", '', '', OTHER.replace('twelve', '12')]
+    labels = NearDuplicateDetector(threshold=0.7).cluster(texts)
+    assert labels == [0, 1, 0, 3, 4, 1]
+
+def test_deduplicate_keeps_the_newest_record():
+    records = [{'id': 3, 'raw_text': BASE}, {'id': 1, 'raw_text': OTHER}, {'id': 7, 'raw_text': BASE + " Updated."}, {'raw_text': None}]
+    representatives, duplicates = NearDuplicateDetector().deduplicate(records)
+    assert [record.get('id') for record in representatives] == [1, 7, None]
+    assert duplicates == {2: [0]}
+
+def test_bands_must_divide_the_signature():
+    with pytest.raises(ValueError):
+        NearDuplicateDetector(num_perm=100, bands=32)
@@ -0,0 +1,79 @@
+import sqlite3
+import threading
+
+import pytest
+
+from utils.embedding_cache import EmbeddingCache
+
+def last_access(db_path, model='m'):
+    conn = sqlite3.connect(db_path)
+    rows = dict(conn.execute('SELECT text_hash, last_access FROM embeddings WHERE model = ?', (model,)).fetchall())
+    conn.close()
+    return rows
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'embedding_cache.db')
+
+def test_round_trip_across_instances(db_path):
+    cache = EmbeddingCache(db_path)
+    cache.put('m', 'hello', [0.5, 0.25])
+    cache.close()
+
+    cache = EmbeddingCache(db_path)
+    assert cache.get('m', 'hello') == [0.5, 0.25]
+    assert cache.get('other-model', 'hello') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_disk_hits_do_not_write_until_flushed(db_path):
+    cache = EmbeddingCache(db_path, memory_size=1)
+    cache.put('m', 'a', [1.0])
+    cache.put('m', 'b', [2.0])
+    before = last_access(db_path)
+
+    # 'a' was pushed out of the memory tier, so this is a disk hit
+    assert cache.get('m', 'a') == [1.0]
+    assert last_access(db_path) == before
+
+    cache.close()
+    key = EmbeddingCache.make_key('m', 'a')[1]
+    assert last_access(db_path)[key] > before[key]
+
+def test_access_times_are_written_with_the_next_put(db_path):
+    cache = EmbeddingCache(db_path, memory_size=1)
+    cache.put('m', 'a', [1.0])
+    cache.put('m', 'b', [2.0])
+    key = EmbeddingCache.make_key('m', 'a')[1]
+    before = last_access(db_path)[key]
+
+    cache.get('m', 'a')
+    cache.put('m', 'c', [3.0])
+    assert last_access(db_path)[key] > before
+
+def test_eviction_keeps_recently_read_entries(db_path):
+    cache = EmbeddingCache(db_path, memory_size=1, max_entries=10)
+    for i in range(10):
+        cache.put('m', f"t{i}", [float(i)])
+    cache.get('m', 't0')
+    cache.put('m', 't10', [10.0])
+
+    cache = EmbeddingCache(db_path)
+    assert cache.get('m', 't0') == [0.0]
+    assert cache.get('m', 't1') is None
+
+def test_counters_are_exact_under_threads(db_path):
+    cache = EmbeddingCache(db_path)
+    cache.put('m', 'hit', [1.0])
+
+    def worker():
+        for _ in range(500):
+            cache.get('m', 'hit')
+            cache.get('m', 'miss')
+        cache.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert (cache.hits, cache.misses) == (4000, 4000)
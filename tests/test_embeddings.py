@@ -0,0 +1,100 @@
+import asyncio
+
+from utils.circuit_breaker import CircuitBreaker
+from utils.embedding_cache import EmbeddingCache
+from utils.embeddings import DEFAULT_DIMENSION, EmbeddingUtil
+
+class FakeRegistry:
+    def __init__(self):
+        self.lookups = 0
+
+    @property
+    def embedding_model(self):
+        self.lookups += 1
+        return 'nomic-embed-text'
+
+class FakeClients:
+    """Client manager stand-in; texts starting with 'bad' fail their batch"""
+
+    def __init__(self, dim=5):
+        self.models = FakeRegistry()
+        self.dim = dim
+        self.batches = []
+
+    def _embed(self, input):
+        self.batches.append(list(input))
+        if any(text.startswith('bad') for text in input):
+            raise ConnectionError('host down')
+        return {'embeddings': [[float(len(text))] * self.dim for text in input]}
+
+    def embed(self, model, input):
+        return self._embed(input)
+
+    def embeddings(self, model, prompt):
+        return {'embedding': self._embed([prompt])['embeddings'][0]}
+
+    async def embed_async(self, model, input, timeout=None):
+        return self._embed(input)
+
+def make_util(clients, **kwargs):
+    breaker = CircuitBreaker('test', failure_threshold=100)
+    return EmbeddingUtil(use_cache='cache' in kwargs, breaker=breaker, clients=clients, **kwargs)
+
+def test_construction_does_not_contact_ollama():
+    clients = FakeClients()
+    util = make_util(clients)
+    assert clients.models.lookups == 0 and clients.batches == []
+    assert util.model == 'nomic-embed-text'
+
+def test_batches_deduplicate_texts():
+    clients = FakeClients()
+    util = make_util(clients, batch_size=2)
+    embeddings = util.get_embeddings(['a', 'bb', 'a', 'ccc'])
+    assert clients.batches == [['a', 'bb'], ['ccc']]
+    assert [embedding[0] for embedding in embeddings] == [1.0, 2.0, 1.0, 3.0]
+
+def test_batches_skip_cached_texts(tmp_path):
+    clients = FakeClients()
+    util = make_util(clients, cache=EmbeddingCache(str(tmp_path / 'cache.db')), batch_size=8)
+    util.get_embeddings(['a', 'bb'])
+    assert util.get_embedding('bb') == [2.0] * 5
+
+    assert [embedding[0] for embedding in util.get_embeddings(['bb', 'dddd', 'a'])] == [2.0, 4.0, 1.0]
+    assert clients.batches == [['a', 'bb'], ['dddd']]
+
+def test_fallbacks_take_the_model_dimension():
+    clients = FakeClients(dim=5)
+    util = make_util(clients, batch_size=1)
+    # The failed batch comes first, before the dimension is known
+    embeddings = util.get_embeddings(['bad', 'good'])
+    assert embeddings[0] == [0.0] * 5
+    assert len(embeddings[1]) == 5
+
+def test_fallback_before_any_embedding_uses_the_default():
+    util = make_util(FakeClients(dim=5))
+    assert util.get_embeddings(['bad']) == [[0.0] * DEFAULT_DIMENSION]
+
+def test_async_batches_match_sync():
+    clients = FakeClients(dim=3)
+    util = make_util(clients, batch_size=1, max_concurrency=2)
+    embeddings = asyncio.run(util.get_embeddings_async(['bad', 'xy', 'z']))
+    assert embeddings == [[0.0] * 3, [2.0] * 3, [1.0] * 3]
+
+def test_async_requests_respect_max_concurrency():
+    class SlowClients(FakeClients):
+        in_flight = peak = 0
+
+        async def embed_async(self, model, input, timeout=None):
+            SlowClients.in_flight += 1
+            SlowClients.peak = max(SlowClients.peak, SlowClients.in_flight)
+            await asyncio.sleep(0.01)
+            SlowClients.in_flight -= 1
+            return self._embed(input)
+
+    clients = SlowClients(dim=2)
+    util = make_util(clients, batch_size=1, max_concurrency=3)
+    texts = [f"text {i}" for i in range(12)]
+    assert asyncio.run(util.get_embeddings_async(texts)) == [[6.0] * 2 if i < 10 else [7.0] * 2 for i in range(12)]
+    assert SlowClients.peak == 3
+    # A second event loop gets its own semaphore
+    assert len(asyncio.run(util.get_embeddings_async(['again']))) == 1
@@ -0,0 +1,54 @@
+import threading
+import time
+
+import pytest
+
+from utils.folder_watcher import FolderWatcher
+
+def first_batch(watcher, timeout=5.0):
+    """First batch the watcher yields, or None after timeout seconds"""
+    stop = threading.Event()
+    timer = threading.Timer(timeout, stop.set)
+    timer.start()
+    try:
+        return next(watcher.watch(stop), None)
+    finally:
+        timer.cancel()
+
+@pytest.mark.parametrize('use_inotify', [True, False])
+def test_reports_new_and_changed_files_once_settled(tmp_path, use_inotify):
+    (tmp_path / 'old.pdf').write_bytes(b'old')
+    with FolderWatcher(str(tmp_path), debounce=0.2, poll_interval=0.05, use_inotify=use_inotify) as watcher:
+        (tmp_path / 'new.pdf').write_bytes(b'new')
+        (tmp_path / 'notes.txt').write_bytes(b'ignored')
+        (tmp_path / '.partial.pdf').write_bytes(b'hidden')
+        started = time.monotonic()
+        assert first_batch(watcher) == ['new.pdf']
+        assert time.monotonic() - started >= 0.2
+
+        (tmp_path / 'old.pdf').write_bytes(b'edited')
+        assert first_batch(watcher) == ['old.pdf']
+
+def test_files_still_being_written_wait_for_the_last_write(tmp_path):
+    last_write = []
+
+    def upload():
+        for _ in range(3):
+            with open(tmp_path / 'big.pdf', 'ab') as file:
+                file.write(b'chunk')
+            last_write[:] = [time.monotonic()]
+            time.sleep(0.1)
+
+    with FolderWatcher(str(tmp_path), debounce=0.3, poll_interval=0.05, use_inotify=False) as watcher:
+        writer = threading.Thread(target=upload)
+        writer.start()
+        assert first_batch(watcher) == ['big.pdf']
+        assert time.monotonic() - last_write[0] >= 0.3
+        writer.join()
+
+def test_files_deleted_before_settling_are_dropped(tmp_path):
+    with FolderWatcher(str(tmp_path), debounce=0.1, poll_interval=0.05, use_inotify=False) as watcher:
+        (tmp_path / 'gone.pdf').write_bytes(b'x')
+        watcher._pending['gone.pdf'] = time.monotonic() - 1
+        (tmp_path / 'gone.pdf').unlink()
+        assert first_batch(watcher, timeout=0.5) is None
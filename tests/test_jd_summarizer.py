@@ -0,0 +1,168 @@
+import asyncio
+import csv
+import json
+from types import SimpleNamespace
+
+from agents.jd_summarizer import PROMPT_VERSION, JDSummarizerAgent
+from db.memory import MemoryDB
+from utils.circuit_breaker import CircuitBreaker
+
+VAGUE_JD = {'title': 'Engineer', 'description': 'We need someone with five years of experience building things.'}
+CLEAR_JD = {'title': 'Backend Engineer', 'description': (
+    "Skills: Python, SQL, Docker and Kubernetes.\n3+ years of experience.\n"
+    "Bachelor's degree in Computer Science.\nResponsibilities:\n- Build APIs\n- Review code\n- Run services\n"
+)}
+LLM_SUMMARY = {'required_skills': ['Go', 'Kafka'], 'years_of_experience': '5 years', 'responsibilities': ['Build services']}
+
+class FakeChatClients:
+    """Client manager stand-in answering chat requests from a reply function"""
+
+    def __init__(self, reply=None, delays=None):
+        self.reply = reply or (lambda fields: {field: LLM_SUMMARY[field] for field in fields})
+        self.delays = delays or {}
+        self.requests = []
+        self.in_flight = self.peak = 0
+
+    def chat(self, model, messages, format):
+        self.requests.append((model, messages, format))
+        content = self.reply(format['required'])
+        return {'message': {'content': content if isinstance(content, str) else json.dumps(content)}}
+
+    async def chat_async(self, model, messages, format, timeout=None):
+        """Sleeps for delays[title] (default 0.01s) before answering"""
+        title = next(line for line in messages[0]['content'].splitlines() if 'Job Title:' in line).split(':', 1)[1].strip()
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(title, 0.01))
+        finally:
+            self.in_flight -= 1
+        return self.chat(model, messages, format)
+
+def make_agent(clients=None, **kwargs):
+    kwargs.setdefault('chat_model', 'm')
+    return JDSummarizerAgent(breaker=CircuitBreaker('test'), clients=clients or FakeChatClients(), **kwargs)
+
+def write_jds(path, jds):
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['Job Title', 'Job Description'])
+        writer.writerows([jd['title'], jd['description']] for jd in jds)
+    return str(path)
+
+def test_llm_summaries_are_cached_across_agents(tmp_path):
+    db = MemoryDB(str(tmp_path / 'memory.db'))
+    clients = FakeChatClients()
+    first = make_agent(clients, cache=db).summarize_jd(VAGUE_JD)
+    assert len(clients.requests) == 1 and first['required_skills'] == ['Go', 'Kafka']
+
+    agent = make_agent(clients, cache=db)
+    assert agent.summarize_jd(VAGUE_JD) == first
+    assert len(clients.requests) == 1 and (agent.cache_hits, agent.cache_misses) == (1, 0)
+    cached = db.get_cached_jd_summary(JDSummarizerAgent.jd_hash(VAGUE_JD), 'm', PROMPT_VERSION)
+    assert cached == LLM_SUMMARY
+
+    # Another model or an edited JD is summarized again
+    make_agent(clients, cache=db, chat_model='other').summarize_jd(VAGUE_JD)
+    make_agent(clients, cache=db).summarize_jd(dict(VAGUE_JD, description=VAGUE_JD['description'] + ' Remote.'))
+    assert len(clients.requests) == 3
+    db.close()
+
+def test_cache_misses_when_a_needed_field_was_never_stored(tmp_path):
+    db = MemoryDB(str(tmp_path / 'memory.db'))
+    db.cache_jd_summary(JDSummarizerAgent.jd_hash(VAGUE_JD), 'm', PROMPT_VERSION, {'required_skills': ['Rust']})
+    clients = FakeChatClients()
+    agent = make_agent(clients, cache=db)
+
+    assert agent.summarize_jd(VAGUE_JD)['required_skills'] == ['Go', 'Kafka']
+    assert agent.cache_misses == 1 and len(clients.requests) == 1
+    db.close()
+
+def test_concurrent_summaries_keep_csv_order_within_the_limit(tmp_path):
+    jds = [dict(VAGUE_JD, title=f"Engineer {i}") for i in range(10)]
+    clients = FakeChatClients()
+    agent = make_agent(clients, csv_path=write_jds(tmp_path / 'jds.csv', jds), max_concurrency=3)
+
+    summaries = agent.process_all_jds(concurrent=True)
+
+    assert [summary['title'] for summary in summaries] == [jd['title'] for jd in jds]
+    assert all(summary['summary']['required_skills'] == ['Go', 'Kafka'] for summary in summaries)
+    assert clients.peak == 3 and len(clients.requests) == 10
+
+def test_slow_jds_time_out_to_rule_based_values_alone(tmp_path):
+    jds = [dict(VAGUE_JD, title='Slow'), dict(VAGUE_JD, title='Fast')]
+    clients = FakeChatClients(delays={'Slow': 5})
+    agent = make_agent(clients, csv_path=write_jds(tmp_path / 'jds.csv', jds), timeout=0.2)
+
+    slow, fast = agent.process_all_jds(concurrent=True)
+
+    assert slow['summary'] == dict(agent._rule_based_extraction(VAGUE_JD), raw_jd=VAGUE_JD['description'])
+    assert fast['summary']['required_skills'] == ['Go', 'Kafka']
+    # A timeout counts against Ollama like any other outage
+    assert agent.breaker._failures == 1
+
+def test_confident_rule_fields_skip_the_llm():
+    clients = FakeChatClients()
+    agent = make_agent(clients)
+    summary = agent.summarize_jd(CLEAR_JD)
+    assert clients.requests == [] and agent.rules_only == 1
+    assert summary['required_skills'] == ['Python', 'SQL', 'Docker', 'Kubernetes']
+    assert summary['responsibilities'] == ['Build APIs', 'Review code', 'Run services']
+
+def test_only_low_confidence_fields_are_asked_for():
+    clients = FakeChatClients(reply=lambda fields: dict(LLM_SUMMARY, required_skills=[]))
+    agent = make_agent(clients)
+    jd = dict(VAGUE_JD, description=VAGUE_JD['description'] + ' Experience with Widgetry Suite.')
+    summary = agent.summarize_jd(jd)
+
+    _, messages, schema = clients.requests[0]
+    assert schema['required'] == ['required_skills', 'years_of_experience', 'responsibilities']
+    assert 'Education' not in messages[0]['content']
+    assert summary['years_of_experience'] == '5 years' and summary['education'] == 'N/A'
+    # An empty LLM answer keeps the rule-based value
+    assert summary['required_skills'] == ['Widgetry Suite']
+
+def test_untiered_agent_asks_for_every_field():
+    clients = FakeChatClients(reply=lambda fields: {field: LLM_SUMMARY.get(field, []) for field in fields})
+    make_agent(clients, tiered=False).summarize_jd(CLEAR_JD)
+    assert len(clients.requests[0][2]['required']) == 5
+
+def test_no_chat_model_means_rules_only():
+    clients = FakeChatClients()
+    clients.models = SimpleNamespace(chat_model=None)
+    agent = make_agent(clients, chat_model=None)
+    assert agent.summarize_jd(VAGUE_JD)['required_skills'] == []
+    assert clients.requests == [] and agent.rules_only == 1
+
+def test_replies_are_constrained_to_the_field_schema():
+    clients = FakeChatClients(reply=lambda fields: '```json\n' + json.dumps(dict(LLM_SUMMARY, years_of_experience=5)) + '\n```')
+    agent = make_agent(clients)
+    summary = agent.summarize_jd(VAGUE_JD)
+
+    schema = clients.requests[0][2]
+    assert schema['type'] == 'object'
+    assert schema['properties']['required_skills'] == {'type': 'array', 'items': {'type': 'string'}}
+    assert summary['years_of_experience'] == '5' and agent.repairs == 0
+
+def test_invalid_fields_get_one_repair_request():
+    replies = iter([dict(LLM_SUMMARY, required_skills='Go, Kafka', responsibilities=None), {'required_skills': ['Go'], 'responsibilities': ['Ship']}])
+    clients = FakeChatClients(reply=lambda fields: next(replies))
+    agent = make_agent(clients)
+    summary = agent.summarize_jd(VAGUE_JD)
+
+    assert len(clients.requests) == 2 and agent.repairs == 1
+    _, messages, schema = clients.requests[1]
+    assert schema['required'] == ['required_skills', 'responsibilities']
+    assert 'required_skills must be a list of strings' in messages[-1]['content']
+    assert (summary['required_skills'], summary['years_of_experience'], summary['responsibilities']) == (['Go'], '5 years', ['Ship'])
+
+def test_still_invalid_after_repair_keeps_rule_values(tmp_path):
+    db = MemoryDB(str(tmp_path / 'memory.db'))
+    clients = FakeChatClients(reply=lambda fields: 'not json')
+    agent = make_agent(clients, cache=db)
+    summary = agent.summarize_jd(VAGUE_JD)
+
+    assert len(clients.requests) == 2
+    assert summary == dict(agent._rule_based_extraction(VAGUE_JD), raw_jd=VAGUE_JD['description'])
+    assert db.get_cached_jd_summary(JDSummarizerAgent.jd_hash(VAGUE_JD), 'm', PROMPT_VERSION) is None
+    db.close()
@@ -0,0 +1,26 @@
+from utils.keyword_scanner import KeywordScanner, get_tech_scanner
+
+def test_finds_aliases_as_canonical_names():
+    scanner = get_tech_scanner()
+    assert scanner.find_all("Built ReactJS apps on k8s with postgres, python and C++") == [
+        'React', 'Kubernetes', 'PostgreSQL', 'Python', 'C++'
+    ]
+
+def test_short_all_caps_terms_need_their_case():
+    scanner = get_tech_scanner()
+    assert scanner.find_all("Add 5 ml of buffer; see r/python or main.js") == ['Python']
+    assert scanner.find_all("ML models in R and JS") == ['Machine Learning', 'R', 'JavaScript']
+
+def test_longer_terms_stay_case_insensitive():
+    assert get_tech_scanner().find_all("machine learning, MACHINE LEARNING, Docker, docker") == ['Machine Learning', 'Docker']
+
+def test_whole_words_only():
+    assert get_tech_scanner().find_all("Javanese Gopher, Rusty Golang") == ['Go']
+
+def test_whitespace_in_keywords_spans_line_breaks():
+    matches = get_tech_scanner().scan("Deep\nLearning")
+    assert matches == [('Deep Learning', 0, 13)]
+
+def test_case_sensitive_scanner():
+    scanner = KeywordScanner(['Go', 'ML'], case_sensitive=True)
+    assert scanner.find_all("go Go ml ML") == ['Go', 'ML']
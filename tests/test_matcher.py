@@ -0,0 +1,135 @@
+import os
+
+import numpy as np
+import pytest
+
+from conftest import FakeEmbeddingUtil, cv
+
+def test_partial_batch_failure_is_retried(make_matcher, tmp_path):
+    index_path = str(tmp_path / 'cv_index.npz')
+    embedding_util = FakeEmbeddingUtil()
+    cvs = [cv(i) for i in range(40)]
+    embedding_util.failing = {c['filename'] for c in cvs[20:]}
+    matcher = make_matcher(embedding_util, index_path=index_path)
+
+    matcher.index_cvs(cvs, update_existing=False)
+    assert len(matcher.cv_index) == 20
+    assert not any(c['filename'] in matcher.cv_index for c in cvs[20:])
+
+    # Ollama recovered; only the CVs that failed are embedded again
+    embedding_util.failing = set()
+    embedding_util.embedded = []
+    matcher = make_matcher(embedding_util, index_path=index_path)
+    matcher.index_cvs(cvs, update_existing=False)
+    assert sorted(embedding_util.embedded) == sorted(c['filename'] for c in cvs[20:])
+    assert len(matcher.cv_index) == 40
+
+def test_top_n_retrieval_retries_failed_cvs(make_matcher):
+    embedding_util = FakeEmbeddingUtil()
+    cvs = [cv(i) for i in range(10)]
+    embedding_util.failing = {'c03.pdf'}
+    matcher = make_matcher(embedding_util)
+    jd = {'title': 'Engineer'}
+
+    matcher.get_top_matches(top_n=10, threshold=-100, jd_data_list=[jd], cv_data_list=cvs)
+    assert 'c03.pdf' not in matcher.cv_index
+
+    embedding_util.failing = set()
+    matches = matcher.get_top_matches(top_n=10, threshold=-100, jd_data_list=[jd], cv_data_list=cvs)
+    assert 'c03.pdf' in {c['filename'] for c, _ in matches['Engineer']}
+
+def test_index_follows_edits_and_removals(make_matcher):
+    embedding_util = FakeEmbeddingUtil()
+    matcher = make_matcher(embedding_util)
+    cvs = [cv(i) for i in range(5)]
+    matcher.index_cvs(cvs, update_existing=False)
+
+    embedding_util.embedded = []
+    cvs = [cv(0, content_hash='edited')] + cvs[1:4]
+    matcher.get_top_matches(top_n=3, jd_data_list=[{'title': 'Engineer'}], cv_data_list=cvs)
+
+    assert embedding_util.embedded == ['c00.pdf']
+    assert sorted(matcher.cv_index.ids) == ['c00.pdf', 'c01.pdf', 'c02.pdf', 'c03.pdf']
+    assert matcher.cv_index.hashes['c00.pdf'] == 'edited'
+
+def test_dimension_change_rebuilds_index(make_matcher, tmp_path):
+    index_path = str(tmp_path / 'cv_index.npz')
+    cvs = [cv(i) for i in range(5)]
+    make_matcher(FakeEmbeddingUtil(dim=8), index_path=index_path).index_cvs(cvs)
+
+    matcher = make_matcher(FakeEmbeddingUtil(dim=16), index_path=index_path)
+    matches = matcher.get_top_matches(top_n=2, threshold=-100, jd_data_list=[{'title': 'Engineer'}], cv_data_list=cvs)
+
+    assert len(matches['Engineer']) == 2
+    assert matcher.cv_index.dim == 16
+    assert os.path.exists(index_path)
+
+def test_quantized_pool_is_built_once_and_memory_mapped(make_matcher, tmp_path):
+    index_path = str(tmp_path / 'cv_index.npz')
+    embedding_util = FakeEmbeddingUtil()
+    cvs = [cv(i) for i in range(30)]
+    jd = {'title': 'Engineer'}
+    matcher = make_matcher(embedding_util, index_path=index_path, quantization='int8')
+
+    first = matcher.get_top_matches(top_n=5, threshold=-100, jd_data_list=[jd], cv_data_list=cvs)
+    pool = matcher.cv_pool
+    assert isinstance(pool.originals, np.memmap)
+    # The float32 index is not kept in memory once the pool is built
+    assert matcher._cv_index is None
+
+    second = matcher.get_top_matches(top_n=5, threshold=-100, jd_data_list=[jd], cv_data_list=cvs)
+    assert matcher.cv_pool is pool
+    assert first == second
+
+    # A new process reuses the persisted pool without embedding any CV
+    embedding_util.embedded = []
+    matcher = make_matcher(embedding_util, index_path=index_path, quantization='int8')
+    assert matcher.get_top_matches(top_n=5, threshold=-100, jd_data_list=[jd], cv_data_list=cvs) == first
+    assert embedding_util.embedded == []
+    assert matcher._cv_index is None
+
+def test_quantized_pool_follows_edits(make_matcher, tmp_path):
+    embedding_util = FakeEmbeddingUtil()
+    matcher = make_matcher(embedding_util, index_path=str(tmp_path / 'cv_index.npz'), quantization='binary')
+    cvs = [cv(i) for i in range(10)]
+    jd = {'title': 'Engineer'}
+    matcher.get_top_matches(top_n=3, jd_data_list=[jd], cv_data_list=cvs)
+
+    embedding_util.embedded = []
+    cvs = [cv(0, content_hash='edited')] + cvs[2:]
+    matcher.get_top_matches(top_n=3, jd_data_list=[jd], cv_data_list=cvs)
+
+    assert embedding_util.embedded == ['c00.pdf']
+    assert sorted(matcher.cv_pool.metadata['ids'].tolist()) == sorted(c['filename'] for c in cvs)
+
+def test_bulk_matching_embeds_every_document_once(make_matcher):
+    embedding_util = FakeEmbeddingUtil()
+    jd_batches = []
+    get_jd_embeddings = embedding_util.get_jd_embeddings
+    embedding_util.get_jd_embeddings = lambda jds: jd_batches.append(len(jds)) or get_jd_embeddings(jds)
+    matcher = make_matcher(embedding_util)
+    jds = [{'title': f"Role {j}"} for j in range(3)]
+    cvs = [cv(i) for i in range(8)]
+
+    matches = matcher.match_all_jds_with_all_cvs(jds, cvs)
+
+    assert jd_batches == [3]
+    assert sorted(embedding_util.embedded) == sorted(c['filename'] for c in cvs)
+    for jd in jds:
+        jd_vector = np.array(embedding_util.vector(jd['title']))
+        for cv_data, score in matches[jd['title']]:
+            cv_vector = np.array(embedding_util.vector(cv_data['filename']))
+            expected = jd_vector @ cv_vector / np.linalg.norm(jd_vector) / np.linalg.norm(cv_vector) * 100
+            assert score == pytest.approx(expected, abs=1e-3)
+        scores = [score for _, score in matches[jd['title']]]
+        assert scores == sorted(scores, reverse=True)
+
+def test_degraded_embeddings_fall_back_to_keyword_scores(make_matcher):
+    embedding_util = FakeEmbeddingUtil()
+    embedding_util.is_degraded = lambda: True
+    matcher = make_matcher(embedding_util)
+    jd = {'title': 'Engineer', 'summary': {'required_skills': ['Golang', 'Java', 'SQL']}}
+    cvs = [dict(cv(0), skills='JavaScript, SQL'), dict(cv(1), skills='Go, Java, PostgreSQL, SQL')]
+
+    matches = matcher.match_all_jds_with_all_cvs([jd], cvs)
+    assert [(c['filename'], round(score)) for c, score in matches['Engineer']] == [('c01.pdf', 100), ('c00.pdf', 33)]
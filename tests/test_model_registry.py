@@ -0,0 +1,61 @@
+from utils.model_registry import CHAT, EMBEDDING, ModelRegistry
+
+class FakeClients:
+    """Answers list and show requests from a model -> show response mapping"""
+
+    def __init__(self, models):
+        self.models = models
+        self.requests = []
+        self.down = False
+
+    def request(self, method, **kwargs):
+        self.requests.append(method)
+        if self.down:
+            raise ConnectionError('refused')
+        if method == 'list':
+            return {'models': [{'model': name} for name in self.models]}
+        return self.models[kwargs['model']]
+
+MODELS = {
+    'llama3:latest': {'capabilities': ['completion', 'tools']},
+    'nomic-embed-text:latest': {'capabilities': ['embedding']},
+    # Servers before Ollama 0.6 report no capabilities
+    'mxbai-embed-large:latest': {'model_info': {'bert.pooling_type': 1}, 'details': {'family': 'bert'}},
+    'mistral:7b': {'details': {'family': 'llama'}},
+}
+
+def test_discovers_capabilities_once():
+    clients = FakeClients(MODELS)
+    registry = ModelRegistry(clients, chat_models=['llama3'], embedding_models=['nomic-embed-text'])
+    assert registry.discover() == {
+        'llama3:latest': {CHAT, 'tools'},
+        'nomic-embed-text:latest': {EMBEDDING},
+        'mxbai-embed-large:latest': {EMBEDDING},
+        'mistral:7b': {CHAT},
+    }
+    assert (registry.chat_model, registry.embedding_model) == ('llama3', 'nomic-embed-text')
+    assert registry.supports('llama3', CHAT) and not registry.supports('llama3', EMBEDDING)
+    assert clients.requests.count('list') == 1
+
+def test_routes_to_the_first_capable_preferred_model():
+    registry = ModelRegistry(FakeClients(MODELS), chat_models=['nomic-embed-text', 'mistral:7b'], embedding_models=['llama3', 'mxbai-embed-large'])
+    assert (registry.chat_model, registry.embedding_model) == ('mistral:7b', 'mxbai-embed-large')
+
+def test_falls_back_to_any_capable_local_model():
+    registry = ModelRegistry(FakeClients(MODELS), chat_models=['phi3'], embedding_models=['all-minilm'])
+    assert (registry.chat_model, registry.embedding_model) == ('llama3:latest', 'mxbai-embed-large:latest')
+
+    registry = ModelRegistry(FakeClients({'nomic-embed-text:latest': {'capabilities': ['embedding']}}), chat_models=['llama3'])
+    assert registry.chat_model is None
+
+def test_failed_discovery_is_retried_after_the_interval():
+    clients = FakeClients(MODELS)
+    clients.down = True
+    registry = ModelRegistry(clients, chat_models=['llama3'], embedding_models=['nomic-embed-text'], retry_interval=60)
+    assert registry.chat_model is None and registry.embedding_model == 'nomic-embed-text'
+    assert clients.requests == ['list']
+
+    clients.down = False
+    assert registry.chat_model is None
+    registry._retry_at = 0
+    assert registry.chat_model == 'llama3'
@@ -0,0 +1,62 @@
+import asyncio
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+import ollama
+import pytest
+
+from utils.ollama_clients import OllamaClientManager
+
+from conftest import stub_server
+
+def unused_host():
+    """URL of a local port nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+def test_requests_spread_over_healthy_hosts():
+    with stub_server(latency=0.02) as (first, first_host), stub_server(latency=0.02) as (second, second_host):
+        manager = OllamaClientManager([first_host, second_host])
+        with ThreadPoolExecutor(8) as pool:
+            responses = list(pool.map(lambda i: manager.embed(model='m', input=[f"text {i}"]), range(16)))
+        assert all(len(response['embeddings'][0]) == 768 for response in responses)
+        assert first.config.requests >= 4 and second.config.requests >= 4
+        assert all(endpoint.outstanding == 0 for endpoint in manager.endpoints)
+
+def test_outage_fails_over_and_benches_the_host():
+    with stub_server(dim=8) as (server, host):
+        manager = OllamaClientManager([unused_host(), host], retry_interval=60)
+        down, up = manager.endpoints
+        for i in range(3):
+            assert len(manager.embed(model='m', input=['text'])['embeddings'][0]) == 8
+        assert not down.healthy and down.failures == 1 and up.healthy
+        assert server.config.requests == 3
+
+def test_async_requests_fail_over():
+    with stub_server(dim=4, error_rate=1.0) as (_, failing_host), stub_server(dim=4) as (_, host):
+        manager = OllamaClientManager([failing_host, host])
+        response = asyncio.run(manager.embed_async(model='m', input=['a', 'b'], timeout=5))
+        assert len(response['embeddings']) == 2
+        assert [endpoint.healthy for endpoint in manager.endpoints] == [False, True]
+
+def test_every_host_down_raises_the_last_error():
+    manager = OllamaClientManager([unused_host(), unused_host()])
+    with pytest.raises(ConnectionError):
+        manager.embed(model='m', input=['text'])
+    with pytest.raises(ConnectionError, match='No Ollama endpoints'):
+        manager.embed(model='m', input=['text'])
+
+def test_client_errors_are_not_retried_elsewhere():
+    with stub_server() as (first, first_host), stub_server() as (second, second_host):
+        manager = OllamaClientManager([first_host, second_host])
+        with pytest.raises(ollama.ResponseError):
+            manager.request('pull', model='m', stream=False)
+        assert all(endpoint.healthy for endpoint in manager.endpoints)
+
+def test_health_checks_restore_hosts():
+    with stub_server() as (_, host):
+        manager = OllamaClientManager([host])
+        manager.endpoints[0].healthy = False
+        assert manager.check_health() == [host]
+        assert manager.endpoints[0].healthy
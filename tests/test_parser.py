@@ -0,0 +1,68 @@
+from benchmarks.section_benchmark import pathological_inputs
+from utils.parser import SectionSegmenter
+
+RESUME = """Jane Doe
+Summary
+Backend engineer.
+  Work   Experience :
+Acme Corp, 2019-2023
+Skills: Python, SQL
+EDUCATION
+B.Sc. Computer Science
+"""
+
+def test_extracts_sections_by_header_lines():
+    assert SectionSegmenter().extract(RESUME) == {
+        'experience': 'Acme Corp, 2019-2023',
+        'skills': 'Python, SQL',
+        'education': 'B.Sc. Computer Science',
+    }
+
+def test_header_words_inside_lines_are_not_headers():
+    text = "I have experience with skills in education\nSkills\nGo"
+    assert SectionSegmenter().extract(text) == {'skills': 'Go'}
+
+def test_first_occurrence_wins_and_boundaries_end_sections():
+    text = "Skills\nPython\nInterests\nChess\nSkills\nRust"
+    assert SectionSegmenter().extract(text) == {'skills': 'Python'}
+
+def test_offsets_exclude_the_header():
+    text = "Projects:\r\nCompiler\nskills :Go"
+    segments = SectionSegmenter().segment(text)
+    assert text[slice(*segments['projects'])] == "\nCompiler\n"
+    assert text[slice(*segments['skills'])] == "Go"
+
+def test_long_lines_are_not_headers():
+    segmenter = SectionSegmenter(max_header_length=10)
+    assert segmenter.extract("Skills" + " " * 20 + "\nPython") == {}
+
+def test_custom_headers():
+    segmenter = SectionSegmenter({'awards': ['honours and awards']}, boundary_headers=[])
+    assert segmenter.extract("Honours  and Awards:\nDean's list") == {'awards': "Dean's list"}
+
+def test_matches_a_line_by_line_walk():
+    segmenter = SectionSegmenter()
+    text = "\n".join([
+        "", "  skills  ", "Skills:Go", "skills: : x", "Education::", "education\tbackground",
+        "Tech\tStack", "Work history: none", "- experience", "projects\r", "Summary", "certificates :"
+    ] * 3)
+
+    expected, current, current_start, position = {}, None, 0, 0
+    for line in text.split('\n'):
+        is_header, section, content_offset = segmenter._match_header(line)
+        if is_header:
+            if current is not None:
+                expected.setdefault(current, (current_start, position))
+            current, current_start = section, position + content_offset
+        position += len(line) + 1
+    if current is not None:
+        expected.setdefault(current, (current_start, len(text)))
+
+    assert segmenter.segment(text) == expected
+
+def test_pathological_inputs():
+    education, mentions, short_lines = pathological_inputs(10000)
+    segmenter = SectionSegmenter()
+    assert segmenter.segment(education) == {'education': (9, len(education))}
+    assert segmenter.segment(mentions) == {}
+    assert segmenter.segment(short_lines) == {'skills': (6, len(short_lines))}
@@ -0,0 +1,42 @@
+import fitz
+import pytest
+
+from utils.pdf_reader import PDFTextExtractor
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """Five-page PDF whose pages read page 0 to page 4"""
+    document = fitz.open()
+    for i in range(5):
+        document.new_page().insert_text((72, 72), f"page {i}")
+    path = tmp_path / 'five.pdf'
+    document.save(str(path))
+    document.close()
+    return str(path)
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_reads_every_page_in_order(pdf_path, use_mmap):
+    result = PDFTextExtractor(use_mmap=use_mmap).extract(pdf_path)
+    assert result['text'].split() == ['page', '0', 'page', '1', 'page', '2', 'page', '3', 'page', '4']
+    assert (result['pages_read'], result['page_count'], result['truncated']) == (5, 5, False)
+
+def test_page_budget(pdf_path):
+    extractor = PDFTextExtractor(max_pages=2)
+    result = extractor.extract(pdf_path)
+    assert 'page 1' in result['text'] and 'page 2' not in result['text']
+    assert (result['pages_read'], result['truncated'], result['truncation_reason']) == (2, True, 'max_pages')
+    assert extractor.extract(pdf_path, max_pages=1)['pages_read'] == 1
+
+def test_size_budget_skips_the_file(pdf_path):
+    result = PDFTextExtractor(max_bytes=100).extract(pdf_path)
+    assert result == PDFTextExtractor.empty_result(truncated=True, reason='max_bytes')
+    with open(pdf_path, 'rb') as file:
+        assert PDFTextExtractor(max_bytes=100).extract_stream(file.read())['truncation_reason'] == 'max_bytes'
+
+def test_time_budget(pdf_path):
+    result = PDFTextExtractor(timeout=0).extract(pdf_path)
+    assert result['text'] == '' and result['truncation_reason'] == 'timeout'
+
+def test_stream_matches_file(pdf_path):
+    with open(pdf_path, 'rb') as file:
+        assert PDFTextExtractor().extract_stream(file.read()) == PDFTextExtractor().extract(pdf_path)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from utils.quantization import QuantizedEmbeddings
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).normal(size=(500, 32)).astype(np.float32)
+
+@pytest.mark.parametrize('method', QuantizedEmbeddings.METHODS)
+def test_search_reranks_with_exact_scores(vectors, method):
+    pool = QuantizedEmbeddings(vectors, method=method)
+    index, score = pool.search(vectors[42], 5)[0]
+    assert index == 42
+    assert score == pytest.approx(100.0, abs=1e-3)
+
+def test_int8_codes_are_a_quarter_of_float32(vectors):
+    pool = QuantizedEmbeddings(vectors, method='int8')
+    assert pool.codes.nbytes == vectors.nbytes // 4
+
+def test_originals_path_is_memory_mapped(vectors, tmp_path):
+    pool = QuantizedEmbeddings(vectors, originals_path=str(tmp_path / 'originals.npy'))
+    assert isinstance(pool.originals, np.memmap)
+    assert pool.search(vectors[7], 1)[0][0] == 7
+
+def test_save_and_load_round_trip(vectors, tmp_path):
+    originals_path = str(tmp_path / 'originals.npy')
+    pool = QuantizedEmbeddings(vectors, method='binary', originals_path=originals_path)
+    pool.metadata = {'ids': np.array([f"c{i}" for i in range(len(vectors))])}
+    pool.save(str(tmp_path / 'codes.npz'))
+
+    loaded = QuantizedEmbeddings.load(str(tmp_path / 'codes.npz'), originals_path)
+    assert loaded.method == 'binary' and loaded.dim == 32
+    assert loaded.metadata['ids'][3] == 'c3'
+    assert loaded.search(vectors[3], 3) == pool.search(vectors[3], 3)
+
+def test_unknown_method_is_rejected(vectors):
+    with pytest.raises(ValueError):
+        QuantizedEmbeddings(vectors, method='pq')
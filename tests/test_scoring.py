@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from sklearn.metrics.pairwise import cosine_similarity
+
+from utils.scoring import ScoringEngine
+
+@pytest.fixture
+def embeddings():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(3, 12)), rng.normal(size=(10, 12))
+
+def test_score_matrix_matches_cosine_similarity(embeddings):
+    jds, cvs = embeddings
+    scores = ScoringEngine(block_size=4).score_matrix(jds.tolist(), cvs.tolist())
+    assert scores.dtype == np.float32 and scores.shape == (3, 10)
+    np.testing.assert_allclose(scores, cosine_similarity(jds, cvs) * 100, atol=1e-3)
+
+def test_zero_vectors_score_zero(embeddings):
+    jds, cvs = embeddings
+    cvs[4] = 0
+    scores = ScoringEngine().score_matrix(jds, cvs)
+    assert not scores[:, 4].any()
+    assert not np.isnan(scores).any()
+
+def test_top_n_indices_equal_the_head_of_a_full_sort():
+    scores = np.array([5.0, 90.0, 30.0, 90.0, 70.0, 10.0], dtype=np.float32)
+    full = ScoringEngine.sorted_indices(scores)
+    assert full.tolist() == [1, 3, 4, 2, 5, 0]
+    assert set(ScoringEngine.sorted_indices(scores, top_n=3).tolist()) == {1, 3, 4}
+    assert ScoringEngine.sorted_indices(scores, top_n=10).tolist() == full.tolist()
+
+def test_ranked_pairs_items_with_scores():
+    scores = np.array([10.0, 30.0, 20.0], dtype=np.float32)
+    assert ScoringEngine().ranked(scores, ['a', 'b', 'c'], top_n=2) == [('b', 30.0), ('c', 20.0)]
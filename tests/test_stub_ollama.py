@@ -0,0 +1,37 @@
+import json
+
+import numpy as np
+import ollama
+import pytest
+
+from benchmarks.stub_ollama import canned_summary, stub_embedding
+
+from conftest import stub_server
+
+def test_embeddings_are_deterministic_unit_vectors():
+    with stub_server(dim=32) as (_, host):
+        client = ollama.Client(host=host)
+        batch = client.embed(model='nomic-embed-text', input=['python developer', 'java developer'])['embeddings']
+        single = client.embeddings(model='nomic-embed-text', prompt='python developer')['embedding']
+    assert batch[0] == pytest.approx(single) and batch[0] == pytest.approx(stub_embedding('python developer', 32))
+    assert batch[0] != pytest.approx(batch[1])
+    assert np.linalg.norm(batch[1]) == pytest.approx(1.0)
+
+def test_chat_returns_a_canned_summary():
+    prompt = "Job Title: Data Engineer\nJob Description: 5+ years of Python, SQL and AWS"
+    with stub_server() as (_, host):
+        reply = ollama.Client(host=host).chat(model='llama3', messages=[{'role': 'user', 'content': prompt}])
+    assert reply['message']['content'] == canned_summary(prompt)
+    summary = json.loads(canned_summary(prompt).strip('`').removeprefix('json'))
+    assert summary['required_skills'] == ['Python', 'SQL', 'AWS']
+    assert summary['years_of_experience'] == '5+ years'
+
+def test_models_and_injected_failures():
+    with stub_server(error_rate=1.0, models=['a:latest', 'embed-b:latest']) as (server, host):
+        client = ollama.Client(host=host)
+        assert [model['model'] for model in client.list()['models']] == ['a:latest', 'embed-b:latest']
+        assert client.show('embed-b:latest')['capabilities'] == ['embedding']
+        with pytest.raises(ollama.ResponseError) as error:
+            client.embed(model='embed-b', input=['text'])
+    assert error.value.status_code == 500
+    assert server.config.requests == 1
@@ -0,0 +1,280 @@
+import numpy as np
+from typing import List, Dict, Sequence, Tuple, Optional
+
+from utils.scoring import ScoringEngine
+
+class IVFIndex:
+    """Inverted-file approximate nearest-neighbour index over embeddings
+
+    Vectors are L2-normalized and assigned to the nearest of n_lists k-means
+    centroids. A query only scores the vectors in its n_probe closest lists,
+    so search cost grows with N / n_lists * n_probe instead of N.
+    """
+
+    def __init__(self, n_lists: Optional[int] = None, n_probe: int = 8, min_train_size: int = 1024, seed: int = 0):
+        """Initialize IVF index
+
+        Args:
+            n_lists: Number of k-means lists (defaults to sqrt of the size at
+                training time)
+            n_probe: Number of lists scanned per query
+            min_train_size: Below this many vectors the index does exact search
+            seed: Random seed for k-means initialization
+        """
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.min_train_size = min_train_size
+        self.seed = seed
+
+        self.ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        # Content hash each vector was embedded from, to spot edited items
+        self.hashes: Dict[str, str] = {}
+        # Over-allocated buffers so single-CV adds are amortized O(dim)
+        self._vectors: Optional[np.ndarray] = None
+        self._assignments = np.empty(0, dtype=np.int32)
+        self.centroids: Optional[np.ndarray] = None
+        self.trained_size = 0
+
+        # Inverted lists, rebuilt lazily after adds
+        self._order: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._positions
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    @property
+    def dim(self) -> Optional[int]:
+        """Vector dimension, or None while the index is empty"""
+        return self._vectors.shape[1] if self._vectors is not None and self.ids else None
+
+    @property
+    def vectors(self) -> Optional[np.ndarray]:
+        return self._vectors[:len(self.ids)] if self._vectors is not None else None
+
+    @property
+    def assignments(self) -> np.ndarray:
+        return self._assignments[:len(self.ids)]
+
+    def _reserve(self, size: int, dim: int) -> None:
+        """Grow the buffers geometrically to hold at least size vectors"""
+        capacity = len(self._vectors) if self._vectors is not None else 0
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 64)
+        vectors = np.empty((capacity, dim), dtype=np.float32)
+        assignments = np.zeros(capacity, dtype=np.int32)
+        n = len(self.ids)
+        if self._vectors is not None:
+            vectors[:n] = self._vectors[:n]
+            assignments[:n] = self._assignments[:n]
+        self._vectors = vectors
+        self._assignments = assignments
+
+    def _kmeans(self, data: np.ndarray, n_lists: int, iterations: int = 10) -> np.ndarray:
+        """Spherical k-means on normalized vectors
+
+        Args:
+            data: Normalized training vectors
+            n_lists: Number of centroids
+            iterations: Lloyd iterations
+
+        Returns:
+            Normalized centroid matrix of shape (n_lists, dim)
+        """
+        rng = np.random.default_rng(self.seed)
+        centroids = data[rng.choice(len(data), n_lists, replace=False)].copy()
+
+        for _ in range(iterations):
+            labels = np.argmax(data @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = data[labels == c]
+                if len(members):
+                    centroids[c] = members.sum(axis=0)
+                else:
+                    # Re-seed empty lists from a random training vector
+                    centroids[c] = data[rng.integers(len(data))]
+            centroids = ScoringEngine.normalize(centroids)
+
+        return centroids
+
+    def train(self) -> None:
+        """(Re)build the coarse quantizer from the current vectors"""
+        n = len(self.ids)
+        n_lists = self.n_lists or max(1, int(np.sqrt(n)))
+        n_lists = min(n_lists, n)
+
+        # Train on a sample, which is plenty for a coarse quantizer
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(n, n_lists * 64)
+        sample = self.vectors[rng.choice(n, sample_size, replace=False)]
+
+        self.centroids = self._kmeans(sample, n_lists)
+        self._assignments[:n] = self._assign(self.vectors)
+        self.trained_size = n
+        self._order = None
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Find the nearest centroid of each vector"""
+        return np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+
+    def add(self, ids: Sequence[str], embeddings: Sequence[Sequence[float]], hashes: Optional[Sequence[Optional[str]]] = None) -> None:
+        """Add or replace vectors
+
+        New vectors are assigned to the existing lists. The quantizer is
+        retrained once the index reaches min_train_size and again whenever it
+        has grown to four times its last training size.
+
+        Args:
+            ids: Item IDs (e.g. CV filenames)
+            embeddings: Embeddings in the same order as ids
+            hashes: Content hashes the embeddings were computed from
+
+        Raises:
+            ValueError: If the embeddings do not match the index dimension
+        """
+        if not len(ids):
+            return
+
+        new_vectors = ScoringEngine.normalize(embeddings)
+        if self.dim is not None and new_vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dimensional embeddings, got {new_vectors.shape[1]}")
+        self._reserve(len(self.ids) + len(new_vectors), new_vectors.shape[1])
+
+        positions = []
+        for item_id in ids:
+            position = self._positions.get(item_id)
+            if position is None:
+                # New CV goes at the end; an edited CV is overwritten in place
+                position = len(self.ids)
+                self._positions[item_id] = position
+                self.ids.append(item_id)
+            positions.append(position)
+        for item_id, content_hash in zip(ids, hashes or [None] * len(ids)):
+            if content_hash:
+                self.hashes[item_id] = content_hash
+            else:
+                self.hashes.pop(item_id, None)
+
+        self._vectors[positions] = new_vectors
+        if self.is_trained:
+            self._assignments[positions] = self._assign(new_vectors)
+
+        n = len(self.ids)
+        if n >= self.min_train_size and (not self.is_trained or n >= 4 * self.trained_size):
+            self.train()
+        self._order = None
+
+    def remove(self, ids: Sequence[str]) -> None:
+        """Remove vectors, keeping the trained quantizer
+
+        Args:
+            ids: Item IDs to remove; unknown IDs are ignored
+        """
+        removed = {item_id for item_id in ids if item_id in self._positions}
+        if not removed:
+            return
+
+        keep = np.array([i for i, item_id in enumerate(self.ids) if item_id not in removed], dtype=np.int64)
+        n = len(keep)
+        self._vectors[:n] = self.vectors[keep]
+        self._assignments[:n] = self.assignments[keep]
+        self.ids = [self.ids[i] for i in keep]
+        self._positions = {item_id: i for i, item_id in enumerate(self.ids)}
+        for item_id in removed:
+            self.hashes.pop(item_id, None)
+        if not self.ids:
+            self._vectors = None
+            self.centroids = None
+            self.trained_size = 0
+        self._order = None
+
+    def clear(self) -> None:
+        """Remove every vector and the quantizer, keeping the parameters"""
+        self.__init__(n_lists=self.n_lists, n_probe=self.n_probe, min_train_size=self.min_train_size, seed=self.seed)
+
+    def _build_lists(self) -> None:
+        """Group vector positions by list for contiguous scanning"""
+        self._order = np.argsort(self.assignments, kind='stable')
+        sorted_lists = self.assignments[self._order]
+        self._offsets = np.searchsorted(sorted_lists, np.arange(len(self.centroids) + 1))
+
+    def search(self, query: Sequence[float], k: int, n_probe: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Find the approximate top-k vectors for a query
+
+        Args:
+            query: Query embedding
+            k: Number of results
+            n_probe: Lists to scan (defaults to self.n_probe)
+
+        Returns:
+            List of (id, score) tuples sorted by score (0-100)
+        """
+        if not self.ids:
+            return []
+
+        query = ScoringEngine.normalize(query)[0]
+
+        if not self.is_trained:
+            candidates = np.arange(len(self.ids))
+        else:
+            if self._order is None:
+                self._build_lists()
+            n_probe = min(n_probe or self.n_probe, len(self.centroids))
+            probe = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+            candidates = np.concatenate([
+                self._order[self._offsets[c]:self._offsets[c + 1]] for c in probe
+            ])
+
+        scores = self.vectors[candidates] @ query * 100.0
+        top = ScoringEngine.sorted_indices(scores, k)
+        return [(self.ids[candidates[i]], float(scores[i])) for i in top]
+
+    def save(self, path: str) -> None:
+        """Persist the index to a .npz file
+
+        Args:
+            path: Destination file path
+        """
+        dim = self.vectors.shape[1] if self.vectors is not None else 0
+        np.savez(
+            path,
+            ids=np.array(self.ids, dtype=str),
+            hashes=np.array([self.hashes.get(item_id, '') for item_id in self.ids], dtype=str),
+            vectors=self.vectors if self.vectors is not None else np.empty((0, dim), dtype=np.float32),
+            assignments=self.assignments,
+            centroids=self.centroids if self.centroids is not None else np.empty((0, dim), dtype=np.float32),
+            params=np.array([self.n_lists or 0, self.n_probe, self.min_train_size, self.seed, self.trained_size])
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'IVFIndex':
+        """Load an index saved with save()
+
+        Args:
+            path: Source file path
+
+        Returns:
+            Loaded index
+        """
+        with np.load(path) as data:
+            n_lists, n_probe, min_train_size, seed, trained_size = [int(v) for v in data['params']]
+            index = cls(n_lists=n_lists or None, n_probe=n_probe, min_train_size=min_train_size, seed=seed)
+            index.ids = data['ids'].tolist()
+            index._positions = {item_id: i for i, item_id in enumerate(index.ids)}
+            # Indexes saved before hashes were recorded count as stale
+            if 'hashes' in data.files:
+                index.hashes = {item_id: content_hash for item_id, content_hash in zip(index.ids, data['hashes'].tolist()) if content_hash}
+            if index.ids:
+                index._vectors = data['vectors'].astype(np.float32)
+                index._assignments = data['assignments'].astype(np.int32)
+            index.centroids = data['centroids'] if len(data['centroids']) else None
+            index.trained_size = trained_size
+        return index
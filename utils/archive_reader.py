@@ -0,0 +1,170 @@
+import os
+import tarfile
+import threading
+import time
+import zipfile
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+# Separates an archive path from a member name in resume identifiers,
+# e.g. "drop.zip::candidates/jane_doe.pdf"
+MEMBER_SEPARATOR = '::'
+
+def is_archive(path: str) -> bool:
+    """Whether a path names a supported zip or tar archive"""
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+def split_member(identifier: str) -> Tuple[Optional[str], str]:
+    """Split "archive::member" into (archive, member)
+
+    Args:
+        identifier: Resume identifier
+
+    Returns:
+        (archive path, member name), or (None, identifier) for plain files
+    """
+    archive, separator, member = identifier.partition(MEMBER_SEPARATOR)
+    if not separator:
+        return None, identifier
+    return archive, member
+
+class ResumeArchive:
+    """Read-only access to the PDF members of a zip or tar archive
+
+    Members are read into memory one at a time and never written to disk.
+    Zip archives support cheap random access. Compressed tar archives can
+    only be read front to back, so batches should go through iter_pdfs(),
+    which makes a single pass in archive order.
+    """
+
+    def __init__(self, path: str):
+        """Open an archive
+
+        Args:
+            path: Path to a .zip or .tar(.gz/.bz2/.xz) file
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        if path.lower().endswith('.zip'):
+            self._zip = zipfile.ZipFile(path)
+            self._tar = None
+            infos = [info for info in self._zip.infolist() if not info.is_dir()]
+            self._members = {info.filename: {'size': info.file_size, 'mtime': time.mktime(info.date_time + (0, 0, -1))}
+                             for info in infos if info.filename.lower().endswith('.pdf')}
+        else:
+            self._zip = None
+            self._tar = tarfile.open(path, 'r:*')
+            self._members = {info.name: {'size': info.size, 'mtime': float(info.mtime)}
+                             for info in self._tar.getmembers() if info.isfile() and info.name.lower().endswith('.pdf')}
+
+    def __enter__(self) -> 'ResumeArchive':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying archive file"""
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+
+    def pdf_members(self) -> List[str]:
+        """Names of the PDF members, in archive order"""
+        return list(self._members)
+
+    def member_info(self, name: str) -> Dict[str, float]:
+        """Size in bytes and modification time of a member"""
+        return self._members[name]
+
+    def read(self, name: str) -> bytes:
+        """Read one member's bytes
+
+        Args:
+            name: Member name
+
+        Returns:
+            Member contents
+        """
+        with self._lock:
+            if self._zip is not None:
+                return self._zip.read(name)
+            return self._tar.extractfile(name).read()
+
+    def iter_pdfs(self, names: Optional[Iterable[str]] = None, max_bytes: Optional[int] = None) -> Iterator[Tuple[str, Optional[bytes]]]:
+        """Stream PDF members in a single pass over the archive
+
+        Args:
+            names: Members to read (defaults to every PDF member)
+            max_bytes: Members larger than this are yielded as None
+                without being read
+
+        Yields:
+            (member name, bytes or None) in archive order
+        """
+        wanted = set(self._members if names is None else names)
+
+        if self._zip is not None:
+            members = [name for name in self._members if name in wanted]
+            for name in members:
+                if max_bytes is not None and self._members[name]['size'] > max_bytes:
+                    yield name, None
+                else:
+                    yield name, self.read(name)
+            return
+
+        with self._lock:
+            # Members are visited in archive order, so every seek is forward
+            # and a compressed stream is decompressed once overall
+            for info in self._tar.getmembers():
+                if info.name not in wanted or not info.isfile():
+                    continue
+                if max_bytes is not None and info.size > max_bytes:
+                    yield info.name, None
+                else:
+                    yield info.name, self._tar.extractfile(info).read()
+
+_open_archives: Dict[str, Tuple[float, ResumeArchive]] = {}
+_open_archives_lock = threading.Lock()
+
+def _forget_open_archives() -> None:
+    """Drop handles inherited through fork
+
+    A forked worker shares each inherited file's OS offset with its parent
+    and siblings, so concurrent reads through those handles interleave and
+    corrupt each other (e.g. "Bad CRC-32"). The lock is replaced too, in
+    case another parent thread held it at fork time.
+    """
+    global _open_archives, _open_archives_lock
+    _open_archives = {}
+    _open_archives_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_open_archives)
+
+def open_archive(path: str) -> ResumeArchive:
+    """Get a per-process cached handle for an archive
+
+    Reopening a large zip re-reads its central directory, so handles are
+    kept open and only replaced when the file's mtime changes. Forked
+    worker processes start with an empty cache and open their own handles.
+
+    Args:
+        path: Archive path
+
+    Returns:
+        Open archive
+    """
+    path = os.path.abspath(path)
+    mtime = os.path.getmtime(path)
+    with _open_archives_lock:
+        cached = _open_archives.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        if cached is not None:
+            cached[1].close()
+        archive = ResumeArchive(path)
+        _open_archives[path] = (mtime, archive)
+        return archive
@@ -0,0 +1,119 @@
+import threading
+import time
+from typing import Callable, Optional
+
+import ollama
+
+class CircuitBreaker:
+    """Circuit breaker for calls to an unreliable service
+
+    After failure_threshold consecutive failures the circuit opens and
+    callers fail fast for cooldown seconds. The circuit then goes half-open
+    and lets a single probe request through: success closes it again,
+    failure re-opens it for another cool-down.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 3, cooldown: float = 30.0, is_failure: Optional[Callable[[Exception], bool]] = None):
+        """Initialize circuit breaker
+
+        Args:
+            name: Service name used in log messages
+            failure_threshold: Consecutive failures before the circuit opens
+            cooldown: Seconds to fail fast before probing again
+            is_failure: Decides whether an exception means the service is
+                unavailable (default: every exception does)
+        """
+        self.name = name
+        self.is_failure = is_failure or (lambda error: True)
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the cool-down ends"""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            return self._state
+
+    @property
+    def degraded(self) -> bool:
+        """Whether callers should assume the service is unavailable"""
+        return self.state != self.CLOSED
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now
+
+        Returns:
+            True if the request should go ahead, False to fail fast
+        """
+        state = self.state
+        with self._lock:
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful request"""
+        with self._lock:
+            if self._state != self.CLOSED:
+                print(f"{self.name} is reachable again, closing circuit")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request"""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (self._state == self.CLOSED and self._failures >= self.failure_threshold):
+                if self._state == self.CLOSED:
+                    print(f"{self.name} failed {self._failures} times in a row, failing fast for {self.cooldown:.0f}s")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def record_exception(self, error: Exception) -> None:
+        """Record a request that raised, counting it only if the service is at fault
+
+        Args:
+            error: Exception raised by the request
+        """
+        if self.is_failure(error):
+            self.record_failure()
+        else:
+            # The service answered, it just rejected this request
+            self.record_success()
+
+    def reset(self) -> None:
+        """Force the circuit closed"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+def is_ollama_outage(error: Exception) -> bool:
+    """Whether an error means Ollama is unavailable rather than the request bad
+
+    Client errors such as an unknown model or a model that doesn't support
+    chat come back as ResponseError with a 4xx status from a healthy server.
+    """
+    if isinstance(error, ollama.ResponseError):
+        return error.status_code >= 500
+    return True
+
+# Shared by every agent that talks to Ollama, so one outage is detected once
+ollama_breaker = CircuitBreaker("Ollama", is_failure=is_ollama_outage)
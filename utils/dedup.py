@@ -0,0 +1,141 @@
+import re
+import zlib
+import numpy as np
+from typing import Any, Dict, List, Sequence, Tuple
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+class NearDuplicateDetector:
+    """Clusters near-identical documents with MinHash and LSH banding
+
+    Each document becomes a set of word shingles, summarized by a MinHash
+    signature whose per-position agreement estimates Jaccard similarity.
+    Signatures are cut into bands and only documents sharing a whole band
+    bucket are compared, so clustering is roughly linear in the number of
+    documents rather than quadratic. Candidate pairs are confirmed against
+    the threshold on their signature agreement before being merged.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, bands: int = 32, shingle_size: int = 5, seed: int = 0):
+        """Initialize detector
+
+        Args:
+            threshold: Estimated Jaccard similarity above which two
+                documents are near-duplicates
+            num_perm: MinHash signature length
+            bands: Number of LSH bands (must divide num_perm); more bands
+                catch lower similarities at the cost of more candidates
+            shingle_size: Words per shingle
+            seed: Seed for the hash permutations
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # Multiply-shift hash family: odd 64-bit multipliers, 64-bit offsets
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+        self._b = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64, endpoint=True)
+
+    def shingles(self, text: str) -> np.ndarray:
+        """32-bit hashes of the word shingles in text"""
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        if len(tokens) < self.shingle_size:
+            grams = {' '.join(tokens)} if tokens else set()
+        else:
+            grams = {' '.join(tokens[i:i + self.shingle_size]) for i in range(len(tokens) - self.shingle_size + 1)}
+        return np.fromiter((zlib.crc32(gram.encode('utf-8')) for gram in grams), dtype=np.uint64, count=len(grams))
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of a text
+
+        Args:
+            text: Document text
+
+        Returns:
+            uint64 array of length num_perm (all max values for empty text)
+        """
+        hashes = self.shingles(text)
+        if hashes.size == 0:
+            return np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        # (a * x + b) mod 2^64, keeping the well-mixed high 32 bits, for
+        # every permutation and shingle (uint64 arithmetic wraps)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) >> np.uint64(32)
+        return permuted.min(axis=1)
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(first == second))
+
+    def cluster(self, texts: Sequence[str]) -> List[int]:
+        """Assign every text to a near-duplicate cluster
+
+        Args:
+            texts: Documents
+
+        Returns:
+            Cluster label per text: the index of the cluster's first member
+        """
+        signatures = [self.signature(text) for text in texts]
+        parent = list(range(len(texts)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for band in range(self.bands):
+            # Band key -> one member per cluster seen in that bucket; shared
+            # template text can put different clusters in the same bucket
+            buckets: Dict[bytes, List[int]] = {}
+            start = band * self.rows
+            for i, signature in enumerate(signatures):
+                if not texts[i].strip():
+                    # Empty documents (failed extractions) are never duplicates
+                    continue
+                bucket = buckets.setdefault(signature[start:start + self.rows].tobytes(), [])
+                for other in bucket:
+                    root_other, root_i = find(other), find(i)
+                    if root_other == root_i:
+                        break
+                    if self.similarity(signatures[other], signature) >= self.threshold:
+                        parent[max(root_other, root_i)] = min(root_other, root_i)
+                        break
+                else:
+                    bucket.append(i)
+
+        return [find(i) for i in range(len(texts))]
+
+    def deduplicate(self, records: List[Dict[str, Any]], text_key: str = 'raw_text') -> Tuple[List[Dict[str, Any]], Dict[int, List[int]]]:
+        """Keep one representative per near-duplicate cluster
+
+        The representative is the cluster's most recent record: the highest
+        database 'id' if records have one, otherwise the last in input order.
+
+        Args:
+            records: Documents as dictionaries, e.g. parsed CVs
+            text_key: Key holding each record's text
+
+        Returns:
+            Tuple of (representatives in input order, mapping of each
+            representative's input index to the indices of its duplicates)
+        """
+        labels = self.cluster([record.get(text_key) or '' for record in records])
+
+        members: Dict[int, List[int]] = {}
+        for index, label in enumerate(labels):
+            members.setdefault(label, []).append(index)
+
+        duplicates = {}
+        for indices in members.values():
+            representative = max(indices, key=lambda i: (records[i].get('id') or 0, i))
+            duplicates[representative] = [i for i in indices if i != representative]
+
+        representatives = [records[i] for i in sorted(duplicates)]
+        return representatives, {i: dups for i, dups in duplicates.items() if dups}
@@ -0,0 +1,204 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+class EmbeddingCache:
+    """Two-tier embedding cache: in-process LRU in front of a SQLite store.
+
+    Entries are content-addressed by (model name, SHA-256 of the text), so an
+    unchanged document is never sent to Ollama twice, across runs.
+    """
+
+    def __init__(self, db_path: Optional[str] = "embedding_cache.db", memory_size: int = 1024, max_entries: int = 100000, flush_every: int = 256):
+        """Initialize embedding cache
+
+        Args:
+            db_path: SQLite file for the persistent tier (None for memory-only)
+            memory_size: Maximum number of embeddings kept in the LRU tier
+            max_entries: Maximum number of embeddings kept on disk before the
+                least recently used ones are evicted
+            flush_every: Disk hits whose access times are batched in memory
+                before being written (they are also written on put and close)
+        """
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self._memory = OrderedDict()
+        # Access times of disk hits not yet written, so lookups stay read-only
+        self._accessed: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self._stored = 0
+        if self.db_path:
+            self.setup_tables()
+
+    @staticmethod
+    def make_key(model: str, text: str) -> Tuple[str, str]:
+        """Build the content-addressed cache key for a text
+
+        Args:
+            model: Embedding model name
+            text: Formatted text that is embedded
+
+        Returns:
+            Tuple of (model, text hash)
+        """
+        return model, hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get_connection(self):
+        """Get thread-local connection"""
+        if not hasattr(self._local, 'conn') or self._local.conn is None:
+            self._local.conn = sqlite3.connect(self.db_path)
+        return self._local.conn
+
+    def setup_tables(self):
+        """Create cache table if it doesn't exist"""
+        conn = self.get_connection()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS embeddings (
+            model TEXT,
+            text_hash TEXT,
+            dim INTEGER,
+            embedding BLOB,
+            last_access REAL,
+            PRIMARY KEY (model, text_hash)
+        )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings (last_access)')
+        conn.commit()
+        self._stored = conn.execute('SELECT COUNT(*) FROM embeddings').fetchone()[0]
+
+    def _remember(self, key: Tuple[str, str], embedding: List[float]) -> None:
+        """Insert into the LRU tier, evicting the oldest entry if full"""
+        with self._lock:
+            self._memory[key] = embedding
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Look up a cached embedding
+
+        Args:
+            model: Embedding model name
+            text: Formatted text that is embedded
+
+        Returns:
+            Cached embedding or None on a miss
+        """
+        key = self.make_key(model, text)
+
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return embedding
+
+        if self.db_path:
+            conn = self.get_connection()
+            row = conn.execute(
+                'SELECT embedding FROM embeddings WHERE model = ? AND text_hash = ?', key
+            ).fetchone()
+            if row:
+                embedding = np.frombuffer(row[0], dtype=np.float32).tolist()
+                self._remember(key, embedding)
+                with self._lock:
+                    self.hits += 1
+                    self._accessed[key] = time.time()
+                    flush = len(self._accessed) >= self.flush_every
+                if flush:
+                    self.flush()
+                return embedding
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _take_accessed(self) -> List[Tuple[float, str, str]]:
+        """Pending access times as UPDATE parameters, clearing them"""
+        with self._lock:
+            accessed, self._accessed = self._accessed, {}
+        return [(last_access, *key) for key, last_access in accessed.items()]
+
+    def flush(self) -> None:
+        """Write the batched access times of disk hits in one transaction"""
+        accessed = self._take_accessed()
+        if accessed and self.db_path:
+            conn = self.get_connection()
+            conn.executemany('UPDATE embeddings SET last_access = ? WHERE model = ? AND text_hash = ?', accessed)
+            conn.commit()
+
+    def put(self, model: str, text: str, embedding: List[float]) -> None:
+        """Store an embedding in both tiers
+
+        Args:
+            model: Embedding model name
+            text: Formatted text that was embedded
+            embedding: Embedding values
+        """
+        key = self.make_key(model, text)
+        self._remember(key, list(embedding))
+
+        if self.db_path:
+            blob = np.asarray(embedding, dtype=np.float32).tobytes()
+            conn = self.get_connection()
+            # Pending access times ride along in the same transaction
+            conn.executemany('UPDATE embeddings SET last_access = ? WHERE model = ? AND text_hash = ?', self._take_accessed())
+            conn.execute(
+                'INSERT OR REPLACE INTO embeddings (model, text_hash, dim, embedding, last_access) VALUES (?, ?, ?, ?, ?)',
+                (key[0], key[1], len(embedding), blob, time.time())
+            )
+            conn.commit()
+            with self._lock:
+                self._stored += 1
+                evict = self._stored > self.max_entries
+            if evict:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used rows once the store exceeds max_entries
+
+        Evicts down to 90% of the limit so that the next few inserts don't
+        each trigger another eviction pass.
+        """
+        conn = self.get_connection()
+        # _stored over-counts replaced rows, so recount before deleting
+        count = conn.execute('SELECT COUNT(*) FROM embeddings').fetchone()[0]
+        if count > self.max_entries:
+            target = int(self.max_entries * 0.9)
+            conn.execute(
+                'DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM embeddings ORDER BY last_access ASC LIMIT ?)',
+                (count - target,)
+            )
+            conn.commit()
+            count = target
+        with self._lock:
+            self._stored = count
+
+    def clear(self) -> None:
+        """Remove all cached embeddings"""
+        with self._lock:
+            self._memory.clear()
+            self._accessed.clear()
+        if self.db_path:
+            conn = self.get_connection()
+            conn.execute('DELETE FROM embeddings')
+            conn.commit()
+            self._stored = 0
+
+    def close(self):
+        """Write pending access times and close the database connection"""
+        if self.db_path:
+            self.flush()
+        if hasattr(self._local, 'conn') and self._local.conn:
+            self._local.conn.close()
+            self._local.conn = None
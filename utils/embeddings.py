@@ -1,18 +1,128 @@
+import asyncio
 import numpy as np
-import ollama
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Optional, Tuple
 from sklearn.metrics.pairwise import cosine_similarity
+from utils.embedding_cache import EmbeddingCache
+from utils.quantization import QuantizedEmbeddings
+from utils.circuit_breaker import CircuitBreaker, ollama_breaker
+from utils.ollama_clients import OllamaClientManager, get_client_manager
+
+# Zero-vector fallback size until a real embedding has been seen (nomic-embed-text)
+DEFAULT_DIMENSION = 768
 
 class EmbeddingUtil:
     """Utility for creating embeddings using Ollama"""
     
-    def __init__(self, model: str = "nomic-embed-text"):
+    def __init__(self, model: Optional[str] = None, cache: Optional[EmbeddingCache] = None, use_cache: bool = True, batch_size: int = 32, max_concurrency: int = 4, timeout: float = 60.0, breaker: Optional[CircuitBreaker] = None, clients: Optional[OllamaClientManager] = None):
         """Initialize embedding utility
         
         Args:
-            model: Ollama model to use for embeddings
+            model: Ollama model to use for embeddings (defaults to the
+                embedding model routed by the client manager's model registry)
+            cache: Embedding cache to use (defaults to the on-disk cache)
+            use_cache: Set to False to always call Ollama
+            batch_size: Maximum number of texts sent per batch request
+            max_concurrency: Maximum in-flight requests for the async methods
+            timeout: Seconds the async methods wait for each Ollama host
+                before counting it as down and failing over
+            breaker: Circuit breaker guarding Ollama calls (defaults to the
+                one shared by all agents)
+            clients: Ollama client manager routing requests across hosts
+                (defaults to the one shared by all agents)
+        """
+        self.breaker = breaker or ollama_breaker
+        self.clients = clients or get_client_manager()
+        self._model = model
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        if use_cache:
+            self.cache = cache if cache is not None else EmbeddingCache()
+        else:
+            self.cache = None
+        self._async_loop = None
+        self._semaphore = None
+        # Learned from the first real embedding, so fallbacks match the model
+        self.dimension: Optional[int] = None
+    
+    @property
+    def model(self) -> str:
+        """Embedding model, routed by the model registry on first use
+        
+        Resolved lazily so that building an EmbeddingUtil never waits on
+        Ollama; the registry caches its discovery.
+        """
+        return self._model or self.clients.models.embedding_model
+    
+    def is_degraded(self) -> bool:
+        """Whether Ollama is currently considered unavailable
+        
+        While degraded, embedding calls return zero vectors immediately, so
+        callers should switch to a non-embedding scoring strategy.
+        """
+        return self.breaker.degraded
+    
+    def _get_cached(self, text: str) -> Optional[List[float]]:
+        """Look up text in the cache, if enabled"""
+        if self.cache is None:
+            return None
+        embedding = self.cache.get(self.model, text)
+        if embedding is not None and self.dimension is None:
+            self.dimension = len(embedding)
+        return embedding
+    
+    def _store(self, text: str, embedding: List[float]) -> List[float]:
+        """Store a fresh embedding in the cache, if enabled"""
+        embedding = list(embedding)
+        self.dimension = len(embedding)
+        if self.cache is not None:
+            self.cache.put(self.model, text, embedding)
+        return embedding
+    
+    def _split_pending(self, texts: List[str]) -> Tuple[Dict[str, Optional[List[float]]], List[str]]:
+        """Resolve cache hits and drop duplicates before sending anything
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Tuple of (embeddings by text, None for pending texts) and the
+            unique texts that still need to be embedded
         """
-        self.model = model
+        embeddings_by_text = {}
+        pending = []
+        
+        for text in texts:
+            if text in embeddings_by_text:
+                continue
+            cached = self._get_cached(text)
+            embeddings_by_text[text] = cached
+            if cached is None:
+                pending.append(text)
+        
+        return embeddings_by_text, pending
+    
+    def _fallback(self) -> List[float]:
+        """Zero vector returned in place of a failed embedding"""
+        return [0.0] * (self.dimension or DEFAULT_DIMENSION)
+    
+    def _collect(self, texts: List[str], embeddings_by_text: Dict[str, Optional[List[float]]]) -> List[List[float]]:
+        """Embeddings in text order, with fallbacks sized after every batch has finished"""
+        fallback = self._fallback()
+        return [embeddings_by_text[text] if embeddings_by_text[text] is not None else list(fallback) for text in texts]
+    
+    def _batches(self, pending: List[str]) -> List[List[str]]:
+        """Split pending texts into request-sized batches"""
+        return [pending[start:start + self.batch_size] for start in range(0, len(pending), self.batch_size)]
+    
+    def _store_batch(self, batch: List[str], response: Any, embeddings_by_text: Dict[str, Optional[List[float]]]) -> None:
+        """Validate a batch embed response and store its embeddings"""
+        if response and 'embeddings' in response and len(response['embeddings']) == len(batch):
+            for text, embedding in zip(batch, response['embeddings']):
+                embeddings_by_text[text] = self._store(text, embedding)
+            self.breaker.record_success()
+        else:
+            raise ValueError("No embeddings in Ollama response")
     
     def get_embedding(self, text: str) -> List[float]:
         """Get embedding for text using Ollama
@@ -23,20 +133,132 @@ class EmbeddingUtil:
         Returns:
             List of embedding values
         """
+        # Unchanged texts are served from the cache without calling Ollama
+        cached = self._get_cached(text)
+        if cached is not None:
+            return cached
+        
+        # Fail fast while Ollama is known to be down
+        if not self.breaker.allow_request():
+            return self._fallback()
+        
         try:
             # Call Ollama API to get embedding
-            response = ollama.embeddings(model=self.model, prompt=text)
+            response = self.clients.embeddings(model=self.model, prompt=text)
             
             # Extract embedding from response
             if response and 'embedding' in response:
-                return response['embedding']
+                self.breaker.record_success()
+                return self._store(text, response['embedding'])
             else:
                 raise ValueError("No embedding in Ollama response")
                 
         except Exception as e:
+            self.breaker.record_exception(e)
             print(f"Error getting embedding: {str(e)}")
             # Return a zero vector as fallback
-            return [0.0] * 768  # Nomic model typically uses 768-dimensional embeddings
+            return self._fallback()
+    
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for many texts using Ollama's batch embed endpoint
+        
+        Duplicate texts and texts already in the cache are not sent to Ollama.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            List of embeddings in the same order as texts
+        """
+        embeddings_by_text, pending = self._split_pending(texts)
+        
+        for batch in self._batches(pending):
+            # Fail fast while Ollama is known to be down
+            if not self.breaker.allow_request():
+                continue
+            
+            try:
+                response = self.clients.embed(model=self.model, input=batch)
+                self._store_batch(batch, response, embeddings_by_text)
+            except Exception as e:
+                self.breaker.record_exception(e)
+                print(f"Error getting batch embeddings: {str(e)}")
+        
+        # Texts of failed batches get zero vectors as fallback
+        return self._collect(texts, embeddings_by_text)
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency limit for the running loop
+        
+        Semaphores are bound to an event loop, so it is recreated when called
+        from a different loop (e.g. successive asyncio.run calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def get_embedding_async(self, text: str) -> List[float]:
+        """Get embedding for text without blocking the event loop
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            List of embedding values
+        """
+        cached = self._get_cached(text)
+        if cached is not None:
+            return cached
+        
+        semaphore = self._get_semaphore()
+        try:
+            async with semaphore:
+                if not self.breaker.allow_request():
+                    return self._fallback()
+                response = await self.clients.embeddings_async(model=self.model, prompt=text, timeout=self.timeout)
+            
+            if response and 'embedding' in response:
+                self.breaker.record_success()
+                return self._store(text, response['embedding'])
+            else:
+                raise ValueError("No embedding in Ollama response")
+                
+        except Exception as e:
+            self.breaker.record_exception(e)
+            print(f"Error getting embedding: {str(e) or type(e).__name__}")
+            # Return a zero vector as fallback
+            return self._fallback()
+    
+    async def get_embeddings_async(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for many texts with up to max_concurrency batches in flight
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            List of embeddings in the same order as texts
+        """
+        embeddings_by_text, pending = self._split_pending(texts)
+        semaphore = self._get_semaphore()
+        
+        async def embed_batch(batch: List[str]) -> None:
+            try:
+                async with semaphore:
+                    # Checked after acquiring so queued batches see a freshly opened circuit
+                    if not self.breaker.allow_request():
+                        return
+                    response = await self.clients.embed_async(model=self.model, input=batch, timeout=self.timeout)
+                self._store_batch(batch, response, embeddings_by_text)
+            except Exception as e:
+                self.breaker.record_exception(e)
+                print(f"Error getting batch embeddings: {str(e) or type(e).__name__}")
+        
+        await asyncio.gather(*(embed_batch(batch) for batch in self._batches(pending)))
+        
+        # Texts of failed batches get zero vectors as fallback
+        return self._collect(texts, embeddings_by_text)
     
     def _format_jd_text(self, jd_data: Dict[str, Any]) -> str:
         """Format JD data as text for embedding
@@ -132,6 +354,61 @@ class EmbeddingUtil:
         text = self._format_cv_text(cv_data)
         return self.get_embedding(text)
     
+    async def get_jd_embedding_async(self, jd_data: Dict[str, Any]) -> List[float]:
+        """Async variant of get_jd_embedding"""
+        return await self.get_embedding_async(self._format_jd_text(jd_data))
+    
+    async def get_cv_embedding_async(self, cv_data: Dict[str, Any]) -> List[float]:
+        """Async variant of get_cv_embedding"""
+        return await self.get_embedding_async(self._format_cv_text(cv_data))
+    
+    def get_jd_embeddings(self, jd_data_list: List[Dict[str, Any]]) -> List[List[float]]:
+        """Get embeddings for many job descriptions in batches
+        
+        Args:
+            jd_data_list: List of JD data dictionaries
+            
+        Returns:
+            List of JD embeddings in input order
+        """
+        texts = [self._format_jd_text(jd_data) for jd_data in jd_data_list]
+        return self.get_embeddings(texts)
+    
+    def get_cv_embeddings(self, cv_data_list: List[Dict[str, Any]]) -> List[List[float]]:
+        """Get embeddings for many CVs in batches
+        
+        Args:
+            cv_data_list: List of CV data dictionaries
+            
+        Returns:
+            List of CV embeddings in input order
+        """
+        texts = [self._format_cv_text(cv_data) for cv_data in cv_data_list]
+        return self.get_embeddings(texts)
+    
+    async def get_jd_embeddings_async(self, jd_data_list: List[Dict[str, Any]]) -> List[List[float]]:
+        """Async variant of get_jd_embeddings"""
+        return await self.get_embeddings_async([self._format_jd_text(jd_data) for jd_data in jd_data_list])
+    
+    async def get_cv_embeddings_async(self, cv_data_list: List[Dict[str, Any]]) -> List[List[float]]:
+        """Async variant of get_cv_embeddings"""
+        return await self.get_embeddings_async([self._format_cv_text(cv_data) for cv_data in cv_data_list])
+    
+    def quantize(self, embeddings: Union[List[List[float]], np.ndarray], method: str = 'int8', originals_path: Optional[str] = None) -> QuantizedEmbeddings:
+        """Compress embeddings for a memory-efficient candidate pool
+        
+        Args:
+            embeddings: Embeddings to compress (e.g. the CV index's vectors)
+            method: 'int8' scalar quantization or 'binary' sign codes
+            originals_path: Optional .npy file that keeps the float32
+                originals used for exact re-ranking on disk instead of in
+                memory
+            
+        Returns:
+            Quantized embeddings supporting search() with re-ranking
+        """
+        return QuantizedEmbeddings(embeddings, method=method, originals_path=originals_path)
+    
     def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """Calculate cosine similarity between two embeddings
         
@@ -0,0 +1,165 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# inotify(7) event masks
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+class FolderWatcher:
+    """Reports files in a directory once they are new or changed and settled
+
+    On Linux the directory is watched with inotify (through libc, no extra
+    dependency); elsewhere, or if inotify is unavailable, it is polled. A
+    file is reported only after no change has been seen for debounce
+    seconds, so PDFs still being copied or uploaded are not read half
+    written.
+    """
+
+    def __init__(self, path: str, extensions: Sequence[str] = ('.pdf',), debounce: float = 2.0, poll_interval: float = 2.0, use_inotify: bool = True):
+        """Initialize watcher
+
+        Args:
+            path: Directory to watch
+            extensions: Lower-case filename suffixes to report
+            debounce: Seconds a file must stay unchanged before it is reported
+            poll_interval: Seconds between directory scans when polling
+            use_inotify: Use inotify when available
+        """
+        self.path = path
+        self.extensions = tuple(extensions)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._fd = self._init_inotify() if use_inotify else None
+        self._snapshot = self._scan()
+        self._pending: Dict[str, float] = {}
+
+    @property
+    def mode(self) -> str:
+        """'inotify' or 'polling'"""
+        return 'inotify' if self._fd is not None else 'polling'
+
+    def _init_inotify(self) -> Optional[int]:
+        """Set up an inotify watch on the directory, or None if unavailable"""
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_MODIFY
+            if libc.inotify_add_watch(fd, os.fsencode(self.path), mask) < 0:
+                error = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(error, f"inotify_add_watch failed for {self.path}")
+            return fd
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({str(e)}), polling {self.path} instead")
+            return None
+
+    def close(self) -> None:
+        """Release the inotify descriptor"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> 'FolderWatcher':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _wanted(self, name: str) -> bool:
+        return name.lower().endswith(self.extensions) and not name.startswith('.')
+
+    def _scan(self) -> Dict[str, Tuple[int, float]]:
+        """Size and mtime of every wanted file in the directory"""
+        snapshot = {}
+        try:
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    if self._wanted(entry.name) and entry.is_file():
+                        stat = entry.stat()
+                        snapshot[entry.name] = (stat.st_size, stat.st_mtime)
+        except OSError as e:
+            print(f"Error scanning {self.path}: {str(e)}")
+        return snapshot
+
+    def _read_events(self, timeout: float) -> List[str]:
+        """Wait up to timeout for inotify events and return the changed names"""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        changed = []
+        buffer = os.read(self._fd, 64 * 1024)
+        offset = 0
+        while offset < len(buffer):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; rescan everything that looks new
+                changed.extend(self._scan_changes())
+            elif name and self._wanted(name):
+                changed.append(name)
+        return changed
+
+    def _scan_changes(self) -> List[str]:
+        """Names added or modified since the last scan"""
+        snapshot = self._scan()
+        changed = [name for name, state in snapshot.items() if self._snapshot.get(name) != state]
+        self._snapshot = snapshot
+        return changed
+
+    def _settled(self) -> List[str]:
+        """Pending names that have not changed for debounce seconds"""
+        now = time.monotonic()
+        settled = sorted(name for name, changed_at in self._pending.items() if now - changed_at >= self.debounce)
+        for name in settled:
+            del self._pending[name]
+        return [name for name in settled if os.path.isfile(os.path.join(self.path, name))]
+
+    def watch(self, stop_event: Optional[threading.Event] = None) -> Iterator[List[str]]:
+        """Yield batches of settled new or changed filenames until stopped
+
+        Files already present when the watcher was created are not reported.
+
+        Args:
+            stop_event: Optional event that ends the loop when set
+
+        Yields:
+            Sorted filenames relative to the watched directory
+        """
+        while stop_event is None or not stop_event.is_set():
+            # Wake up often enough to release debounced files on time
+            timeout = min(self.poll_interval, self.debounce / 2) if self._pending else self.poll_interval
+
+            if self._fd is not None:
+                changed = self._read_events(timeout)
+            else:
+                time.sleep(timeout)
+                changed = self._scan_changes()
+
+            now = time.monotonic()
+            for name in changed:
+                self._pending[name] = now
+
+            settled = self._settled()
+            if settled:
+                yield settled
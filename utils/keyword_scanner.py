@@ -0,0 +1,165 @@
+import json
+import re
+import threading
+from typing import Dict, List, Tuple, Union, Iterable
+
+# Canonical technology name -> aliases (the canonical name always matches too)
+DEFAULT_TECH_KEYWORDS = {
+    # Programming languages
+    'Python': [], 'Java': [], 'JavaScript': ['JS'], 'C++': ['CPP'], 'C#': ['C Sharp'], 'Ruby': [],
+    'PHP': [], 'Go': ['Golang'], 'Swift': [], 'Kotlin': [], 'TypeScript': [], 'Scala': [],
+    'Rust': [], 'Perl': [], 'R': [], 'MATLAB': [],
+
+    # Web technologies
+    'HTML': ['HTML5'], 'CSS': ['CSS3'], 'React': ['React.js', 'ReactJS'], 'Angular': ['AngularJS'],
+    'Vue': ['Vue.js', 'VueJS'], 'Node.js': ['NodeJS'], 'Express': ['Express.js'],
+    'Django': [], 'Flask': [], 'Spring': ['Spring Boot'], 'Laravel': [], 'Ruby on Rails': ['Rails'],
+    'jQuery': [], 'Bootstrap': [], 'Tailwind': ['Tailwind CSS'],
+
+    # Databases
+    'SQL': [], 'MySQL': [], 'PostgreSQL': ['Postgres'], 'MongoDB': ['Mongo'], 'Oracle': [],
+    'SQLite': [], 'Redis': [], 'Cassandra': [], 'DynamoDB': [], 'Elasticsearch': [], 'Firebase': [],
+
+    # Cloud platforms
+    'AWS': ['Amazon Web Services'], 'Azure': ['Microsoft Azure'], 'GCP': ['Google Cloud Platform'],
+    'Google Cloud': [], 'Heroku': [], 'Netlify': [], 'Vercel': [],
+
+    # DevOps
+    'Docker': [], 'Kubernetes': ['K8s'], 'Jenkins': [], 'Git': [], 'GitHub': [], 'GitLab': [],
+    'Terraform': [], 'Ansible': [], 'CI/CD': [], 'Continuous Integration': [],
+    'Continuous Deployment': [],
+
+    # AI/ML
+    'TensorFlow': [], 'PyTorch': [], 'Keras': [], 'scikit-learn': ['sklearn'], 'Pandas': [],
+    'NumPy': [], 'SciPy': [], 'Machine Learning': ['ML'], 'Deep Learning': [],
+    'NLP': ['Natural Language Processing'], 'Computer Vision': []
+}
+
+class KeywordScanner:
+    """Single-pass multi-keyword matcher
+
+    All keywords are compiled into one regex shaped like a trie (shared
+    prefixes are factored out), so each text position is tried against at
+    most the longest keyword rather than every alternative. Matches require
+    non-word characters on both sides, which, unlike \\b, also works for
+    keywords such as C++ and C#. Whitespace inside a keyword matches any run
+    of whitespace, including line breaks from PDF extraction.
+
+    Short all-caps keywords (up to SHORT_TERM_LENGTH characters, e.g. ML,
+    JS, R) always match case-sensitively, so "5 ml" or "js" in a URL are
+    not reported as skills.
+    """
+
+    SHORT_TERM_LENGTH = 3
+
+    def __init__(self, keywords: Union[Dict[str, Iterable[str]], Iterable[str]], case_sensitive: bool = False):
+        """Compile a keyword dictionary
+
+        Args:
+            keywords: Mapping of canonical name to aliases, or a plain list
+                of names
+            case_sensitive: Match case exactly
+        """
+        if not isinstance(keywords, dict):
+            keywords = {keyword: [] for keyword in keywords}
+
+        self.case_sensitive = case_sensitive
+        self._canonical: Dict[str, str] = {}
+        # Short all-caps terms, matched exactly even when case-insensitive
+        exact_terms = set()
+        for canonical, aliases in keywords.items():
+            for term in [canonical, *aliases]:
+                self._canonical.setdefault(self._normalize(term), canonical)
+                if not case_sensitive and len(term) <= self.SHORT_TERM_LENGTH and term.isupper():
+                    exact_terms.add(' '.join(term.split()))
+
+        lowered = {term.lower() for term in exact_terms}
+        pattern = self._trie_pattern(self._trie(term for term in self._canonical if term not in lowered))
+        if exact_terms:
+            exact = self._trie_pattern(self._trie(exact_terms))
+            pattern = f'(?-i:{exact})|{pattern}' if pattern else f'(?-i:{exact})'
+
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self._pattern = re.compile(rf'(?<!\w)(?:{pattern})(?!\w)', flags)
+
+    @classmethod
+    def from_file(cls, path: str, case_sensitive: bool = False) -> 'KeywordScanner':
+        """Load a JSON keyword dictionary ({canonical: [aliases]} or [names])
+
+        Args:
+            path: JSON file path
+            case_sensitive: Match case exactly
+
+        Returns:
+            Compiled scanner
+        """
+        with open(path, 'r', encoding='utf-8') as file:
+            return cls(json.load(file), case_sensitive=case_sensitive)
+
+    def _normalize(self, term: str) -> str:
+        """Lookup key for a keyword or matched text"""
+        term = ' '.join(term.split())
+        return term if self.case_sensitive else term.lower()
+
+    @staticmethod
+    def _trie(terms: Iterable[str]) -> Dict:
+        """Build a character trie; '' marks the end of a term"""
+        trie: Dict = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        return trie
+
+    @classmethod
+    def _trie_pattern(cls, node: Dict) -> str:
+        """Convert a character trie into an equivalent regex"""
+        optional = '' in node
+        branches = []
+        for char in sorted(c for c in node if c):
+            head = r'\s+' if char == ' ' else re.escape(char)
+            branches.append(head + cls._trie_pattern(node[char]))
+
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if optional:
+            # Greedy optional prefers the longest keyword, backtracking to the
+            # shorter one if the longer fails the trailing boundary
+            return f'(?:{pattern})?'
+        return pattern
+
+    def scan(self, text: str) -> List[Tuple[str, int, int]]:
+        """Find every keyword occurrence
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List of (canonical name, start, end) tuples in text order
+        """
+        return [(self._canonical[self._normalize(match.group(0))], match.start(), match.end())
+                for match in self._pattern.finditer(text)]
+
+    def find_all(self, text: str) -> List[str]:
+        """Distinct canonical names found in text, in order of first occurrence
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List of canonical names
+        """
+        return list(dict.fromkeys(name for name, _, _ in self.scan(text)))
+
+_tech_scanner = None
+_tech_scanner_lock = threading.Lock()
+
+def get_tech_scanner() -> KeywordScanner:
+    """Get the shared scanner for DEFAULT_TECH_KEYWORDS, compiled on first use"""
+    global _tech_scanner
+    with _tech_scanner_lock:
+        if _tech_scanner is None:
+            _tech_scanner = KeywordScanner(DEFAULT_TECH_KEYWORDS)
+        return _tech_scanner
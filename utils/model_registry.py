@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+CHAT = 'completion'
+EMBEDDING = 'embedding'
+
+def _configured(variable: str, default: str) -> List[str]:
+    """Comma-separated model names from an environment variable"""
+    value = os.environ.get(variable) or default
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+def _tagged(name: str) -> str:
+    """Model name with an explicit tag ("llama3" -> "llama3:latest")"""
+    return name if ':' in name else f"{name}:latest"
+
+class ModelRegistry:
+    """Discovers which local Ollama models can chat and which can embed
+
+    Models are listed once and each is probed with a show request (no
+    generation), and the result is cached for the life of the process.
+    Requests are then routed to the first configured model with the right
+    capability, falling back to any local model that has it. A failed
+    discovery (e.g. Ollama is down) is retried after retry_interval.
+    """
+
+    def __init__(self, clients, chat_models: Optional[List[str]] = None, embedding_models: Optional[List[str]] = None, retry_interval: float = 60.0):
+        """Initialize registry
+
+        Args:
+            clients: OllamaClientManager used for discovery
+            chat_models: Preferred chat models, in order (defaults to
+                OLLAMA_CHAT_MODEL, a comma-separated list, or llama3)
+            embedding_models: Preferred embedding models, in order (defaults
+                to OLLAMA_EMBED_MODEL, a comma-separated list, or
+                nomic-embed-text)
+            retry_interval: Seconds before a failed discovery is retried
+        """
+        self.clients = clients
+        self.chat_models = chat_models or _configured('OLLAMA_CHAT_MODEL', 'llama3')
+        self.embedding_models = embedding_models or _configured('OLLAMA_EMBED_MODEL', 'nomic-embed-text')
+        self.retry_interval = retry_interval
+        self._models: Optional[Dict[str, Set[str]]] = None
+        self._routes: Dict[str, Optional[str]] = {}
+        self._retry_at = 0.0
+        self._lock = threading.RLock()
+
+    def _probe(self, name: str) -> Set[str]:
+        """Capabilities of one local model"""
+        info = self.clients.request('show', model=name)
+        capabilities = info.get('capabilities')
+        if capabilities:
+            return set(capabilities)
+
+        # Servers older than Ollama 0.6 do not report capabilities; embedding
+        # models are BERT-style encoders with a pooling layer
+        model_info = info.get('modelinfo') or info.get('model_info') or {}
+        details = info.get('details') or {}
+        family = (details.get('family') or '').lower()
+        if any(key.endswith('.pooling_type') for key in model_info) or 'bert' in family or 'embed' in name:
+            return {EMBEDDING}
+        return {CHAT}
+
+    def discover(self, refresh: bool = False) -> Optional[Dict[str, Set[str]]]:
+        """List local models and probe their capabilities
+
+        Args:
+            refresh: Discard the cached result and probe again
+
+        Returns:
+            Mapping of model name to capabilities, or None if Ollama could
+            not be reached
+        """
+        with self._lock:
+            if self._models is not None and not refresh:
+                return self._models
+            if self._models is None and not refresh and time.monotonic() < self._retry_at:
+                return None
+
+            try:
+                response = self.clients.request('list')
+            except Exception as e:
+                print(f"Could not list Ollama models: {str(e) or type(e).__name__}")
+                self._models = None
+                self._retry_at = time.monotonic() + self.retry_interval
+                return None
+
+            models = {}
+            for entry in response.get('models') or []:
+                name = entry.get('model') or entry.get('name')
+                if not name:
+                    continue
+                try:
+                    models[name] = self._probe(name)
+                except Exception as e:
+                    print(f"Could not probe Ollama model {name}: {str(e) or type(e).__name__}")
+                    models[name] = set()
+
+            self._models = models
+            self._routes = {}
+            return models
+
+    def supports(self, model: str, capability: str) -> bool:
+        """Whether a local model has a capability ('completion' or 'embedding')"""
+        models = self.discover() or {}
+        return capability in models.get(_tagged(model), models.get(model, set()))
+
+    def _select(self, preferred: List[str], capability: str) -> Optional[str]:
+        """First preferred model with a capability, else any local one"""
+        # Re-entrant, so discovery and routing happen as one step
+        with self._lock:
+            models = self.discover()
+            if models is None:
+                return None
+            if capability not in self._routes:
+                self._routes[capability] = self._route(models, preferred, capability)
+            return self._routes[capability]
+
+    def _route(self, models: Dict[str, Set[str]], preferred: List[str], capability: str) -> Optional[str]:
+        """Pick a model for a capability from the discovered models"""
+        for name in preferred:
+            for candidate in (name, _tagged(name)):
+                if capability in models.get(candidate, set()):
+                    return name
+
+        fallback = next((name for name, capabilities in sorted(models.items()) if capability in capabilities), None)
+        if fallback is not None:
+            print(f"None of the configured models ({', '.join(preferred)}) support {capability}, using {fallback}")
+        return fallback
+
+    @property
+    def chat_model(self) -> Optional[str]:
+        """Model for chat requests, or None if no local model can chat"""
+        return self._select(self.chat_models, CHAT)
+
+    @property
+    def embedding_model(self) -> str:
+        """Model for embedding requests
+
+        Falls back to the first configured model when discovery fails or
+        finds no embedding model, so embedding calls still go through the
+        circuit breaker as before.
+        """
+        return self._select(self.embedding_models, EMBEDDING) or self.embedding_models[0]
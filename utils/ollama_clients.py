@@ -0,0 +1,262 @@
+import asyncio
+import os
+import threading
+import time
+from typing import List, Any, Optional
+
+import ollama
+
+from utils.circuit_breaker import is_ollama_outage
+from utils.model_registry import ModelRegistry
+
+class OllamaEndpoint:
+    """One Ollama host with its reusable clients and routing state"""
+
+    def __init__(self, host: str, timeout: Optional[float] = None, probe_timeout: float = 5.0):
+        """Initialize endpoint
+
+        Args:
+            host: Ollama host URL, e.g. http://localhost:11434
+            timeout: HTTP timeout in seconds for requests to this host
+            probe_timeout: HTTP timeout in seconds for health checks
+        """
+        self.host = host
+        self.timeout = timeout
+        # The sync client keeps a pooled HTTP connection for the process
+        self.client = ollama.Client(host=host, timeout=timeout)
+        self.probe_client = ollama.Client(host=host, timeout=probe_timeout)
+        self._async_loop = None
+        self._async_client = None
+        self.outstanding = 0
+        self.healthy = True
+        self.retry_at = 0.0
+        self.failures = 0
+
+    def async_client(self) -> ollama.AsyncClient:
+        """Async client bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_loop = loop
+            self._async_client = ollama.AsyncClient(host=self.host, timeout=self.timeout)
+        return self._async_client
+
+class OllamaClientManager:
+    """Routes Ollama requests across several hosts
+
+    Each request goes to the healthy endpoint with the fewest outstanding
+    requests. An endpoint that fails with an outage error is taken out of
+    rotation for retry_interval seconds and the request is retried on the
+    next one; client errors (4xx) are raised immediately. A request that
+    times out counts as an outage, so a hung host is failed over too.
+    Optionally every endpoint is also probed in the background, so hosts
+    are taken out of (and put back into) rotation without waiting for a
+    real request to find out.
+    """
+
+    def __init__(self, endpoints: Optional[List[str]] = None, keep_alive: Optional[str] = "30m", timeout: Optional[float] = 120.0, retry_interval: float = 15.0, health_check_interval: Optional[float] = None):
+        """Initialize client manager
+
+        Args:
+            endpoints: Ollama host URLs (defaults to OLLAMA_HOSTS, a
+                comma-separated list, or OLLAMA_HOST)
+            keep_alive: How long hosts keep models loaded after a request
+            timeout: HTTP timeout in seconds per request (None waits forever)
+            retry_interval: Seconds before a failed endpoint is tried again
+            health_check_interval: Seconds between background health checks
+                of every endpoint (None disables them)
+        """
+        if not endpoints:
+            hosts = os.environ.get('OLLAMA_HOSTS') or os.environ.get('OLLAMA_HOST') or 'http://localhost:11434'
+            endpoints = [host.strip() for host in hosts.split(',') if host.strip()]
+
+        self.endpoints = [OllamaEndpoint(host, timeout) for host in endpoints]
+        self.keep_alive = keep_alive
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._health_stop = None
+        self.models = ModelRegistry(self)
+        if health_check_interval is not None:
+            self.start_health_checks(health_check_interval)
+
+    def _acquire(self, tried: List[OllamaEndpoint]) -> Optional[OllamaEndpoint]:
+        """Pick the least-loaded usable endpoint and count the request against it"""
+        with self._lock:
+            now = time.monotonic()
+            candidates = [e for e in self.endpoints if e not in tried and (e.healthy or now >= e.retry_at)]
+            if not candidates:
+                return None
+            endpoint = min(candidates, key=lambda e: (e.outstanding, e.failures))
+            endpoint.outstanding += 1
+            return endpoint
+
+    def _release(self, endpoint: OllamaEndpoint, error: Optional[Exception] = None, cancelled: bool = False) -> None:
+        """Finish a request and update the endpoint's health
+
+        A request cancelled by its caller says nothing about the endpoint,
+        so it leaves the health untouched.
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if cancelled:
+                return
+            if error is not None and is_ollama_outage(error):
+                if endpoint.healthy:
+                    print(f"Ollama endpoint {endpoint.host} unavailable: {str(error) or type(error).__name__}")
+                endpoint.healthy = False
+                endpoint.failures += 1
+                endpoint.retry_at = time.monotonic() + self.retry_interval
+            else:
+                endpoint.healthy = True
+                endpoint.failures = 0
+
+    def _with_keep_alive(self, method: str, kwargs: dict) -> dict:
+        """Add keep_alive to requests that load a model"""
+        if self.keep_alive is not None and method in ('chat', 'embed', 'embeddings', 'generate'):
+            kwargs.setdefault('keep_alive', self.keep_alive)
+        return kwargs
+
+    def request(self, method: str, **kwargs) -> Any:
+        """Send a request, failing over between endpoints
+
+        Args:
+            method: ollama.Client method name, e.g. 'embed' or 'chat'
+            **kwargs: Arguments for the method
+
+        Returns:
+            The method's response
+        """
+        kwargs = self._with_keep_alive(method, kwargs)
+        tried = []
+        last_error = ConnectionError("No Ollama endpoints available")
+
+        while True:
+            endpoint = self._acquire(tried)
+            if endpoint is None:
+                raise last_error
+            tried.append(endpoint)
+            try:
+                response = getattr(endpoint.client, method)(**kwargs)
+            except Exception as e:
+                self._release(endpoint, e)
+                if not is_ollama_outage(e):
+                    raise
+                last_error = e
+                continue
+            self._release(endpoint)
+            return response
+
+    async def request_async(self, method: str, timeout: Optional[float] = None, **kwargs) -> Any:
+        """Async variant of request()
+
+        Args:
+            method: ollama.AsyncClient method name, e.g. 'embed' or 'chat'
+            timeout: Seconds to wait for each endpoint; one that takes longer
+                is counted as unavailable and the request fails over
+            **kwargs: Arguments for the method
+
+        Returns:
+            The method's response
+        """
+        kwargs = self._with_keep_alive(method, kwargs)
+        tried = []
+        last_error = ConnectionError("No Ollama endpoints available")
+
+        while True:
+            endpoint = self._acquire(tried)
+            if endpoint is None:
+                raise last_error
+            tried.append(endpoint)
+            try:
+                call = getattr(endpoint.async_client(), method)(**kwargs)
+                response = await (asyncio.wait_for(call, timeout) if timeout is not None else call)
+            except asyncio.TimeoutError:
+                last_error = TimeoutError(f"{endpoint.host} did not answer {method} within {timeout}s")
+                self._release(endpoint, last_error)
+                continue
+            except Exception as e:
+                self._release(endpoint, e)
+                if not is_ollama_outage(e):
+                    raise
+                last_error = e
+                continue
+            except BaseException:
+                # Cancelled by the caller, e.g. an overall deadline
+                self._release(endpoint, cancelled=True)
+                raise
+            self._release(endpoint)
+            return response
+
+    def embeddings(self, **kwargs) -> Any:
+        return self.request('embeddings', **kwargs)
+
+    def embed(self, **kwargs) -> Any:
+        return self.request('embed', **kwargs)
+
+    def chat(self, **kwargs) -> Any:
+        return self.request('chat', **kwargs)
+
+    async def embeddings_async(self, **kwargs) -> Any:
+        return await self.request_async('embeddings', **kwargs)
+
+    async def embed_async(self, **kwargs) -> Any:
+        return await self.request_async('embed', **kwargs)
+
+    async def chat_async(self, **kwargs) -> Any:
+        return await self.request_async('chat', **kwargs)
+
+    def check_health(self) -> List[str]:
+        """Probe every endpoint and update its health
+
+        Returns:
+            Hosts that responded
+        """
+        healthy = []
+        for endpoint in self.endpoints:
+            with self._lock:
+                endpoint.outstanding += 1
+            try:
+                endpoint.probe_client.list()
+            except Exception as e:
+                self._release(endpoint, e)
+                continue
+            self._release(endpoint)
+            healthy.append(endpoint.host)
+        return healthy
+
+    def start_health_checks(self, interval: float = 30.0) -> None:
+        """Run check_health every interval seconds on a daemon thread
+
+        Args:
+            interval: Seconds between checks
+        """
+        with self._lock:
+            if self._health_stop is not None:
+                return
+            self._health_stop = stop = threading.Event()
+
+        def run() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.check_health()
+                except Exception as e:
+                    print(f"Ollama health check failed: {str(e)}")
+
+        threading.Thread(target=run, name="ollama-health-check", daemon=True).start()
+
+    def stop_health_checks(self) -> None:
+        """Stop the background health checks"""
+        with self._lock:
+            if self._health_stop is not None:
+                self._health_stop.set()
+                self._health_stop = None
+
+_default_manager = None
+_default_manager_lock = threading.Lock()
+
+def get_client_manager() -> OllamaClientManager:
+    """Get the client manager shared by all agents"""
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = OllamaClientManager(health_check_interval=30.0)
+        return _default_manager
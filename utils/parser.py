@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple, Optional
 
 class TextParser:
     """Utility for parsing text content"""
@@ -106,4 +106,130 @@ class TextParser:
                     if key and value:
                         pairs[key] = value
         
-        return pairs 
\ No newline at end of file
+        return pairs 
+
+# Resume section name -> header phrases that start it
+DEFAULT_SECTION_HEADERS = {
+    'education': ['education', 'academic background', 'academic qualification', 'academic qualifications'],
+    'experience': ['experience', 'work experience', 'work history', 'professional experience', 'employment', 'employment history'],
+    'skills': ['skills', 'technical skills', 'core competencies'],
+    'certifications': ['certifications', 'certification', 'certificates', 'professional certifications'],
+    'projects': ['projects'],
+}
+
+# Headers that only end the previous section
+DEFAULT_BOUNDARY_HEADERS = [
+    'summary', 'objective', 'profile', 'achievements', 'awards', 'tech stack', 'interests',
+    'languages', 'references', 'publications', 'volunteer experience'
+]
+
+class SectionSegmenter:
+    """Single-pass segmenter that splits text into sections by header lines
+
+    A header is a line whose whole text (ignoring case, surrounding
+    whitespace and a trailing colon) is a known header phrase, or a line
+    starting with "<header>:" followed by inline content. One anchored
+    regex over the header phrases finds the candidate lines, which are then
+    confirmed with a dictionary lookup, so the cost is linear in the text
+    length with no regex backtracking and no per-line Python work for the
+    lines that cannot be headers.
+    """
+
+    def __init__(self, section_headers: Dict[str, List[str]] = None, boundary_headers: List[str] = None, max_header_length: int = 40):
+        """Initialize segmenter
+
+        Args:
+            section_headers: Mapping of section name to header phrases
+            boundary_headers: Header phrases that end a section without
+                starting one that is returned
+            max_header_length: Longest line (or text before a colon)
+                considered as a header
+        """
+        section_headers = section_headers or DEFAULT_SECTION_HEADERS
+        boundary_headers = boundary_headers if boundary_headers is not None else DEFAULT_BOUNDARY_HEADERS
+        self.max_header_length = max_header_length
+
+        self._headers = {}
+        for phrase in boundary_headers:
+            self._headers[self._normalize(phrase)] = None
+        for section, phrases in section_headers.items():
+            for phrase in phrases:
+                self._headers[self._normalize(phrase)] = section
+
+        # A line can only be a header if it starts with a phrase followed by
+        # a colon or the end of the line; whitespace never crosses a newline.
+        # The first-character lookahead rejects most lines before the
+        # alternation is tried
+        phrases = sorted(self._headers, key=len, reverse=True)
+        first_chars = ''.join(sorted({phrase[0] for phrase in phrases}))
+        alternatives = '|'.join(re.escape(phrase).replace('\\ ', r'[^\S\n]+') for phrase in phrases)
+        self._candidates = re.compile(
+            r'^[^\S\n]*(?=[%s])(?:%s)[^\S\n]*(?::|$)' % (re.escape(first_chars), alternatives),
+            re.IGNORECASE | re.MULTILINE
+        )
+
+    @staticmethod
+    def _normalize(line: str) -> str:
+        return ' '.join(line.lower().split()).rstrip(':').rstrip()
+
+    def _match_header(self, line: str) -> Tuple[bool, Optional[str], int]:
+        """Classify a line
+
+        Returns:
+            Tuple of (is header, section name or None, offset in the line
+            where the section content starts)
+        """
+        if len(line) <= self.max_header_length + 2:
+            key = self._normalize(line)
+            if key in self._headers:
+                return True, self._headers[key], len(line)
+
+        colon = line.find(':', 0, self.max_header_length + 1)
+        if colon != -1:
+            key = self._normalize(line[:colon])
+            if key in self._headers:
+                return True, self._headers[key], colon + 1
+
+        return False, None, 0
+
+    def segment(self, text: str) -> Dict[str, Tuple[int, int]]:
+        """Find the first occurrence of every section
+
+        Args:
+            text: Full text
+
+        Returns:
+            Mapping of section name to (start, end) offsets of its content,
+            excluding the header
+        """
+        sections = {}
+        current = None
+        current_start = 0
+
+        for match in self._candidates.finditer(text):
+            position = match.start()
+            line_end = text.find('\n', position)
+            if line_end == -1:
+                line_end = len(text)
+            is_header, section, content_offset = self._match_header(text[position:line_end])
+            if is_header:
+                if current is not None:
+                    sections.setdefault(current, (current_start, position))
+                current = section
+                current_start = position + content_offset
+
+        if current is not None:
+            sections.setdefault(current, (current_start, len(text)))
+
+        return sections
+
+    def extract(self, text: str) -> Dict[str, str]:
+        """Get the stripped text of every section found
+
+        Args:
+            text: Full text
+
+        Returns:
+            Mapping of section name to section content
+        """
+        return {section: text[start:end].strip() for section, (start, end) in self.segment(text).items()}
@@ -0,0 +1,138 @@
+import mmap
+import os
+import time
+from typing import Dict, Iterator, Optional, Any
+
+import fitz  # PyMuPDF
+
+class PDFTextExtractor:
+    """Page-wise PDF text extraction with resource budgets
+
+    Pages are pulled from the document one at a time and joined once at the
+    end, so building the text is linear in its length. Extraction stops
+    early when a budget runs out:
+      - max_pages: pages read per document
+      - max_bytes: file size; larger files are not opened at all
+      - timeout: wall-clock seconds per document, checked between pages
+        (MuPDF cannot be interrupted inside a page)
+
+    With use_mmap the file is memory-mapped and handed to MuPDF without a
+    copy, so the process only holds the pages the OS actually touches.
+    """
+
+    def __init__(self, max_pages: Optional[int] = None, max_bytes: Optional[int] = None, timeout: Optional[float] = None, use_mmap: bool = False):
+        """Initialize extractor
+
+        Args:
+            max_pages: Maximum pages to read per document (None for no limit)
+            max_bytes: Maximum file size in bytes (None for no limit)
+            timeout: Maximum seconds spent per document (None for no limit)
+            use_mmap: Open files through a read-only memory map
+        """
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.use_mmap = use_mmap
+
+    @staticmethod
+    def empty_result(pages_read: int = 0, page_count: int = 0, truncated: bool = False, reason: Optional[str] = None) -> Dict[str, Any]:
+        """Extraction result with no text"""
+        return {
+            'text': '',
+            'pages_read': pages_read,
+            'page_count': page_count,
+            'truncated': truncated,
+            'truncation_reason': reason
+        }
+
+    def iter_pages(self, doc: fitz.Document, status: Optional[Dict[str, Any]] = None, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Lazily yield page texts within the page and time budgets
+
+        Args:
+            doc: Open document
+            status: Optional dictionary updated with pages_read, page_count,
+                truncated and truncation_reason as pages are consumed
+            max_pages: Page budget for this call (defaults to self.max_pages)
+
+        Yields:
+            Text of each page, in order
+        """
+        if status is None:
+            status = self.empty_result()
+        if max_pages is None:
+            max_pages = self.max_pages
+        status['page_count'] = doc.page_count
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+
+        for page_number in range(doc.page_count):
+            if max_pages is not None and page_number >= max_pages:
+                status['truncated'], status['truncation_reason'] = True, 'max_pages'
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                status['truncated'], status['truncation_reason'] = True, 'timeout'
+                return
+
+            page = doc.load_page(page_number)
+            status['pages_read'] = page_number + 1
+            yield page.get_text()
+
+    def extract_document(self, doc: fitz.Document, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """Extract text from an open document
+
+        Args:
+            doc: Open document
+            max_pages: Page budget for this call (defaults to self.max_pages)
+
+        Returns:
+            Dictionary with text, pages_read, page_count, truncated and
+            truncation_reason
+        """
+        result = self.empty_result()
+        result['text'] = ''.join(self.iter_pages(doc, result, max_pages))
+        return result
+
+    def extract(self, pdf_path: str, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """Extract text from a PDF file
+
+        Args:
+            pdf_path: Path to the PDF file
+            max_pages: Page budget for this call (defaults to self.max_pages)
+
+        Returns:
+            Dictionary with text, pages_read, page_count, truncated and
+            truncation_reason
+        """
+        size = os.path.getsize(pdf_path)
+        if self.max_bytes is not None and size > self.max_bytes:
+            print(f"Skipping PDF {pdf_path}: {size} bytes exceeds the {self.max_bytes} byte limit")
+            return self.empty_result(truncated=True, reason='max_bytes')
+
+        if not self.use_mmap or size == 0:
+            with fitz.open(pdf_path) as doc:
+                return self.extract_document(doc, max_pages)
+
+        with open(pdf_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                # MuPDF reads straight from the mapping; memoryview avoids a copy
+                with fitz.open(stream=view, filetype='pdf') as doc:
+                    return self.extract_document(doc, max_pages)
+            finally:
+                view.release()
+
+    def extract_stream(self, data: bytes, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """Extract text from PDF bytes held in memory (e.g. an archive member)
+
+        Args:
+            data: PDF file contents
+            max_pages: Page budget for this call (defaults to self.max_pages)
+
+        Returns:
+            Dictionary with text, pages_read, page_count, truncated and
+            truncation_reason
+        """
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return self.empty_result(truncated=True, reason='max_bytes')
+
+        with fitz.open(stream=data, filetype='pdf') as doc:
+            return self.extract_document(doc, max_pages)
@@ -0,0 +1,157 @@
+import os
+import numpy as np
+from typing import Dict, List, Sequence, Tuple, Optional
+
+from utils.scoring import ScoringEngine
+
+class QuantizedEmbeddings:
+    """Compressed embedding matrix with a coarse scan and exact re-ranking
+
+    Two code formats are supported:
+      - 'int8': per-vector symmetric scalar quantization (4x smaller than
+        float32, 8x smaller than float64)
+      - 'binary': packed sign bits compared by Hamming distance (32x smaller
+        than float32)
+
+    Searches scan the codes for the best k * rerank_factor candidates, then
+    re-rank only those with exact float32 scores. The originals are kept in
+    memory unless originals_path is given, in which case they are written to
+    a memory-mapped .npy file and stay on disk.
+    """
+
+    METHODS = ('int8', 'binary')
+
+    def __init__(self, embeddings: Sequence[Sequence[float]], method: str = 'int8', originals_path: Optional[str] = None, block_size: int = 4096):
+        """Quantize embeddings
+
+        Args:
+            embeddings: Embeddings to compress
+            method: 'int8' or 'binary'
+            originals_path: Optional .npy path where the normalized float32
+                originals are written and memory-mapped for re-ranking
+                (otherwise they are kept in memory)
+            block_size: Number of rows decoded at a time during scans
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown quantization method: {method}")
+
+        self.method = method
+        self.block_size = block_size
+
+        vectors = ScoringEngine.normalize(embeddings)
+        self.dim = vectors.shape[1]
+
+        if method == 'int8':
+            scales = np.abs(vectors).max(axis=1)
+            scales[scales == 0] = 1.0
+            self.scales = (scales / 127.0).astype(np.float32)
+            self.codes = np.round(vectors / self.scales[:, None]).astype(np.int8)
+        else:
+            self.scales = None
+            self.codes = np.packbits(vectors > 0, axis=1)
+
+        # Extra arrays persisted with the codes (e.g. the IDs of the rows)
+        self.metadata: Dict[str, np.ndarray] = {}
+
+        self.originals_path = originals_path
+        self.originals = vectors
+        if originals_path:
+            # Written aside and renamed, so existing maps of the old file stay valid
+            temporary_path = f"{originals_path}.tmp"
+            with open(temporary_path, 'wb') as file:
+                np.save(file, vectors)
+            os.replace(temporary_path, originals_path)
+            self.originals = np.load(originals_path, mmap_mode='r')
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the codes (the float32 originals are not counted)"""
+        return self.codes.nbytes + (self.scales.nbytes if self.scales is not None else 0)
+
+    def approximate_scores(self, query: Sequence[float]) -> np.ndarray:
+        """Score every vector against a query using only the codes
+
+        Args:
+            query: Query embedding
+
+        Returns:
+            Approximate match scores (0-100)
+        """
+        query = ScoringEngine.normalize(query)[0]
+        scores = np.empty(len(self.codes), dtype=np.float32)
+
+        if self.method == 'int8':
+            for start in range(0, len(self.codes), self.block_size):
+                end = start + self.block_size
+                scores[start:end] = (self.codes[start:end].astype(np.float32) @ query) * self.scales[start:end]
+        else:
+            query_bits = np.packbits(query > 0)
+            for start in range(0, len(self.codes), self.block_size):
+                end = start + self.block_size
+                distance = np.bitwise_count(self.codes[start:end] ^ query_bits).sum(axis=1)
+                # Angle between sign vectors approximates the cosine angle
+                scores[start:end] = np.cos(np.pi * distance / self.dim)
+
+        return scores * 100.0
+
+    def search(self, query: Sequence[float], k: int, rerank_factor: int = 4) -> List[Tuple[int, float]]:
+        """Find the top-k vectors for a query
+
+        Args:
+            query: Query embedding
+            k: Number of results
+            rerank_factor: Shortlist size for re-ranking, as a multiple of k
+
+        Returns:
+            List of (row index, score) tuples sorted by score (0-100)
+        """
+        approximate = self.approximate_scores(query)
+        shortlist = np.sort(ScoringEngine.sorted_indices(approximate, k * rerank_factor))
+        exact = (np.asarray(self.originals[shortlist], dtype=np.float32) @ ScoringEngine.normalize(query)[0]) * 100.0
+        top = ScoringEngine.sorted_indices(exact, k)
+        return [(int(shortlist[i]), float(exact[i])) for i in top]
+
+    def save(self, path: str) -> None:
+        """Persist the codes and metadata to a .npz file
+
+        The originals are not included; they stay at originals_path.
+
+        Args:
+            path: Destination file path
+        """
+        np.savez(
+            path,
+            codes=self.codes,
+            scales=self.scales if self.scales is not None else np.empty(0, dtype=np.float32),
+            params=np.array([self.method, self.dim, self.block_size]),
+            **{f"metadata_{key}": value for key, value in self.metadata.items()}
+        )
+
+    @classmethod
+    def load(cls, path: str, originals_path: str) -> 'QuantizedEmbeddings':
+        """Load codes saved with save() and memory-map their originals
+
+        Args:
+            path: Source file path
+            originals_path: .npy file written when the codes were built
+
+        Returns:
+            Loaded quantized embeddings
+        """
+        embeddings = cls.__new__(cls)
+        with np.load(path) as data:
+            method, dim, block_size = data['params'].tolist()
+            embeddings.method = method
+            embeddings.dim = int(dim)
+            embeddings.block_size = int(block_size)
+            embeddings.codes = data['codes']
+            embeddings.scales = data['scales'] if method == 'int8' else None
+            embeddings.metadata = {key[len('metadata_'):]: data[key] for key in data.files if key.startswith('metadata_')}
+        embeddings.originals_path = originals_path
+        embeddings.originals = np.load(originals_path, mmap_mode='r')
+        if len(embeddings.originals) != len(embeddings.codes):
+            raise ValueError(f"{originals_path} does not match the codes in {path}")
+        return embeddings
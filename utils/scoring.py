@@ -0,0 +1,86 @@
+import numpy as np
+from typing import List, Any, Sequence, Tuple, Optional
+
+class ScoringEngine:
+    """Vectorized cosine scoring of many JDs against many CVs"""
+
+    def __init__(self, block_size: int = 4096):
+        """Initialize scoring engine
+
+        Args:
+            block_size: Number of CVs scored per matrix multiplication, which
+                bounds the float32 working copy to block_size x dim
+        """
+        self.block_size = block_size
+
+    @staticmethod
+    def normalize(embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+        """Stack embeddings into an L2-normalized float32 matrix
+
+        Zero vectors (the Ollama fallback) stay zero and score 0 against
+        everything, matching sklearn's cosine_similarity.
+
+        Args:
+            embeddings: Embeddings to stack
+
+        Returns:
+            Matrix of shape (len(embeddings), dim)
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def score_matrix(self, jd_embeddings: Sequence[Sequence[float]], cv_embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+        """Score every JD against every CV
+
+        Args:
+            jd_embeddings: JD embeddings (J of them)
+            cv_embeddings: CV embeddings (C of them)
+
+        Returns:
+            J x C float32 matrix of match scores (0-100)
+        """
+        jd_matrix = self.normalize(jd_embeddings)
+        num_cvs = len(cv_embeddings)
+        scores = np.empty((jd_matrix.shape[0], num_cvs), dtype=np.float32)
+
+        for start in range(0, num_cvs, self.block_size):
+            end = min(start + self.block_size, num_cvs)
+            cv_block = self.normalize(cv_embeddings[start:end])
+            np.matmul(jd_matrix, cv_block.T, out=scores[:, start:end])
+
+        scores *= 100.0
+        return scores
+
+    @staticmethod
+    def sorted_indices(scores: np.ndarray, top_n: Optional[int] = None) -> np.ndarray:
+        """Get CV indices of one JD's score row, best first
+
+        Args:
+            scores: Score row for a single JD
+            top_n: Only return the best top_n indices
+
+        Returns:
+            Array of CV indices sorted by descending score
+        """
+        if top_n is not None and top_n < len(scores):
+            # Partial selection is O(C) before sorting only top_n entries
+            candidates = np.argpartition(-scores, top_n)[:top_n]
+            return candidates[np.argsort(-scores[candidates], kind='stable')]
+        return np.argsort(-scores, kind='stable')
+
+    def ranked(self, scores: np.ndarray, items: List[Any], top_n: Optional[int] = None) -> List[Tuple[Any, float]]:
+        """Build the sorted (item, score) view for one JD's score row
+
+        Args:
+            scores: Score row for a single JD
+            items: Items (e.g. CV dicts) in the same order as the scores
+            top_n: Only return the best top_n items
+
+        Returns:
+            List of (item, score) tuples sorted by score
+        """
+        return [(items[i], float(scores[i])) for i in self.sorted_indices(scores, top_n)]